@@ -0,0 +1,62 @@
+"""Unique quiz participants
+
+Revision ID: 9c1e4b7d2a60
+Revises: 40ab373776e0
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "9c1e4b7d2a60"
+down_revision: Union[str, Sequence[str], None] = "40ab373776e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DUPLICATES = """
+    SELECT id, min(id) OVER (PARTITION BY quiz_id, user_id) AS keep_id,
+           max(completed_at) OVER (PARTITION BY quiz_id, user_id) AS last_completed
+    FROM quiz_participants
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        UPDATE records SET participant_id = duplicates.keep_id
+        FROM ({DUPLICATES}) AS duplicates
+        WHERE records.participant_id = duplicates.id
+          AND duplicates.id <> duplicates.keep_id
+        """
+    )
+    op.execute(
+        f"""
+        UPDATE quiz_participants SET completed_at = duplicates.last_completed
+        FROM ({DUPLICATES}) AS duplicates
+        WHERE quiz_participants.id = duplicates.id
+          AND duplicates.id = duplicates.keep_id
+          AND quiz_participants.completed_at IS DISTINCT FROM duplicates.last_completed
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM quiz_participants
+        USING ({DUPLICATES}) AS duplicates
+        WHERE quiz_participants.id = duplicates.id
+          AND duplicates.id <> duplicates.keep_id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_quiz_participants_quiz_id_user_id",
+        "quiz_participants",
+        ["quiz_id", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_quiz_participants_quiz_id_user_id", "quiz_participants", type_="unique"
+    )
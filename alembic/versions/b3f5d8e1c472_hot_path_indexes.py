@@ -0,0 +1,69 @@
+"""Hot path indexes
+
+Revision ID: b3f5d8e1c472
+Revises: 9c1e4b7d2a60
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b3f5d8e1c472"
+down_revision: Union[str, Sequence[str], None] = "9c1e4b7d2a60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    (
+        "ix_memberships_user_id_company_id",
+        "memberships",
+        ["user_id", "company_id"],
+        ["role"],
+    ),
+    (
+        "ix_quiz_participants_user_id_quiz_id_completed_at",
+        "quiz_participants",
+        ["user_id", "quiz_id", "completed_at"],
+        [],
+    ),
+    ("ix_records_participant_id", "records", ["participant_id"], ["score"]),
+    ("ix_selected_answers_record_id", "selected_answers", ["record_id"], ["answer_id"]),
+    ("ix_answers_question_id", "answers", ["question_id"], []),
+    ("ix_questions_quiz_id", "questions", ["quiz_id"], []),
+    (
+        "ix_notifications_company_id_created_at",
+        "notifications",
+        ["company_id", "created_at"],
+        [],
+    ),
+    (
+        "ix_membership_requests_type_company_id_user_id",
+        "membership_requests",
+        ["type", "company_id", "user_id"],
+        [],
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
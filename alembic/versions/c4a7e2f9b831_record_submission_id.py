@@ -0,0 +1,44 @@
+"""Record submission id
+
+Revision ID: c4a7e2f9b831
+Revises: b3f5d8e1c472
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "c4a7e2f9b831"
+down_revision: Union[str, Sequence[str], None] = "b3f5d8e1c472"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "records", sa.Column("submission_id", sa.String(length=32), nullable=True)
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_records_submission_id",
+            "records",
+            ["submission_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_records_submission_id",
+            table_name="records",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("records", "submission_id")
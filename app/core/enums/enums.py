@@ -21,3 +21,10 @@ class QuizActions(Enum):
 class NotificationStatus(Enum):
     READ = "read"
     UNREAD = "unread"
+
+
+class CountMode(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
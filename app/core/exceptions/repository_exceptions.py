@@ -18,9 +18,5 @@ class RedisRepositoryError(RepositoryError):
     pass
 
 
-class RedisRepositoryScanError(RepositoryError):
-    pass
-
-
-class RedisRepositoryMultipleFetchError(RepositoryError):
+class RepeatedQueryError(RepositoryError):
     pass
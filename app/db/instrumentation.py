@@ -0,0 +1,104 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from app.core.exceptions.repository_exceptions import RepeatedQueryError
+from app.db.slow_queries import explaining, normalize_statement, slow_query_recorder
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    def __init__(self, repeat_threshold: int = 0):
+        self.repeat_threshold = repeat_threshold
+        self.statements = 0
+        self.duration = 0.0
+        self.rows = 0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float, rows: int):
+        self.statements += 1
+        self.duration += duration
+        self.rows += max(rows, 0)
+        shape = normalize_statement(statement)
+        self.shapes[shape] += 1
+        count = self.shapes[shape]
+        if self.repeat_threshold and count >= self.repeat_threshold:
+            raise RepeatedQueryError(
+                f"Statement executed {count} times in one request: {shape}"
+            )
+
+    def most_repeated(self):
+        return self.shapes.most_common(1)[0] if self.shapes else (None, 0)
+
+    def server_timing(self):
+        return (
+            f'db;dur={self.duration * 1000:.1f};desc="{self.statements} queries", '
+            f'db-rows;desc="{self.rows} rows"'
+        )
+
+    def is_slow(self):
+        return (
+            self.statements > settings.monitoring.SLOW_REQUEST_QUERIES
+            or self.duration * 1000 > settings.monitoring.SLOW_REQUEST_DB_MS
+        )
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.query_start = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context.query_start
+    if explaining.get():
+        return
+    slow_query_recorder.observe(
+        statement, parameters, duration, executemany, conn.engine
+    )
+    stats = query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration, cursor.rowcount)
+
+
+def instrument_engine(sync_engine):
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.monitoring.QUERY_STATS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        stats = QueryStats(settings.monitoring.REPEATED_QUERY_THRESHOLD)
+        token = query_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", stats.server_timing()
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            query_stats.reset(token)
+            if stats.is_slow():
+                statement, count = stats.most_repeated()
+                logger.warning(
+                    f"{scope['method']} {scope['path']}: {stats.statements} queries, "
+                    f"{stats.duration * 1000:.1f} ms, {stats.rows} rows; "
+                    f"most repeated ({count}x): {statement}"
+                )
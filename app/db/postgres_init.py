@@ -1,8 +1,95 @@
+import time
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from app.db.instrumentation import instrument_engine
+from app.db.slow_queries import slow_query_recorder
 from app.utils.settings_model import settings
 
-engine = create_async_engine(settings.db.get_url(settings.ENV), echo=True)
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_time_total += elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+
+    def stats(self):
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "checkouts": self.checkouts,
+            "wait_time_avg_ms": (
+                self.wait_time_total / self.checkouts * 1000 if self.checkouts else 0.0
+            ),
+            "wait_time_max_ms": self.wait_time_max * 1000,
+        }
+
+
+def create_engine(url: str):
+    engine = create_async_engine(
+        url,
+        echo=settings.db.ECHO,
+        poolclass=InstrumentedPool,
+        pool_size=settings.db.POOL_SIZE,
+        max_overflow=settings.db.MAX_OVERFLOW,
+        pool_timeout=settings.db.POOL_TIMEOUT,
+        pool_recycle=settings.db.POOL_RECYCLE,
+        pool_pre_ping=settings.db.POOL_PRE_PING,
+        connect_args=settings.db.get_connect_args(),
+    )
+    instrument_engine(engine.sync_engine)
+    slow_query_recorder.bind(engine)
+    return engine
+
+
+class ReplicaPool:
+    def __init__(self, urls: list[str], retry_interval: int):
+        self.engines = [create_engine(url) for url in urls]
+        self.session_makers = [
+            async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+            for engine in self.engines
+        ]
+        self.retry_interval = retry_interval
+        self._down_until = [0.0] * len(self.engines)
+        self._next = 0
+
+    def candidates(self):
+        now = time.monotonic()
+        count = len(self.session_makers)
+        start = self._next
+        self._next = (self._next + 1) % count if count else 0
+        for step in range(count):
+            index = (start + step) % count
+            if self._down_until[index] <= now:
+                yield index, self.session_makers[index]
+
+    def mark_down(self, index: int):
+        self._down_until[index] = time.monotonic() + self.retry_interval
+
+    def stats(self):
+        now = time.monotonic()
+        return [
+            {"pool": engine.pool.stats(), "available": down_until <= now}
+            for engine, down_until in zip(self.engines, self._down_until)
+        ]
+
+
+engine = create_engine(settings.db.get_url(settings.ENV))
 async_session_maker = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
+replica_pool = ReplicaPool(settings.db.REPLICA_URLS, settings.db.REPLICA_RETRY_INTERVAL)
@@ -1,5 +1,6 @@
 import redis.asyncio as redis
 
+from app.utils.circuit_breaker import CircuitBreaker
 from app.utils.settings_model import settings
 
 pool = redis.ConnectionPool(host=settings.redis.HOST, port=settings.redis.PORT)
@@ -7,3 +8,11 @@ pool = redis.ConnectionPool(host=settings.redis.HOST, port=settings.redis.PORT)
 
 def get_redis_client():
     return redis.Redis(connection_pool=pool)
+
+
+redis_breaker = CircuitBreaker(
+    name="redis",
+    failure_threshold=settings.redis.BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.redis.BREAKER_RESET_TIMEOUT,
+    timeout=settings.redis.OPERATION_TIMEOUT_MS / 1000,
+)
@@ -1,33 +1,100 @@
+import json
 import logging
+import time
 from typing import Generic, TypeVar, Type
 
+import asyncpg
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.exc import DataError, SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, insert, and_, case, inspect
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy import (
+    select,
+    update,
+    delete,
+    func,
+    insert,
+    and_,
+    bindparam,
+    Enum,
+    literal,
+    inspect,
+    tuple_,
+)
 
+from app.core.enums.enums import CountMode
 from app.core.exceptions.exceptions import AppException, BadRequestException
 from app.core.exceptions.repository_exceptions import (
     RepositoryIntegrityError,
     RepositoryDataError,
     RepositoryDatabaseError,
 )
+from app.db.explain import Explain
+from app.utils.cache import LRUCache
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.settings_model import settings
 
 ModelType = TypeVar("ModelType")
 logger = logging.getLogger(__name__)
 
+count_cache = LRUCache(settings.cache.COUNT_CACHE_SIZE)
+
 
 class BaseRepository(Generic[ModelType]):
     def __init__(self, session: AsyncSession, model: Type[ModelType]):
         self.session = session
         self.model = model
 
-    async def create(self, data: dict):
+    async def create(
+        self, data: dict, returning: list | None = None, orm: bool = False
+    ):
+        try:
+            values = {key: value for key, value in data.items() if value is not None}
+            stmt = insert(self.model).values(**values)
+            if orm:
+                result = await self.session.execute(stmt.returning(self.model))
+                return result.scalar_one()
+            if returning:
+                result = await self.session.execute(stmt.returning(*returning))
+                return result.one()
+            result = await self.session.execute(stmt.returning(self.model.id))
+            return result.scalar_one()
+        except IntegrityError as e:
+            raise RepositoryIntegrityError(f"Integrity error: {e}") from e
+        except DataError as e:
+            raise RepositoryDataError(f"Invalid data: {e}") from e
+        except SQLAlchemyError as e:
+            raise RepositoryDatabaseError(f"Database error: {e}") from e
+
+    async def upsert(
+        self,
+        data: dict,
+        conflict_columns: list[str],
+        update_values: dict | None = None,
+        returning: list | None = None,
+    ):
         try:
-            new = self.model(**data)
-            self.session.add(new)
-            await self.session.flush()
-            await self.session.refresh(new)
-            return new.id
+            values = {key: value for key, value in data.items() if value is not None}
+            stmt = pg_insert(self.model).values(**values)
+            if update_values is None:
+                update_values = {
+                    key: stmt.excluded[key]
+                    for key in values
+                    if key not in conflict_columns
+                }
+            if not update_values:
+                update_values = {key: stmt.excluded[key] for key in conflict_columns}
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns, set_=update_values
+            )
+            if returning:
+                result = await self.session.execute(stmt.returning(*returning))
+                return result.one()
+            result = await self.session.execute(stmt.returning(self.model.id))
+            return result.scalar_one()
         except IntegrityError as e:
             raise RepositoryIntegrityError(f"Integrity error: {e}") from e
         except DataError as e:
@@ -35,11 +102,108 @@ class BaseRepository(Generic[ModelType]):
         except SQLAlchemyError as e:
             raise RepositoryDatabaseError(f"Database error: {e}") from e
 
-    async def create_many(self, data: list[dict]):
+    async def upsert_many(
+        self,
+        data: list[dict],
+        conflict_columns: list[str],
+        update_values: dict,
+        returning: list,
+    ):
+        if not data:
+            return []
         try:
-            stmt = insert(self.model).values(data).returning(self.model.id)
+            stmt = (
+                pg_insert(self.model)
+                .values(data)
+                .on_conflict_do_update(
+                    index_elements=conflict_columns, set_=update_values
+                )
+                .returning(*returning)
+            )
             result = await self.session.execute(stmt)
-            return [row[0] for row in result.fetchall()]
+            return result.all()
+        except IntegrityError as e:
+            raise RepositoryIntegrityError(f"Integrity error: {e}") from e
+        except DataError as e:
+            raise RepositoryDataError(f"Invalid data: {e}") from e
+        except SQLAlchemyError as e:
+            raise RepositoryDatabaseError(f"Database error: {e}") from e
+
+    def _copy_defaults(self, columns: list[str]):
+        table = self.model.__table__
+        defaults = {}
+        for column in table.columns:
+            if column.name in columns:
+                continue
+            if column.default is None:
+                continue
+            if not column.default.is_scalar:
+                return None
+            defaults[column.name] = column.default.arg
+        if any(
+            isinstance(table.c[column].type, Enum) for column in [*columns, *defaults]
+        ):
+            return None
+        return defaults
+
+    async def _copy_records(self, data: list[dict]):
+        columns = list(data[0])
+        if any(row.keys() != data[0].keys() for row in data):
+            raise RepositoryDataError("Bulk rows must all have the same columns")
+        defaults = self._copy_defaults(columns)
+        if defaults is None:
+            return False
+        try:
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if not hasattr(driver_connection, "copy_records_to_table"):
+                return False
+            # The asyncpg adapter only opens its transaction on the first
+            # execute, so run one before COPY to keep it inside the unit of work.
+            await self.session.execute(select(literal(1)))
+        except SQLAlchemyError as e:
+            raise RepositoryDatabaseError(f"Database error: {e}") from e
+        try:
+            await driver_connection.copy_records_to_table(
+                self.model.__tablename__,
+                records=[
+                    (*(row[column] for column in columns), *defaults.values())
+                    for row in data
+                ],
+                columns=[*columns, *defaults],
+            )
+        except asyncpg.IntegrityConstraintViolationError as e:
+            raise RepositoryIntegrityError(f"Integrity error: {e}") from e
+        except asyncpg.DataError as e:
+            raise RepositoryDataError(f"Invalid data: {e}") from e
+        except asyncpg.PostgresError as e:
+            raise RepositoryDatabaseError(f"Database error: {e}") from e
+        self.session.info["wrote"] = True
+        return True
+
+    async def bulk_create(self, data: list[dict], returning: bool = True):
+        if not data:
+            return []
+        if not returning and len(data) >= settings.db.BULK_COPY_THRESHOLD:
+            if await self._copy_records(data):
+                return []
+        try:
+            ids = []
+            batch_size = settings.db.BULK_INSERT_BATCH_SIZE
+            for start in range(0, len(data), batch_size):
+                chunk = data[start : start + batch_size]
+                if returning:
+                    result = await self.session.execute(
+                        insert(self.model).returning(
+                            self.model.id, sort_by_parameter_order=True
+                        ),
+                        chunk,
+                    )
+                    ids.extend(result.scalars().all())
+                else:
+                    await self.session.execute(insert(self.model).values(chunk))
+            return ids
         except IntegrityError as e:
             raise RepositoryIntegrityError(f"Integrity error: {e}") from e
         except DataError as e:
@@ -62,6 +226,78 @@ class BaseRepository(Generic[ModelType]):
         except SQLAlchemyError as e:
             raise RepositoryDatabaseError(f"Database error: {e}") from e
 
+    async def _estimate_count(self, query):
+        result = await self.session.execute(Explain(query))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def _cached_count(self, query):
+        compiled = query.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True}
+        )
+        key = (str(compiled), repr(sorted(compiled.params.items())))
+        total_count = count_cache.get(key)
+        if total_count is None:
+            total_count = await self.session.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
+            count_cache.set(
+                key, total_count, time.time() + settings.cache.COUNT_CACHE_TTL
+            )
+        return total_count
+
+    def _build_list_query(
+        self,
+        filters: dict[str, int | bool | list] | None = None,
+        extra_filters: list = None,
+        joins: list[tuple] = None,
+        outer_joins: list[tuple] = None,
+        extra_columns: list = None,
+    ):
+        query = select(self.model).add_columns(*(extra_columns or []))
+
+        if joins:
+            for join_args in joins:
+                query = query.join(*join_args)
+
+        if outer_joins:
+            for join_args in outer_joins:
+                query = query.outerjoin(*join_args)
+
+        if filters:
+            for field, value in filters.items():
+                column = getattr(self.model, field)
+                if isinstance(value, list):
+                    query = query.where(column.in_(value))
+                else:
+                    query = query.where(column == value)
+
+        if extra_filters:
+            for f in extra_filters:
+                query = query.where(f)
+
+        return query
+
+    def _keyset(self, order_by: list | None):
+        columns = []
+        directions = set()
+        for expression in order_by or []:
+            descending = False
+            if isinstance(expression, UnaryExpression) and expression.modifier in (
+                operators.asc_op,
+                operators.desc_op,
+            ):
+                descending = expression.modifier is operators.desc_op
+                expression = expression.element
+            directions.add(descending)
+            if expression is not self.model.id:
+                columns.append(expression)
+        if len(directions) > 1:
+            raise RepositoryDataError("Keyset ordering must use a single direction")
+        return columns + [self.model.id], directions == {True}
+
     async def get_all(
         self,
         filters: dict[str, int | bool | list] | None = None,
@@ -71,43 +307,61 @@ class BaseRepository(Generic[ModelType]):
         joins: list[tuple] = None,
         outer_joins: list[tuple] = None,
         extra_columns: list = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        order_by: list | None = None,
+        deduplicate: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
+        use_cursor = use_cursor or cursor is not None
+        keyset, descending = self._keyset(order_by)
+        limit = limit or 10
         try:
-            query = (
-                select(self.model)
-                .add_columns(
-                    *(extra_columns or []), func.count().over().label("total_count")
-                )
-                .distinct(self.model.id)
+            query = self._build_list_query(
+                filters, extra_filters, joins, outer_joins, extra_columns
             )
+            if deduplicate:
+                query = query.distinct(*keyset)
+            if use_cursor:
+                query = query.add_columns(
+                    *(column.label(f"cursor_{i}") for i, column in enumerate(keyset))
+                )
 
-            if joins:
-                for join_args in joins:
-                    query = query.join(*join_args)
-
-            if outer_joins:
-                for join_args in outer_joins:
-                    query = query.outerjoin(*join_args)
-
-            if filters:
-                for field, value in filters.items():
-                    column = getattr(self.model, field)
-                    if isinstance(value, list):
-                        query = query.where(column.in_(value))
-                    else:
-                        query = query.where(column == value)
-
-            if extra_filters:
-                for f in extra_filters:
-                    query = query.where(f)
+            total_count = None
+            windowed = count_mode == CountMode.EXACT and cursor is None
+            if windowed:
+                query = query.add_columns(func.count().over().label("total_count"))
+            elif count_mode == CountMode.ESTIMATED:
+                total_count = await self._estimate_count(query)
+            elif count_mode == CountMode.CACHED:
+                total_count = await self._cached_count(query)
 
-            query = query.offset(offset or 0).limit(limit or 10)
+            query = query.order_by(
+                *(column.desc() if descending else column for column in keyset)
+            )
+            if use_cursor:
+                if cursor is not None:
+                    last_values = tuple_(*decode_cursor(cursor, keyset))
+                    query = query.where(
+                        tuple_(*keyset) < last_values
+                        if descending
+                        else tuple_(*keyset) > last_values
+                    )
+                query = query.limit(limit + 1)
+            else:
+                query = query.offset(offset or 0).limit(limit)
 
             result = await self.session.execute(query)
             rows = result.all()
 
             if not rows:
-                return [], 0
+                return [], 0 if windowed else total_count, None
+
+            next_cursor = None
+            if use_cursor and len(rows) > limit:
+                rows = rows[:limit]
+                start = 1 + len(extra_columns or [])
+                next_cursor = encode_cursor(list(rows[-1][start : start + len(keyset)]))
 
             items = []
             for row in rows:
@@ -117,8 +371,9 @@ class BaseRepository(Generic[ModelType]):
                         setattr(quiz_obj, col.key, row[idx])
                 items.append(quiz_obj)
 
-            total_count = rows[0][-1]
-            return items, total_count
+            if windowed:
+                total_count = rows[0][-1]
+            return items, total_count, next_cursor
 
         except SQLAlchemyError as e:
             raise RepositoryDatabaseError(f"Database error: {e}") from e
@@ -144,24 +399,37 @@ class BaseRepository(Generic[ModelType]):
         except SQLAlchemyError as e:
             raise RepositoryDatabaseError(f"Database error: {e}") from e
 
+    def _update_many_stmt(self, data: list[dict]):
+        pk_col = inspect(self.model).primary_key[0]
+        table = self.model.__table__
+        columns = [pk_col.name] + [key for key in data[0] if key != pk_col.name]
+        values = select(
+            *(
+                func.unnest(
+                    bindparam(
+                        f"{column}_values",
+                        [row[column] for row in data],
+                        type_=ARRAY(table.c[column].type),
+                    )
+                ).label(column)
+                for column in columns
+            )
+        ).subquery("v")
+        return (
+            update(self.model)
+            .where(pk_col == values.c[pk_col.name])
+            .values({column: values.c[column] for column in columns[1:]})
+        )
+
     async def update_many(self, data: list[dict]):
+        if not data:
+            return
         try:
-            pk_col = inspect(self.model).primary_key[0]
-            pk_name = pk_col.name
-
-            ids = [row[pk_name] for row in data]
-
-            stmt_values = {}
-            for key in data[0].keys():
-                if key == pk_name:
-                    continue
-                stmt_values[key] = case(
-                    {row[pk_name]: row[key] for row in data}, value=pk_col
+            batch_size = settings.db.BULK_UPDATE_BATCH_SIZE
+            for start in range(0, len(data), batch_size):
+                await self.session.execute(
+                    self._update_many_stmt(data[start : start + batch_size])
                 )
-
-            stmt = update(self.model).where(pk_col.in_(ids)).values(**stmt_values)
-
-            await self.session.execute(stmt)
         except IntegrityError as e:
             raise RepositoryIntegrityError(f"Integrity error: {e}") from e
         except DataError as e:
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import func, and_, or_
 
+from app.core.enums.enums import CountMode
 from app.core.exceptions.exceptions import AppException
 from app.core.exceptions.repository_exceptions import RepositoryDatabaseError
 from app.models.company_model import Company
@@ -18,33 +19,57 @@ class CompanyRepository(BaseRepository[Company]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Company)
 
-    async def get_all_companies_for_owner(self, limit=5, offset=0, current_user=None):
-        items, total = await super().get_all(
+    async def get_all_companies_for_owner(
+        self,
+        limit=5,
+        offset=0,
+        current_user=None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ):
+        items, total, next_cursor = await super().get_all(
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
             extra_filters=[
                 or_(Company.private == False, Company.owner == current_user)
             ],
         )
-        return items, total
+        return items, total, next_cursor
 
-    async def get_companies_for_user(self, user_id, limit=None, offset=None):
-        items, total = await super().get_all(
+    async def get_companies_for_user(
+        self,
+        user_id,
+        limit=None,
+        offset=None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ):
+        items, total, next_cursor = await super().get_all(
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
             joins=[(Memberships, Company.id == Memberships.company_id)],
+            deduplicate=True,
             extra_filters=[Memberships.user_id == user_id],
             extra_columns=[Memberships.role],
         )
-        return items, total
+        return items, total, next_cursor
 
     async def get_companies_by_ids(self, ids: list[int]):
-        items, total_count = await super().get_all(
+        items, _, _ = await super().get_all(
             filters={"id": ids} if ids else {},
-            limit=None,
+            limit=len(ids) or None,
             offset=None,
+            count_mode=CountMode.NONE,
         )
-        return items, total_count
+        return items
 
     async def get_company_by_id(self, company_id: int, current_user: int):
         try:
@@ -2,6 +2,7 @@ import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.enums.enums import CountMode
 from app.db.repositories.base_repository import BaseRepository
 from app.models.membership_model import MembershipRequests
 from app.models.company_model import Company
@@ -19,13 +20,19 @@ class MembershipRequestsRepository(BaseRepository[MembershipRequests]):
         user_id: int,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        items, total_count = await super().get_all(
+        items, total_count, next_cursor = await super().get_all(
             filters={"type": request_type, "user_id": user_id},
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
         )
-        return items
+        return items, total_count, next_cursor
 
     async def get_membership_requests_to_company(
         self,
@@ -33,14 +40,20 @@ class MembershipRequestsRepository(BaseRepository[MembershipRequests]):
         company_id: int,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        items, total_count = await super().get_all(
+        items, total_count, next_cursor = await super().get_all(
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
             joins=[(Company, MembershipRequests.company_id == Company.id)],
             extra_filters=[
                 MembershipRequests.type == request_type,
                 Company.id == company_id,
             ],
         )
-        return items, total_count
+        return items, total_count, next_cursor
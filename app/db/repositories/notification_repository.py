@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.enums.enums import CountMode
 from app.db.repositories.base_repository import BaseRepository
 from app.models.membership_model import Memberships
 from app.models.notifications_model import Notification
@@ -10,12 +11,23 @@ class NotificationsRepository(BaseRepository[Notification]):
         super().__init__(session, Notification)
 
     async def get_all_notifications(
-        self, user_id: int, limit: int | None, offset: int | None
+        self,
+        user_id: int,
+        limit: int | None,
+        offset: int | None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        items, total_count = await self.get_all(
+        items, total_count, next_cursor = await self.get_all(
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
             joins=[(Memberships, Memberships.company_id == Notification.company_id)],
+            order_by=[Notification.created_at.desc()],
+            deduplicate=True,
             extra_filters=[Memberships.user_id == user_id],
         )
-        return items, total_count
+        return items, total_count, next_cursor
@@ -1,23 +1,13 @@
 import logging
 
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError, DataError, SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions.exceptions import AppException, BadRequestException
-from app.core.exceptions.repository_exceptions import (
-    RepositoryIntegrityError,
-    RepositoryDataError,
-    RepositoryDatabaseError,
-)
+from app.core.exceptions.repository_exceptions import RepositoryDatabaseError
 from app.db.repositories.base_repository import BaseRepository
-from app.models.quiz_model import (
-    Answer,
-    SelectedAnswers,
-    QuizParticipant,
-    Records,
-    Quiz,
-)
+from app.models.quiz_model import Answer, Question, SelectedAnswers
 
 logger = logging.getLogger(__name__)
 
@@ -26,46 +16,18 @@ class AnswerRepository(BaseRepository[Answer]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Answer)
 
-    async def create_selected_answers(self, selected_answers: list[SelectedAnswers]):
-        try:
-            self.session.add_all(selected_answers)
-            await self.session.flush()
-            ids = [answer.id for answer in selected_answers]
-            return ids
-        except IntegrityError as e:
-            raise RepositoryIntegrityError(f"Integrity error: {e}") from e
-        except DataError as e:
-            raise RepositoryDataError(f"Invalid data: {e}") from e
-        except SQLAlchemyError as e:
-            raise RepositoryDatabaseError(f"Database error: {e}") from e
+    async def create_selected_answers(self, selected_answers: list[dict]):
+        await BaseRepository(self.session, SelectedAnswers).bulk_create(
+            selected_answers, returning=False
+        )
 
-    async def get_missing_answers(
-        self,
-        answer_ids: list[int],
-        user_id: int,
-        quiz_id: int = None,
-        company_id: int = None,
-    ):
+    async def get_quiz_answers(self, quiz_id: int, answer_ids: list[int]):
         try:
-            query = (
-                select(SelectedAnswers)
-                .join(Records, SelectedAnswers.record_id == Records.id)
-                .join(QuizParticipant, Records.participant_id == QuizParticipant.id)
-                .join(Quiz, QuizParticipant.quiz_id == Quiz.id)
-                .filter(QuizParticipant.user_id == user_id)
+            result = await self.session.execute(
+                select(Answer.question_id, Answer.id)
+                .join(Question, Answer.question_id == Question.id)
+                .where(Question.quiz_id == quiz_id, Answer.id.in_(answer_ids))
             )
-
-            if quiz_id:
-                query = query.filter(QuizParticipant.quiz_id == quiz_id)
-
-            if company_id:
-                query = query.filter(Quiz.company_id == company_id)
-
-            if answer_ids:
-                query = query.filter(~SelectedAnswers.id.in_(answer_ids))
-
-            result = await self.session.execute(query)
-            rows = result.scalars().all()
-            return rows
+            return set(result.all())
         except SQLAlchemyError as e:
             raise RepositoryDatabaseError(f"Database error: {e}") from e
@@ -1,16 +1,13 @@
 import logging
 
-from sqlalchemy import select, func, and_, Integer, cast, case, text, insert
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError, DataError
+from sqlalchemy import select, func, and_, Integer, cast, case, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.enums.enums import CountMode
 from app.core.exceptions.exceptions import AppException, BadRequestException
-from app.core.exceptions.repository_exceptions import (
-    RepositoryDatabaseError,
-    RepositoryIntegrityError,
-    RepositoryDataError,
-)
+from app.core.exceptions.repository_exceptions import RepositoryDatabaseError
 from app.db.repositories.base_repository import BaseRepository
 from app.models.quiz_model import (
     QuizParticipant,
@@ -34,6 +31,9 @@ class QuizRepository(BaseRepository[Quiz]):
         company_id: int | None = None,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
         last_completion_all_subq = (
             select(
@@ -69,10 +69,13 @@ class QuizRepository(BaseRepository[Quiz]):
 
         filters = {"company_id": company_id} if company_id is not None else None
 
-        items, total_count = await self.get_all(
+        items, total_count, next_cursor = await self.get_all(
             filters=filters,
             limit=limit or 5,
             offset=offset or 0,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
             extra_columns=extra_columns,
             outer_joins=[
                 (
@@ -85,7 +88,7 @@ class QuizRepository(BaseRepository[Quiz]):
                 ),
             ],
         )
-        return items, total_count
+        return items, total_count, next_cursor
 
     async def get_quiz_by_id(self, quiz_id: int, company_id: int):
         try:
@@ -105,23 +108,40 @@ class QuizRepository(BaseRepository[Quiz]):
             logger.error(f"SQLAlchemyError: {e}")
             raise AppException(detail="Database exception occurred.")
 
-    async def get_full_quiz_data_for_user(self, selected_answer_ids: list[int]):
+    async def get_quiz_history_for_user(
+        self, user_id: int, quiz_id: int = None, company_id: int = None
+    ):
         try:
             query = (
                 select(
+                    Answer.id.label("answer_id"),
                     Answer.text.label("answer_text"),
                     Answer.is_correct,
                     Question.text.label("question_text"),
                     Quiz.title.label("quiz_title"),
                     Quiz.description.label("quiz_description"),
+                    Quiz.company_id,
+                    QuizParticipant.quiz_id,
+                    QuizParticipant.user_id,
+                    QuizParticipant.id.label("participant_id"),
+                    Records.id.label("record_id"),
                 )
-                .select_from(SelectedAnswers)
+                .select_from(QuizParticipant)
+                .join(Records, Records.participant_id == QuizParticipant.id)
+                .join(SelectedAnswers, SelectedAnswers.record_id == Records.id)
                 .join(Answer, SelectedAnswers.answer_id == Answer.id)
                 .join(Question, Answer.question_id == Question.id)
-                .join(Quiz, Question.quiz_id == Quiz.id)
-                .filter(SelectedAnswers.id.in_(selected_answer_ids))
+                .join(Quiz, QuizParticipant.quiz_id == Quiz.id)
+                .filter(QuizParticipant.user_id == user_id)
+                .order_by(Records.id, SelectedAnswers.id)
             )
 
+            if quiz_id:
+                query = query.filter(QuizParticipant.quiz_id == quiz_id)
+
+            if company_id:
+                query = query.filter(Quiz.company_id == company_id)
+
             result = await self.session.execute(query)
             rows = result.fetchall()
 
@@ -129,38 +149,40 @@ class QuizRepository(BaseRepository[Quiz]):
         except SQLAlchemyError as e:
             raise RepositoryDatabaseError(f"Database error: {e}") from e
 
-    async def save_questions_and_answers(
-        self, quiz_id, questions: list[dict], answers: list[dict]
-    ):
+    async def get_answer_details(self, answer_ids: list[int]):
         try:
-            stmt = insert(Question).returning(Question.id, Question.text)
             result = await self.session.execute(
-                stmt, [{"text": q["text"], "quiz_id": quiz_id} for q in questions]
-            )
-            created_questions = result.fetchall()
-
-            id_map = {
-                old["id"]: new_id
-                for old, (new_id, _) in zip(questions, created_questions)
-            }
-
-            stmt = insert(Answer)
-            answer_values = []
-            for a in answers:
-                old_qid = a["question_id"]
-
-                answer_values.append(
-                    {
-                        "question_id": id_map[old_qid],
-                        "text": a["text"],
-                        "is_correct": a["is_correct"],
-                    }
+                select(
+                    Answer.id.label("answer_id"),
+                    Answer.text.label("answer_text"),
+                    Answer.is_correct,
+                    Question.text.label("question_text"),
+                    Quiz.title.label("quiz_title"),
+                    Quiz.description.label("quiz_description"),
                 )
-
-            await self.session.execute(stmt, answer_values)
-        except IntegrityError as e:
-            raise RepositoryIntegrityError(f"Integrity error: {e}") from e
-        except DataError as e:
-            raise RepositoryDataError(f"Invalid data: {e}") from e
+                .join(Question, Answer.question_id == Question.id)
+                .join(Quiz, Question.quiz_id == Quiz.id)
+                .where(Answer.id.in_(answer_ids))
+            )
+            return result.fetchall()
         except SQLAlchemyError as e:
             raise RepositoryDatabaseError(f"Database error: {e}") from e
+
+    async def save_questions_and_answers(
+        self, quiz_id, questions: list[dict], answers: list[dict]
+    ):
+        question_ids = await BaseRepository(self.session, Question).bulk_create(
+            [{"text": q["text"], "quiz_id": quiz_id} for q in questions]
+        )
+        id_map = {old["id"]: new_id for old, new_id in zip(questions, question_ids)}
+        await BaseRepository(self.session, Answer).bulk_create(
+            [
+                {
+                    "question_id": id_map[a["question_id"]],
+                    "text": a["text"],
+                    "is_correct": a["is_correct"],
+                }
+                for a in answers
+            ],
+            returning=False,
+        )
@@ -1,12 +1,16 @@
 import logging
 
 from datetime import date
-from sqlalchemy import select, func
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import insert, select, func
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions.exceptions import AppException
-from app.core.exceptions.repository_exceptions import RepositoryDatabaseError
+from app.core.exceptions.repository_exceptions import (
+    RepositoryDatabaseError,
+    RepositoryDataError,
+    RepositoryIntegrityError,
+)
 from app.db.repositories.base_repository import BaseRepository
 from app.models.quiz_model import Records, Question, Quiz, QuizParticipant
 
@@ -17,6 +21,32 @@ class RecordsRepository(BaseRepository[Records]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, Records)
 
+    async def get_existing_submission_ids(self, submission_ids: list[str]):
+        try:
+            result = await self.session.execute(
+                select(Records.submission_id).where(
+                    Records.submission_id.in_(submission_ids)
+                )
+            )
+            return set(result.scalars().all())
+        except SQLAlchemyError as e:
+            raise RepositoryDatabaseError(f"Database error: {e}") from e
+
+    async def create_records(self, data: list[dict]):
+        if not data:
+            return {}
+        try:
+            result = await self.session.execute(
+                insert(Records).returning(Records.submission_id, Records.id), data
+            )
+            return dict(result.all())
+        except IntegrityError as e:
+            raise RepositoryIntegrityError(f"Integrity error: {e}") from e
+        except DataError as e:
+            raise RepositoryDataError(f"Invalid data: {e}") from e
+        except SQLAlchemyError as e:
+            raise RepositoryDatabaseError(f"Database error: {e}") from e
+
     async def get_average_score_in_company(
         self,
         user_id: int,
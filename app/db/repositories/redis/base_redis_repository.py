@@ -5,53 +5,84 @@ from redis import RedisError
 from redis.asyncio import Redis
 from abc import ABC, abstractmethod
 
-from app.core.exceptions.repository_exceptions import (
-    RedisRepositoryMultipleFetchError,
-    RedisRepositoryScanError,
-    RedisRepositoryError,
-)
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.db.redis_init import redis_breaker
+from app.utils.circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
 
 class BaseRedisRepository(ABC):
-    def __init__(self, redis_client: Redis):
+    def __init__(self, redis_client: Redis, breaker: CircuitBreaker | None = None):
         self.redis = redis_client
+        self.breaker = breaker or redis_breaker
+
+    async def call(self, operation, timeout: float | None = None):
+        return await self.breaker.call(operation, timeout)
 
     @staticmethod
     @abstractmethod
     def get_key(item: dict):
         pass
 
+    def encode(self, item: dict):
+        return json.dumps(item)
+
+    def decode(self, value: bytes):
+        return json.loads(value)
+
     async def set(self, data: list[dict], expire: int):
+        await self.set_items({self.get_key(i): i for i in data}, expire)
+
+    async def set_items(self, items: dict[str, dict], expire: int):
         try:
             pipe = self.redis.pipeline()
-            for i in data:
-                key = self.get_key(i)
-                await pipe.set(key, json.dumps(i), ex=expire)
-            await pipe.execute()
+            for key, item in items.items():
+                await pipe.set(key, self.encode(item), ex=expire)
+            await self.call(pipe.execute)
         except RedisError as e:
             raise RedisRepositoryError(f"Redis error: {e}") from e
 
-    async def get_many(self, pattern: str):
-        keys = []
-        cursor = b"0"
-
-        while cursor:
-            try:
-                cursor, found_keys = await self.redis.scan(cursor=cursor, match=pattern)
-            except RedisError as e:
-                raise RedisRepositoryScanError(f"Redis scan error: {e}") from e
-            keys.extend(found_keys)
-            if cursor in [0, b"0"]:
-                break
-
-        if not keys:
-            return []
+    async def get_one(self, key: str):
         try:
-            values = await self.redis.mget(*keys)
+            value = await self.call(lambda: self.redis.get(key))
         except RedisError as e:
-            raise RedisRepositoryMultipleFetchError(f"Redis mget error: {e}") from e
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        return self.decode(value) if value is not None else None
 
-        items = [json.loads(v.decode()) for v in values if v is not None]
-        return items
+    async def delete(self, *keys: str):
+        try:
+            await self.call(lambda: self.redis.delete(*keys))
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+
+    async def set_hash_items(
+        self, hashes: dict[str, dict[str, dict]], expire: int, extend: bool = True
+    ):
+        try:
+            pipe = self.redis.pipeline()
+            for key, fields in hashes.items():
+                await pipe.hset(
+                    key,
+                    mapping={
+                        field: self.encode(item) for field, item in fields.items()
+                    },
+                )
+                await pipe.expire(key, expire, nx=not extend)
+            await self.call(pipe.execute)
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+
+    async def get_hash_items(self, key: str):
+        try:
+            values = await self.call(lambda: self.redis.hvals(key))
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        return [self.decode(value) for value in values]
+
+    async def get_hash_item(self, key: str, field: str):
+        try:
+            value = await self.call(lambda: self.redis.hget(key, field))
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        return self.decode(value) if value is not None else None
@@ -0,0 +1,77 @@
+import importlib.util
+import json
+import logging
+import struct
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_AVAILABLE = importlib.util.find_spec("msgpack") is not None
+
+if MSGPACK_AVAILABLE:
+    import msgpack
+
+RECORD_FIELDS = ("user_id", "quiz_id", "company_id", "participant_id", "record_id")
+
+
+class JSONCodec:
+    tag = b"j"
+
+    def encode(self, record: dict):
+        return json.dumps(record, separators=(",", ":")).encode()
+
+    def decode(self, value: bytes):
+        return json.loads(value)
+
+
+class StructCodec:
+    tag = b"s"
+    header = struct.Struct(f"<{len(RECORD_FIELDS)}i")
+
+    def encode(self, record: dict):
+        answer_ids = record["answer_ids"]
+        return self.header.pack(
+            *(record[field] for field in RECORD_FIELDS)
+        ) + struct.pack(f"<{len(answer_ids)}i", *answer_ids)
+
+    def decode(self, value: bytes):
+        record = dict(zip(RECORD_FIELDS, self.header.unpack_from(value)))
+        count = (len(value) - self.header.size) // 4
+        record["answer_ids"] = list(
+            struct.unpack_from(f"<{count}i", value, self.header.size)
+        )
+        return record
+
+
+class MsgpackCodec:
+    tag = b"m"
+
+    def encode(self, record: dict):
+        return msgpack.packb(
+            [record[field] for field in RECORD_FIELDS] + [record["answer_ids"]]
+        )
+
+    def decode(self, value: bytes):
+        *fields, answer_ids = msgpack.unpackb(value)
+        return dict(zip(RECORD_FIELDS, fields), answer_ids=answer_ids)
+
+
+codecs = {"json": JSONCodec(), "struct": StructCodec()}
+if MSGPACK_AVAILABLE:
+    codecs["msgpack"] = MsgpackCodec()
+codecs_by_tag = {codec.tag: codec for codec in codecs.values()}
+
+
+def get_codec(name: str):
+    codec = codecs.get(name)
+    if codec is None:
+        logger.warning(f"Codec {name} is not available, falling back to struct")
+        return codecs["struct"]
+    return codec
+
+
+def encode_record(record: dict, codec):
+    return codec.tag + codec.encode(record)
+
+
+def decode_record(value: bytes):
+    return codecs_by_tag[value[:1]].decode(value[1:])
@@ -1,19 +1,106 @@
+from redis import RedisError
+from redis.asyncio import Redis
+
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
 from app.db.repositories.redis.base_redis_repository import BaseRedisRepository
+from app.db.repositories.redis.codecs import (
+    RECORD_FIELDS,
+    decode_record,
+    encode_record,
+    get_codec,
+)
+from app.utils.settings_model import settings
 
 
 class QuizRedisRepository(BaseRedisRepository):
     expire = 172800
+    namespace = "quiz:answers"
+    version = 2
+    loaded_field = b"loaded"
+
+    def __init__(self, redis_client: Redis, codec=None, breaker=None):
+        super().__init__(redis_client, breaker)
+        self.codec = codec or get_codec(settings.redis.ANSWER_CODEC)
+
+    def encode(self, item: dict):
+        return encode_record(item, self.codec)
+
+    def decode(self, value: bytes):
+        return decode_record(value)
+
+    @classmethod
+    def get_key(cls, item: dict):
+        return f"{cls.namespace}:v{cls.version}:user:{item['user_id']}"
 
     @staticmethod
-    def get_key(item: dict):
-        return f"{item['user_id']}:{item['quiz_id']}:{item['company_id']}:{item['answer_id']}"
+    def group_records(answers: list[dict]):
+        records = {}
+        for answer in answers:
+            record = records.setdefault(
+                answer["record_id"],
+                {**{field: answer[field] for field in RECORD_FIELDS}, "answer_ids": []},
+            )
+            record["answer_ids"].append(answer["answer_id"])
+        return list(records.values())
+
+    @staticmethod
+    def flatten_record(record: dict):
+        return [
+            {
+                **{field: record[field] for field in RECORD_FIELDS},
+                "answer_id": answer_id,
+            }
+            for answer_id in record["answer_ids"]
+        ]
+
+    async def save_records(self, records: list[dict]):
+        hashes = {}
+        for record in records:
+            hashes.setdefault(self.get_key(record), {})[str(record["record_id"])] = (
+                record
+            )
+        await super().set_hash_items(hashes, expire=self.expire, extend=False)
 
     async def save_answers(self, answers: list[dict]):
-        await super().set(data=answers, expire=self.expire)
+        await self.save_records(self.group_records(answers))
+
+    async def load_answers(self, user_id: int, answers: list[dict]):
+        key = self.get_key({"user_id": user_id})
+        fields = {
+            str(record["record_id"]): self.encode(record)
+            for record in self.group_records(answers)
+        }
+        try:
+            pipe = self.redis.pipeline()
+            await pipe.hset(key, mapping={**fields, self.loaded_field: 1})
+            await pipe.expire(key, self.expire)
+            await self.call(pipe.execute)
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+
+    async def get_record(self, user_id: int, record_id: int):
+        return await super().get_hash_item(
+            self.get_key({"user_id": user_id}), str(record_id)
+        )
 
     async def get_answers_for_user(
         self, user_id: int, quiz_id: int = None, company_id: int = None
     ):
-        pattern = f"{user_id}:{quiz_id if quiz_id else '*'}:{company_id if company_id else '*'}:*"
-        answers = await super().get_many(pattern=pattern)
-        return answers
+        key = self.get_key({"user_id": user_id})
+        try:
+            values = await self.call(lambda: self.redis.hgetall(key))
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        if values.pop(self.loaded_field, None) is None:
+            return None
+        records = sorted(
+            (self.decode(value) for value in values.values()),
+            key=lambda record: record["record_id"],
+        )
+        return [
+            answer
+            for record in records
+            if not quiz_id or record["quiz_id"] == quiz_id
+            if not company_id or record["company_id"] == company_id
+            for answer in self.flatten_record(record)
+        ]
@@ -0,0 +1,158 @@
+from redis import RedisError, ResponseError
+from redis.asyncio import Redis
+
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.db.repositories.redis.base_redis_repository import BaseRedisRepository
+from app.utils.settings_model import settings
+
+
+class SubmissionStreamRepository(BaseRedisRepository):
+    def __init__(
+        self,
+        redis_client: Redis,
+        stream: str = settings.submission.SUBMISSION_STREAM,
+        group: str = settings.submission.SUBMISSION_GROUP,
+        dead_letter_stream: str = settings.submission.SUBMISSION_DEAD_LETTER_STREAM,
+        maxlen: int = settings.submission.SUBMISSION_STREAM_MAXLEN,
+    ):
+        super().__init__(redis_client)
+        self.stream = stream
+        self.group = group
+        self.dead_letter_stream = dead_letter_stream
+        self.maxlen = maxlen
+
+    @staticmethod
+    def get_key(item: dict):
+        return item["submission_id"]
+
+    @property
+    def attempts_key(self):
+        return f"{self.stream}:attempts"
+
+    def parse_entries(self, entries):
+        return [
+            (entry_id.decode(), self.decode(fields[b"submission"]))
+            for entry_id, fields in entries
+            if fields
+        ]
+
+    async def add(self, submission: dict):
+        try:
+            entry_id = await self.call(
+                lambda: self.redis.xadd(
+                    self.stream,
+                    {"submission": self.encode(submission)},
+                    maxlen=self.maxlen,
+                    approximate=True,
+                )
+            )
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        return entry_id.decode()
+
+    async def ensure_group(self):
+        try:
+            await self.call(
+                lambda: self.redis.xgroup_create(
+                    self.stream, self.group, id="0", mkstream=True
+                )
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise RedisRepositoryError(f"Redis error: {e}") from e
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+
+    async def read(self, consumer: str, count: int, block_ms: int):
+        try:
+            response = await self.call(
+                lambda: self.redis.xreadgroup(
+                    self.group,
+                    consumer,
+                    {self.stream: ">"},
+                    count=count,
+                    block=block_ms,
+                ),
+                timeout=block_ms / 1000 + self.breaker.timeout,
+            )
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        return [
+            entry
+            for _, entries in response or []
+            for entry in self.parse_entries(entries)
+        ]
+
+    async def claim_stale(self, consumer: str, min_idle_ms: int, count: int):
+        try:
+            _, entries, _ = await self.call(
+                lambda: self.redis.xautoclaim(
+                    self.stream,
+                    self.group,
+                    consumer,
+                    min_idle_time=min_idle_ms,
+                    start_id="0-0",
+                    count=count,
+                )
+            )
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        return self.parse_entries(entries)
+
+    async def ack(self, *entry_ids: str):
+        if not entry_ids:
+            return
+        try:
+            pipe = self.redis.pipeline()
+            await pipe.xack(self.stream, self.group, *entry_ids)
+            await pipe.hdel(self.attempts_key, *entry_ids)
+            await self.call(pipe.execute)
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+
+    async def record_failure(self, entry_id: str):
+        try:
+            return await self.call(
+                lambda: self.redis.hincrby(self.attempts_key, entry_id, 1)
+            )
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+
+    async def dead_letter(self, entry_id: str, submission: dict, error: str):
+        try:
+            await self.call(
+                lambda: self.redis.xadd(
+                    self.dead_letter_stream,
+                    {
+                        "entry_id": entry_id,
+                        "submission": self.encode(submission),
+                        "error": error,
+                    },
+                )
+            )
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        await self.ack(entry_id)
+
+    async def stats(self):
+        try:
+            length = await self.call(lambda: self.redis.xlen(self.stream))
+            dead_letters = await self.call(
+                lambda: self.redis.xlen(self.dead_letter_stream)
+            )
+            groups = (
+                await self.call(lambda: self.redis.xinfo_groups(self.stream))
+                if length
+                else []
+            )
+        except RedisError as e:
+            raise RedisRepositoryError(f"Redis error: {e}") from e
+        group = next(
+            (group for group in groups if group["name"].decode() == self.group), {}
+        )
+        return {
+            "length": length,
+            "pending": group.get("pending", 0),
+            "lag": group.get("lag") or 0,
+            "dead_letters": dead_letters,
+        }
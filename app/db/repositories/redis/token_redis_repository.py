@@ -0,0 +1,13 @@
+from app.db.repositories.redis.base_redis_repository import BaseRedisRepository
+
+
+class TokenRedisRepository(BaseRedisRepository):
+    @staticmethod
+    def get_key(item: dict):
+        return f"token:revoked:{item['digest']}"
+
+    async def revoke(self, digest: str, expires_at: float, expire: int):
+        await super().set([{"digest": digest, "expires_at": expires_at}], expire)
+
+    async def get_revocation(self, digest: str):
+        return await super().get_one(self.get_key({"digest": digest}))
@@ -0,0 +1,28 @@
+from app.db.repositories.redis.base_redis_repository import BaseRedisRepository
+
+
+class UserRedisRepository(BaseRedisRepository):
+    @staticmethod
+    def get_key(item: dict):
+        return f"principal:email:{item['email']}"
+
+    @staticmethod
+    def get_id_key(user_id: int):
+        return f"principal:id:{user_id}"
+
+    async def save_user(self, user: dict, expire: int):
+        await super().set_items(
+            {self.get_key(user): user, self.get_id_key(user["id"]): user}, expire
+        )
+
+    async def get_user_by_email(self, email: str):
+        return await super().get_one(self.get_key({"email": email}))
+
+    async def get_user_by_id(self, user_id: int):
+        return await super().get_one(self.get_id_key(user_id))
+
+    async def delete_user(self, email: str, user_id: int | None = None):
+        keys = [self.get_key({"email": email})]
+        if user_id is not None:
+            keys.append(self.get_id_key(user_id))
+        await super().delete(*keys)
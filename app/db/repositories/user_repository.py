@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import func, or_
 
-from app.core.enums.enums import RoleEnum
+from app.core.enums.enums import RoleEnum, CountMode
 from app.core.exceptions.repository_exceptions import RepositoryDatabaseError
 from app.models.quiz_model import QuizParticipant
 from app.models.user_model import User
@@ -20,15 +20,33 @@ class UserRepository(BaseRepository[User]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, User)
 
-    async def get_all_users(self, limit: int | None = None, offset: int | None = None):
-        items, total_count = await super().get_all(
+    async def get_all_users(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ):
+        items, total_count, next_cursor = await super().get_all(
             filters={"has_profile": True},
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
         )
-        return items, total_count
-
-    async def get_users_in_company(self, company_id: int, limit=None, offset=None):
+        return items, total_count, next_cursor
+
+    async def get_users_in_company(
+        self,
+        company_id: int,
+        limit=None,
+        offset=None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ):
         last_quiz_subq = (
             select(
                 QuizParticipant.user_id,
@@ -38,19 +56,23 @@ class UserRepository(BaseRepository[User]):
             .subquery()
         )
 
-        items, total_count = await super().get_all(
+        items, total_count, next_cursor = await super().get_all(
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
             joins=[(Memberships, User.id == Memberships.user_id)],
+            deduplicate=True,
             outer_joins=[(last_quiz_subq, last_quiz_subq.c.user_id == User.id)],
             extra_filters=[Memberships.company_id == company_id],
             extra_columns=[Memberships.role, last_quiz_subq.c.last_quiz_time],
         )
 
-        return items, total_count
+        return items, total_count, next_cursor
 
     async def get_users_by_ids(self, ids: list[int]):
-        items, total_count = await super().get_all(
+        items, total_count, _ = await super().get_all(
             filters={"id": ids} if ids else {},
             limit=None,
             offset=None,
@@ -58,11 +80,23 @@ class UserRepository(BaseRepository[User]):
 
         return items, total_count
 
-    async def get_all_admins(self, company_id: int, limit=None, offset=None):
-        items, total_count = await super().get_all(
+    async def get_all_admins(
+        self,
+        company_id: int,
+        limit=None,
+        offset=None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ):
+        items, total_count, next_cursor = await super().get_all(
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            use_cursor=use_cursor,
+            count_mode=count_mode,
             joins=[(Memberships, User.id == Memberships.user_id)],
+            deduplicate=True,
             extra_filters=[
                 Memberships.company_id == company_id,
                 Memberships.role == RoleEnum.ADMIN,
@@ -70,7 +104,7 @@ class UserRepository(BaseRepository[User]):
             extra_columns=[Memberships.role],
         )
 
-        return items, total_count
+        return items, total_count, next_cursor
 
     async def get_users_with_quizzes_to_complete(self):
         try:
@@ -0,0 +1,168 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+explaining: ContextVar[bool] = ContextVar("explaining", default=False)
+
+READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+MODIFYING = re.compile(r"\b(INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+PLACEHOLDER = r"\?(?:::\w+(?:\(\?\))?(?:\[\])?)?"
+PLAN_LITERAL = re.compile(r"'(?:[^']|'')*'|(?<![\w.$])-?\d+(?:\.\d+)?\b")
+
+
+def normalize_statement(statement: str):
+    shape = re.sub(r"\$\d+|%\(\w+\)s|(?<![:\w]):\w+", "?", statement)
+    shape = re.sub(r"'(?:[^']|'')*'", "?", shape)
+    shape = re.sub(r"\b\d+(?:\.\d+)?\b", "?", shape)
+    shape = re.sub(rf"{PLACEHOLDER}(?:\s*,\s*{PLACEHOLDER})+", "?, ...", shape)
+    return " ".join(shape.split())
+
+
+def redact_parameters(parameters):
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def redact_plan(plan):
+    if isinstance(plan, dict):
+        return {key: redact_plan(value) for key, value in plan.items()}
+    if isinstance(plan, list):
+        return [redact_plan(value) for value in plan]
+    if isinstance(plan, str):
+        return PLAN_LITERAL.sub("?", plan)
+    return plan
+
+
+class SlowQueryRecorder:
+    def __init__(
+        self,
+        threshold_ms: float,
+        maxsize: int,
+        explain: bool,
+        analyze: bool,
+        explain_interval: int,
+    ):
+        self.threshold_ms = threshold_ms
+        self.maxsize = maxsize
+        self.explain = explain
+        self.analyze = analyze
+        self.explain_interval = explain_interval
+        self.engines = {}
+        self.entries: OrderedDict[str, dict] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+
+    def bind(self, engine):
+        self.engines[engine.sync_engine] = engine
+
+    def observe(
+        self,
+        statement: str,
+        parameters,
+        duration: float,
+        executemany: bool,
+        sync_engine=None,
+    ):
+        duration_ms = duration * 1000
+        if self.maxsize <= 0 or duration_ms < self.threshold_ms:
+            return
+        shape = normalize_statement(statement)
+        entry = self.entries.pop(shape, None) or {
+            "statement": shape,
+            "calls": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+            "last_seen": 0.0,
+            "parameters": None,
+            "plan": None,
+            "explained_at": 0.0,
+        }
+        entry["calls"] += 1
+        entry["total_ms"] += duration_ms
+        entry["max_ms"] = max(entry["max_ms"], duration_ms)
+        entry["last_seen"] = time.time()
+        entry["parameters"] = redact_parameters(parameters)
+        self.entries[shape] = entry
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        engine = self.engines.get(sync_engine)
+        if engine is not None and self._should_explain(entry, executemany):
+            entry["explained_at"] = time.time()
+            task = asyncio.get_running_loop().create_task(
+                self._explain(engine, shape, statement, parameters)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _should_explain(self, entry: dict, executemany: bool):
+        return (
+            self.explain
+            and not executemany
+            and time.time() - entry["explained_at"] >= self.explain_interval
+        )
+
+    def _explain_options(self, statement: str):
+        if (
+            self.analyze
+            and READ_ONLY.match(statement)
+            and not MODIFYING.search(statement)
+        ):
+            return "ANALYZE, BUFFERS, FORMAT JSON"
+        return "FORMAT JSON"
+
+    async def _explain(self, engine, shape: str, statement: str, parameters):
+        explaining.set(True)
+        options = self._explain_options(statement)
+        try:
+            async with engine.connect() as connection:
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN ({options}) {statement}",
+                    tuple(parameters) if isinstance(parameters, list) else parameters,
+                )
+                plan = result.scalar()
+                await connection.rollback()
+        except Exception:
+            logger.exception(f"Failed to explain slow query: {shape}")
+            return
+        entry = self.entries.get(shape)
+        if entry is not None:
+            entry["plan"] = redact_plan(
+                json.loads(plan) if isinstance(plan, str) else plan
+            )
+
+    def snapshot(self):
+        return [
+            {
+                "statement": entry["statement"],
+                "calls": entry["calls"],
+                "total_ms": entry["total_ms"],
+                "avg_ms": entry["total_ms"] / entry["calls"],
+                "max_ms": entry["max_ms"],
+                "last_seen": entry["last_seen"],
+                "parameters": entry["parameters"],
+                "plan": entry["plan"],
+            }
+            for entry in reversed(self.entries.values())
+        ]
+
+    def clear(self):
+        self.entries.clear()
+
+
+slow_query_recorder = SlowQueryRecorder(
+    threshold_ms=settings.monitoring.SLOW_QUERY_MS,
+    maxsize=settings.monitoring.SLOW_QUERY_BUFFER_SIZE,
+    explain=settings.monitoring.SLOW_QUERY_EXPLAIN,
+    analyze=settings.monitoring.SLOW_QUERY_EXPLAIN_ANALYZE,
+    explain_interval=settings.monitoring.SLOW_QUERY_EXPLAIN_INTERVAL,
+)
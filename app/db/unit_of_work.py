@@ -1,6 +1,12 @@
+import logging
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from app.db.postgres_init import async_session_maker
+from app.db.postgres_init import async_session_maker, replica_pool
 from app.db.repositories.membership_requests_repository import (
     MembershipRequestsRepository,
 )
@@ -13,53 +19,216 @@ from app.db.repositories.quizzes.record_repository import RecordsRepository
 from app.db.repositories.user_repository import UserRepository
 from app.db.repositories.company_repository import CompanyRepository
 from app.db.repositories.membership_repository import MembershipRepository
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+wrote_to_primary: ContextVar[bool] = ContextVar("wrote_to_primary", default=False)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def track_dml(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        mark_written(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_flush")
+def track_flush(session, flush_context):
+    mark_written(session)
+
+
+def mark_written(session):
+    session.info["wrote"] = True
+
+
+def has_written(session):
+    return session.info.get("wrote", False)
+
+
+def use_replica(readonly: bool, wrote: bool):
+    if not readonly:
+        return False
+    return not (settings.db.READ_YOUR_WRITES and wrote)
+
+
+async def open_replica_session():
+    for index, session_maker in replica_pool.candidates():
+        session_context = session_maker()
+        session = await session_context.__aenter__()
+        try:
+            await session.connection()
+        except (SQLAlchemyError, OSError) as e:
+            logger.warning(f"Replica {index} unavailable, skipping: {e}")
+            replica_pool.mark_down(index)
+            await session_context.__aexit__(None, None, None)
+            continue
+        return session_context, session
+    return None
+
+
+async def open_primary_session():
+    session_context = async_session_maker()
+    return session_context, await session_context.__aenter__()
+
+
+class RequestScope:
+    def __init__(self):
+        self.primary = None
+        self.replica = None
+        self.wrote = False
+        self.callbacks = []
+
+    def has_written(self):
+        return self.wrote or (self.primary is not None and has_written(self.primary[1]))
+
+    async def get_session(self, readonly: bool):
+        if use_replica(readonly, self.has_written()):
+            if self.replica is None:
+                self.replica = await open_replica_session() or False
+            if self.replica:
+                return self.replica[1]
+        if self.primary is None:
+            self.primary = await open_primary_session()
+        return self.primary[1]
+
+    async def close(self, failed: bool):
+        try:
+            if self.primary is not None and self.wrote:
+                if failed:
+                    await self.primary[1].rollback()
+                else:
+                    await self.primary[1].commit()
+        finally:
+            for opened in (self.primary, self.replica):
+                if opened:
+                    await opened[0].__aexit__(None, None, None)
+        if not failed:
+            for callback, args in self.callbacks:
+                await callback(*args)
+
+
+request_scope: ContextVar[RequestScope | None] = ContextVar(
+    "request_scope", default=None
+)
+
+
+current_unit_of_work: ContextVar["UnitOfWork | None"] = ContextVar(
+    "current_unit_of_work", default=None
+)
+
+
+async def after_commit(callback, *args):
+    scope = request_scope.get()
+    unit_of_work = current_unit_of_work.get()
+    if scope is not None:
+        scope.callbacks.append((callback, args))
+    elif unit_of_work is not None:
+        unit_of_work.callbacks.append((callback, args))
+    else:
+        await callback(*args)
 
 
 class UnitOfWork:
-    def __init__(self, session: AsyncSession | None = None):
+    repositories = {
+        "users": UserRepository,
+        "companies": CompanyRepository,
+        "memberships": MembershipRepository,
+        "membership_requests": MembershipRequestsRepository,
+        "quizzes": QuizRepository,
+        "questions": QuestionRepository,
+        "answers": AnswerRepository,
+        "participants": QuizParticipantRepository,
+        "records": RecordsRepository,
+        "notifications": NotificationsRepository,
+    }
+
+    def __init__(self, session: AsyncSession | None = None, readonly: bool = False):
         self._external_session = session
+        self.readonly = readonly
+        self._scope = None
+        self._savepoint = None
+        self._token = None
+        self.callbacks = []
         self.session = None
-        self.users = None
-        self.companies = None
-        self.memberships = None
-        self.membership_requests = None
-        self.quizzes = None
-        self.questions = None
-        self.answers = None
-        self.participants = None
-        self.records = None
-        self.notifications = None
+
+    def __getattr__(self, name: str):
+        repository_class = self.repositories.get(name)
+        if repository_class is None or self.session is None:
+            raise AttributeError(name)
+        repository = repository_class(self.session)
+        setattr(self, name, repository)
+        return repository
 
     async def __aenter__(self):
+        self._scope = None if self._external_session else request_scope.get()
         if self._external_session:
             self.session = self._external_session
+        elif self._scope is not None:
+            self.session = await self._scope.get_session(self.readonly)
+            if has_written(self.session):
+                self._savepoint = await self.session.begin_nested()
         else:
-            self._session_context = async_session_maker()
-            self.session = await self._session_context.__aenter__()
-
-        self.users = UserRepository(self.session)
-        self.companies = CompanyRepository(self.session)
-        self.memberships = MembershipRepository(self.session)
-        self.membership_requests = MembershipRequestsRepository(self.session)
-        self.quizzes = QuizRepository(self.session)
-        self.questions = QuestionRepository(self.session)
-        self.answers = AnswerRepository(self.session)
-        self.participants = QuizParticipantRepository(self.session)
-        self.records = RecordsRepository(self.session)
-        self.notifications = NotificationsRepository(self.session)
+            opened = (
+                await open_replica_session()
+                if use_replica(self.readonly, wrote_to_primary.get())
+                else None
+            )
+            self._session_context, self.session = opened or await open_primary_session()
+        if self._scope is None:
+            self._token = current_unit_of_work.set(self)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._scope is not None:
+            if exc_type:
+                if self._savepoint is not None:
+                    await self._savepoint.rollback()
+                else:
+                    await self.session.rollback()
+                return
+            if not self.readonly:
+                await self.session.flush()
+            if self._savepoint is not None:
+                await self._savepoint.commit()
+            if has_written(self.session):
+                self._scope.wrote = True
+            return
+
+        current_unit_of_work.reset(self._token)
         if exc_type:
             await self.session.rollback()
-        else:
+        elif not self.readonly:
             await self.session.commit()
+            if self.session.info.pop("wrote", False):
+                wrote_to_primary.set(True)
 
         if not self._external_session:
             await self._session_context.__aexit__(exc_type, exc_val, exc_tb)
 
+        if not exc_type:
+            for callback, args in self.callbacks:
+                await callback(*args)
+
     async def commit(self):
         await self.session.commit()
 
     async def rollback(self):
         await self.session.rollback()
+
+
+async def get_unit_of_work():
+    scope = RequestScope()
+    token = request_scope.set(scope)
+    try:
+        yield UnitOfWork()
+    except Exception:
+        await scope.close(failed=True)
+        raise
+    else:
+        await scope.close(failed=False)
+    finally:
+        request_scope.reset(token)
@@ -1,9 +1,13 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from app.db.instrumentation import QueryStatsMiddleware
 from app.routers.admin_router import admin_router
 from app.routers.main_router import main_router
+from app.routers.metrics_router import metrics_router
 from app.routers.notification_router import notification_router
 from app.routers.quiz_router import quiz_router
 from app.routers.user_router import user_router
@@ -11,11 +15,26 @@ from app.routers.basic_auth_router import basic_auth_router
 from app.routers.auth_router import auth_router
 from app.routers.company_router import company_router
 from app.routers.membership_router import membership_router
+from app.utils.http_client import http_client
+from app.utils.jwks import jwks_store
+from app.utils.password import password_services
 from app.utils.settings_model import settings
 from app.routers.websocket_router import websocket_router
 from jobs.scheduler import scheduler
 
-app = FastAPI(version="1.0", description="Internship project")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    http_client.start()
+    scheduler.start()
+    jwks_store.start()
+    yield
+    await jwks_store.stop()
+    password_services.shutdown()
+    await http_client.close()
+
+
+app = FastAPI(version="1.0", description="Internship project", lifespan=lifespan)
 
 origins = [settings.REACT_URL]
 
@@ -26,9 +45,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(QueryStatsMiddleware)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 app.include_router(main_router)
+app.include_router(metrics_router)
 app.include_router(user_router)
 app.include_router(auth_router)
 app.include_router(basic_auth_router)
@@ -40,11 +61,6 @@ app.include_router(websocket_router)
 app.include_router(notification_router)
 
 
-@app.on_event("startup")
-async def start_scheduler():
-    scheduler.start()
-
-
 if __name__ == "__main__":
     import uvicorn
 
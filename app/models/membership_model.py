@@ -1,6 +1,6 @@
 from sqlalchemy import Enum
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 
 from app.models.base import Base, IDMixin, TimestampMixin
 from app.core.enums.enums import RoleEnum
@@ -8,6 +8,14 @@ from app.core.enums.enums import RoleEnum
 
 class Memberships(Base, IDMixin, TimestampMixin):
     __tablename__ = "memberships"
+    __table_args__ = (
+        Index(
+            "ix_memberships_user_id_company_id",
+            "user_id",
+            "company_id",
+            postgresql_include=["role"],
+        ),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -22,6 +30,14 @@ class Memberships(Base, IDMixin, TimestampMixin):
 
 class MembershipRequests(Base, IDMixin, TimestampMixin):
     __tablename__ = "membership_requests"
+    __table_args__ = (
+        Index(
+            "ix_membership_requests_type_company_id_user_id",
+            "type",
+            "company_id",
+            "user_id",
+        ),
+    )
 
     type: Mapped[str] = mapped_column(String(50), nullable=False)
     user_id: Mapped[int] = mapped_column(
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import ForeignKey, Integer, Enum, String
+from sqlalchemy import ForeignKey, Integer, Enum, String, Index
 
 from app.core.enums.enums import NotificationStatus
 from app.models.base import Base, IDMixin, TimestampMixin
@@ -7,6 +7,9 @@ from app.models.base import Base, IDMixin, TimestampMixin
 
 class Notification(IDMixin, TimestampMixin, Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_company_id_created_at", "company_id", "created_at"),
+    )
 
     status: Mapped[str] = mapped_column(
         Enum(NotificationStatus, name="notification_status_enum"),
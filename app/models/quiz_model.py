@@ -1,6 +1,15 @@
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, String, Integer, func, DateTime, Boolean
+from sqlalchemy import (
+    ForeignKey,
+    String,
+    Integer,
+    func,
+    DateTime,
+    Boolean,
+    UniqueConstraint,
+    Index,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, IDMixin, TimestampMixin
@@ -25,6 +34,17 @@ class Quiz(Base, IDMixin, TimestampMixin):
 
 class QuizParticipant(Base, IDMixin):
     __tablename__ = "quiz_participants"
+    __table_args__ = (
+        UniqueConstraint(
+            "quiz_id", "user_id", name="uq_quiz_participants_quiz_id_user_id"
+        ),
+        Index(
+            "ix_quiz_participants_user_id_quiz_id_completed_at",
+            "user_id",
+            "quiz_id",
+            "completed_at",
+        ),
+    )
 
     quiz_id: Mapped[int] = mapped_column(
         ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False
@@ -41,15 +61,29 @@ class QuizParticipant(Base, IDMixin):
 
 class Records(Base, IDMixin):
     __tablename__ = "records"
+    __table_args__ = (
+        Index(
+            "ix_records_participant_id", "participant_id", postgresql_include=["score"]
+        ),
+        Index("uq_records_submission_id", "submission_id", unique=True),
+    )
 
     score: Mapped[int] = mapped_column(Integer, nullable=False)
     participant_id: Mapped[int] = mapped_column(
         ForeignKey("quiz_participants.id", ondelete="CASCADE"), nullable=False
     )
+    submission_id: Mapped[str | None] = mapped_column(String(32), nullable=True)
 
 
 class SelectedAnswers(Base, IDMixin):
     __tablename__ = "selected_answers"
+    __table_args__ = (
+        Index(
+            "ix_selected_answers_record_id",
+            "record_id",
+            postgresql_include=["answer_id"],
+        ),
+    )
 
     record_id: Mapped[int] = mapped_column(
         ForeignKey("records.id", ondelete="CASCADE"), nullable=False
@@ -61,6 +95,7 @@ class SelectedAnswers(Base, IDMixin):
 
 class Question(Base, IDMixin):
     __tablename__ = "questions"
+    __table_args__ = (Index("ix_questions_quiz_id", "quiz_id"),)
 
     quiz_id: Mapped[int] = mapped_column(
         ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False
@@ -75,6 +110,7 @@ class Question(Base, IDMixin):
 
 class Answer(Base, IDMixin):
     __tablename__ = "answers"
+    __table_args__ = (Index("ix_answers_question_id", "question_id"),)
 
     text: Mapped[str] = mapped_column(String(512), nullable=False)
     question_id: Mapped[int] = mapped_column(
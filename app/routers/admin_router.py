@@ -2,14 +2,18 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Body
 
-from app.schemas.admin import AdminActionRequest
+from app.db.slow_queries import slow_query_recorder
+from app.db.unit_of_work import get_unit_of_work
+from app.schemas.admin import AdminActionRequest, SlowQueryDetail
 from app.schemas.membership import GetAllAdminsRequest
 from app.schemas.response_models import ListResponse, ResponseModel
 from app.schemas.user import MemberDetailResponse, UserSchema, UserDetailResponse
 from app.services.admin import get_admin_service, AdminServices
-from app.utils.token import token_services
+from app.utils.token import get_operator, token_services
 
-admin_router = APIRouter(tags=["Admin"], prefix="/admins")
+admin_router = APIRouter(
+    tags=["Admin"], prefix="/admins", dependencies=[Depends(get_unit_of_work)]
+)
 
 
 @admin_router.get("/", response_model=ListResponse[MemberDetailResponse])
@@ -20,7 +24,14 @@ async def get_all_admins(
         UserDetailResponse | None, Depends(token_services.get_data_from_token)
     ] = None,
 ):
-    return await admin_service.get_all_admins(data.company_id, data.limit, data.offset)
+    return await admin_service.get_all_admins(
+        data.company_id,
+        data.limit,
+        data.offset,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
+    )
 
 
 @admin_router.put("/", response_model=ResponseModel)
@@ -45,3 +56,11 @@ async def remove_admin(
 ):
     await admin_service.remove_admin(data.user_id, data.company_id)
     return ResponseModel(status_code=200, message="Removed admin successfully")
+
+
+@admin_router.get("/slow-queries", response_model=ListResponse[SlowQueryDetail])
+async def get_slow_queries(
+    _: Annotated[UserDetailResponse, Depends(get_operator)],
+):
+    items = slow_query_recorder.snapshot()
+    return ListResponse[SlowQueryDetail](items=items, count=len(items))
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, Header
 from typing import Annotated
 
-from app.schemas.response_models import MeResponseModel, AuthResponseModel
+from app.schemas.response_models import (
+    MeResponseModel,
+    AuthResponseModel,
+    ResponseModel,
+)
 from app.schemas.user import (
     SignUpRequestModel,
     SignInRequestModel,
@@ -37,3 +41,14 @@ async def get_me(
     ] = None,
 ):
     return MeResponseModel(status_code=200, me=current_user)
+
+
+@basic_auth_router.post("/logout", response_model=ResponseModel)
+async def logout(
+    authorization: str = Header(...),
+    current_user: Annotated[
+        UserDetailResponse | None, Depends(token_services.get_data_from_token)
+    ] = None,
+):
+    await token_services.revoke_token(authorization.removeprefix("Bearer "))
+    return ResponseModel(status_code=200, message="Logged out")
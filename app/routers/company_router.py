@@ -2,6 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, Header
 
+from app.db.unit_of_work import get_unit_of_work
 from app.schemas.company import (
     CompanyDetailResponse,
     GetAllCompaniesRequest,
@@ -14,7 +15,9 @@ from app.schemas.user import UserSchema, UserDetailResponse
 from app.services.company import get_company_service, CompanyServices
 from app.utils.token import token_services
 
-company_router = APIRouter(tags=["Company"], prefix="/company")
+company_router = APIRouter(
+    tags=["Company"], prefix="/company", dependencies=[Depends(get_unit_of_work)]
+)
 
 
 @company_router.get("/", response_model=ListResponse[CompanyDetailResponse])
@@ -26,7 +29,12 @@ async def get_all_companies(
     company_service: CompanyServices = Depends(get_company_service),
 ):
     return await company_service.get_all_companies(
-        data.limit, data.offset, current_user.id
+        data.limit,
+        data.offset,
+        current_user.id,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
     )
 
 
@@ -2,6 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Body
 
+from app.db.unit_of_work import get_unit_of_work
 from app.schemas.membership import (
     MembershipDetailResponse,
     SendMembershipRequest,
@@ -20,7 +21,11 @@ from app.schemas.response_models import ListResponse, ResponseModel
 from app.services.membership import get_membership_service, MembershipServices
 from app.utils.token import token_services
 
-membership_router = APIRouter(tags=["Memberships"], prefix="/memberships")
+membership_router = APIRouter(
+    tags=["Memberships"],
+    prefix="/memberships",
+    dependencies=[Depends(get_unit_of_work)],
+)
 
 
 @membership_router.get("/", response_model=MembershipDetailResponse | None)
@@ -45,7 +50,13 @@ async def get_user_requests(
     ] = None,
 ):
     return await membership_service.get_membership_requests_for_user(
-        data.request_type, data.user_id, data.limit, data.offset
+        data.request_type,
+        data.user_id,
+        data.limit,
+        data.offset,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
     )
 
 
@@ -60,7 +71,13 @@ async def get_requests_to_company(
     ] = None,
 ):
     return await membership_service.get_membership_requests_to_company(
-        data.request_type, data.company_id, data.limit, data.offset
+        data.request_type,
+        data.company_id,
+        data.limit,
+        data.offset,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
     )
 
 
@@ -73,7 +90,12 @@ async def get_companies_for_user(
     ] = None,
 ):
     return await membership_service.get_companies_for_user(
-        data.user_id, data.limit, data.offset
+        data.user_id,
+        data.limit,
+        data.offset,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
     )
 
 
@@ -86,7 +108,12 @@ async def get_users_in_company(
     ] = None,
 ):
     return await membership_service.get_users_in_company(
-        data.company_id, data.limit, data.offset
+        data.company_id,
+        data.limit,
+        data.offset,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
     )
 
 
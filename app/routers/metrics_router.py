@@ -0,0 +1,47 @@
+import logging
+
+from fastapi import APIRouter, Depends
+
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.db.postgres_init import engine, replica_pool
+from app.db.redis_init import get_redis_client, redis_breaker
+from app.db.repositories.base_repository import count_cache
+from app.db.repositories.redis.submission_stream_repository import (
+    SubmissionStreamRepository,
+)
+from app.schemas.metrics import MetricsResponse
+from app.utils.password import password_services
+from app.utils.principal_cache import principal_cache
+from app.utils.settings_model import settings
+from app.utils.token import get_operator, verified_tokens
+
+logger = logging.getLogger(__name__)
+
+metrics_router = APIRouter(
+    tags=["metrics"], prefix="/metrics", dependencies=[Depends(get_operator)]
+)
+
+
+async def get_submission_stats():
+    if not settings.submission.QUIZ_SUBMIT_ASYNC:
+        return None
+    try:
+        return await SubmissionStreamRepository(get_redis_client()).stats()
+    except RedisRepositoryError as e:
+        logger.error(f"Redis error: {e}")
+        return None
+
+
+@metrics_router.get("/", response_model=MetricsResponse)
+async def get_metrics():
+    return MetricsResponse(
+        status_code=200,
+        db_pool=engine.pool.stats(),
+        db_replicas=replica_pool.stats(),
+        password_pool=password_services.stats(),
+        token_cache=verified_tokens.stats(),
+        principal_cache=principal_cache.local.stats(),
+        count_cache=count_cache.stats(),
+        redis_breaker=redis_breaker.stats(),
+        submissions=await get_submission_stats(),
+    )
@@ -3,6 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter
 from fastapi.params import Depends
 
+from app.db.unit_of_work import get_unit_of_work
 from app.schemas.notification import (
     NotificationDetailResponse,
     GetAllNotificationsRequest,
@@ -12,7 +13,11 @@ from app.schemas.user import UserDetailResponse
 from app.services.notification import NotificationService, get_notification_service
 from app.utils.token import token_services
 
-notification_router = APIRouter(tags=["Notifications"], prefix="/notifications")
+notification_router = APIRouter(
+    tags=["Notifications"],
+    prefix="/notifications",
+    dependencies=[Depends(get_unit_of_work)],
+)
 
 
 @notification_router.get("/", response_model=ListResponse[NotificationDetailResponse])
@@ -24,7 +29,12 @@ async def get_notifications(
     ] = None,
 ):
     return await notification_service.get_all_notifications(
-        user_id=current_user.id, limit=data.limit, offset=data.offset
+        user_id=current_user.id,
+        limit=data.limit,
+        offset=data.offset,
+        cursor=data.cursor,
+        use_cursor=data.use_cursor,
+        count_mode=data.count_mode,
     )
 
 
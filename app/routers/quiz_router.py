@@ -1,13 +1,15 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Body, Response, status
 
+from app.db.unit_of_work import get_unit_of_work
 from app.core.enums.enums import FileFormat
 from app.schemas.quiz import (
     GetAllQuizzesRequest,
     QuizDetailResponse,
     QuizWithQuestionsSchema,
     QuizSubmitRequest,
+    QuizSubmitResponse,
     QuizWithQuestionsDetailResponse,
     QuizAverageResponse,
     QuizAverageRequest,
@@ -17,9 +19,12 @@ from app.schemas.response_models import ListResponse, ResponseModel
 from app.schemas.user import UserDetailResponse
 from app.services.export_service import get_export_service, ExportService
 from app.services.quiz import get_quiz_service, QuizServices
+from app.utils.settings_model import settings
 from app.utils.token import token_services
 
-quiz_router = APIRouter(tags=["Quizzes"], prefix="/quizzes")
+quiz_router = APIRouter(
+    tags=["Quizzes"], prefix="/quizzes", dependencies=[Depends(get_unit_of_work)]
+)
 
 
 @quiz_router.get("/", response_model=ListResponse[QuizDetailResponse])
@@ -31,7 +36,13 @@ async def get_all_quizzes(
     quiz_service: QuizServices = Depends(get_quiz_service),
 ):
     return await quiz_service.get_all_quizzes(
-        data.company_id, data.limit, data.offset, current_user.id
+        data.company_id,
+        data.limit,
+        data.offset,
+        current_user.id,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
     )
 
 
@@ -112,16 +123,23 @@ async def update_quiz(
     return ResponseModel(status_code=200, message="Created quiz")
 
 
-@quiz_router.post("/submit/{quiz_id}", response_model=ResponseModel)
+@quiz_router.post("/submit/{quiz_id}", response_model=QuizSubmitResponse)
 async def quiz_submit(
+    response: Response,
     data: QuizSubmitRequest = Body(...),
     quiz_service: QuizServices = Depends(get_quiz_service),
     current_user: Annotated[
         UserDetailResponse | None, Depends(token_services.get_data_from_token)
     ] = None,
 ):
+    if settings.submission.QUIZ_SUBMIT_ASYNC:
+        submission_id = await quiz_service.enqueue_submission(data, current_user.id)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return QuizSubmitResponse(
+            status_code=202, message="Accepted submission", submission_id=submission_id
+        )
     await quiz_service.quiz_submit(data, current_user.id)
-    return ResponseModel(status_code=200, message="Submitted quiz")
+    return QuizSubmitResponse(status_code=200, message="Submitted quiz")
 
 
 @quiz_router.delete("/{quiz_id}", response_model=ResponseModel)
@@ -2,6 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Form, UploadFile, File
 
+from app.db.unit_of_work import get_unit_of_work
 from app.services.user import get_user_service, UserServices
 from app.utils.token import token_services
 from app.schemas.user import (
@@ -12,7 +13,9 @@ from app.schemas.user import (
 )
 from app.schemas.response_models import ResponseModel, ListResponse
 
-user_router = APIRouter(tags=["User CRUD"], prefix="/users")
+user_router = APIRouter(
+    tags=["User CRUD"], prefix="/users", dependencies=[Depends(get_unit_of_work)]
+)
 
 
 @user_router.get("/{user_id}", response_model=UserDetailResponse)
@@ -31,7 +34,13 @@ async def get_all_users_endpoint(
     data: GetAllUsersRequestModel = Depends(),
     user_service: UserServices = Depends(get_user_service),
 ):
-    return await user_service.get_all_users(data.limit, data.offset)
+    return await user_service.get_all_users(
+        data.limit,
+        data.offset,
+        data.cursor,
+        data.use_cursor,
+        data.count_mode,
+    )
 
 
 @user_router.post("/", response_model=ResponseModel)
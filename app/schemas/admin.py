@@ -4,3 +4,14 @@ from pydantic import BaseModel
 class AdminActionRequest(BaseModel):
     user_id: int
     company_id: int
+
+
+class SlowQueryDetail(BaseModel):
+    statement: str
+    calls: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+    last_seen: float
+    parameters: list[str] | dict[str, str] | str | None = None
+    plan: list | dict | None = None
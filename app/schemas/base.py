@@ -1,6 +1,8 @@
 from datetime import datetime
 from pydantic import BaseModel
 
+from app.core.enums.enums import CountMode
+
 
 class IDMixin(BaseModel):
     id: int
@@ -14,3 +16,6 @@ class TimestampMixin(BaseModel):
 class PaginationMixin(BaseModel):
     limit: int | None = None
     offset: int | None = None
+    cursor: str | None = None
+    use_cursor: bool = False
+    count_mode: CountMode = CountMode.EXACT
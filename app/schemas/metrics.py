@@ -0,0 +1,56 @@
+from pydantic import BaseModel
+
+
+class DBPoolMetrics(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    wait_time_avg_ms: float
+    wait_time_max_ms: float
+
+
+class DBReplicaMetrics(BaseModel):
+    available: bool
+    pool: DBPoolMetrics
+
+
+class PasswordPoolMetrics(BaseModel):
+    workers: int
+    queued: int
+    running: int
+
+
+class CacheMetrics(BaseModel):
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+
+
+class SubmissionStreamMetrics(BaseModel):
+    length: int
+    pending: int
+    lag: int
+    dead_letters: int
+
+
+class CircuitBreakerMetrics(BaseModel):
+    state: str
+    failures: int
+    opened: int
+    rejected: int
+    timeouts: int
+
+
+class MetricsResponse(BaseModel):
+    status_code: int
+    db_pool: DBPoolMetrics
+    db_replicas: list[DBReplicaMetrics]
+    password_pool: PasswordPoolMetrics
+    token_cache: CacheMetrics
+    principal_cache: CacheMetrics
+    count_cache: CacheMetrics
+    redis_breaker: CircuitBreakerMetrics
+    submissions: SubmissionStreamMetrics | None = None
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from app.core.enums.enums import NotificationStatus
+from app.core.enums.enums import CountMode, NotificationStatus
 from app.schemas.base import IDMixin
 
 
@@ -21,3 +21,6 @@ class NotificationDetailResponse(IDMixin, NotificationSchema, BaseModel):
 class GetAllNotificationsRequest(BaseModel):
     limit: int
     offset: int
+    cursor: str | None = None
+    use_cursor: bool = False
+    count_mode: CountMode = CountMode.EXACT
@@ -3,7 +3,8 @@ from datetime import datetime, date
 from pydantic import BaseModel, ConfigDict, model_validator
 
 from app.core.exceptions.exceptions import BadRequestException
-from app.schemas.base import IDMixin
+from app.schemas.base import IDMixin, PaginationMixin
+from app.schemas.response_models import ResponseModel
 
 
 class QuizSchema(BaseModel):
@@ -94,6 +95,7 @@ class QuizParticipantCreateSchema(BaseModel):
 class RecordCreateSchema(BaseModel):
     participant_id: int
     score: int
+    submission_id: str | None = None
 
 
 class QuizUpdateSchema(BaseModel):
@@ -115,10 +117,8 @@ class QuizParticipantUpdateSchema(BaseModel):
     completed_at: datetime | None = None
 
 
-class GetAllQuizzesRequest(BaseModel):
+class GetAllQuizzesRequest(PaginationMixin, BaseModel):
     company_id: int | None = None
-    limit: int | None = None
-    offset: int | None = None
 
 
 class AllQuizzesResponse(BaseModel):
@@ -141,6 +141,19 @@ class QuizSubmitRequest(BaseModel):
     questions: list[QuestionID]
 
 
+class QuizSubmissionSchema(BaseModel):
+    submission_id: str
+    quiz_id: int
+    company_id: int
+    user_id: int
+    score: int
+    answer_ids: list[int]
+
+
+class QuizSubmitResponse(ResponseModel):
+    submission_id: str | None = None
+
+
 class QuizScoreItem(BaseModel):
     title: str
     description: str | None = None
@@ -31,4 +31,5 @@ class MeResponseModel(BaseModel):
 
 class ListResponse(GenericModel, Generic[T]):
     items: list[T]
-    count: int
+    count: int | None = None
+    next_cursor: str | None = None
@@ -2,7 +2,7 @@ import logging
 
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.enums.enums import RoleEnum
+from app.core.enums.enums import RoleEnum, CountMode
 from app.core.exceptions.exceptions import (
     AppException,
     NotFoundException,
@@ -68,11 +68,14 @@ class AdminServices:
         company_id: int,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                items, total_count = await uow.users.get_all_admins(
-                    company_id, limit, offset
+                items, total_count, next_cursor = await uow.users.get_all_admins(
+                    company_id, limit, offset, cursor, use_cursor, count_mode
                 )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
@@ -91,7 +94,9 @@ class AdminServices:
                 for user in items
             ]
             logger.info(items)
-            return ListResponse[MemberDetailResponse](items=items, count=total_count)
+            return ListResponse[MemberDetailResponse](
+                items=items, count=total_count, next_cursor=next_cursor
+            )
 
 
 def get_admin_service() -> AdminServices:
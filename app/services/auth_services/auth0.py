@@ -1,5 +1,4 @@
 import logging
-import httpx
 import os
 import aiofiles
 
@@ -12,6 +11,7 @@ from app.core.exceptions.exceptions import (
 )
 from app.schemas.response_models import ResponseModel
 from app.services.user import get_user_service, UserServices
+from app.utils.http_client import http_client
 from app.utils.settings_model import settings
 
 logger = logging.getLogger(__name__)
@@ -54,8 +54,7 @@ class Auth0UserServices:
             "scope": "openid profile email",
             "connection": "Username-Password-Authentication",
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload)
+        response = await http_client.post(url, idempotent=True, json=payload)
         if response.status_code != 200:
             logger.error("Auth0 login failed: %s", response.text)
         return response.json()
@@ -74,8 +73,7 @@ class Auth0UserServices:
             "password": password,
             "connection": "Username-Password-Authentication",
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload)
+        response = await http_client.post(url, json=payload)
         if response.status_code != 200:
             response = response.json()
             if response.get("code") == "invalid_signup":
@@ -17,11 +17,19 @@ class BasicAuthServices:
         )
 
     async def login(self, email: str, password: str):
-        user = await self.user_service.get_user_by_email(email)
-        if password_services.check_password(password, user.password):
-            token = token_services.create_access_token(user.id)
-            return AuthResponseModel(status_code=200, message="Logged in", token=token)
-        raise UnauthorizedException(detail="Wrong password.")
+        user_id, hashed_password = await self.user_service.get_credentials_by_email(
+            email
+        )
+        if not hashed_password or not await password_services.check_password_async(
+            password, hashed_password
+        ):
+            raise UnauthorizedException(detail="Wrong password.")
+        if password_services.needs_rehash(hashed_password):
+            await self.user_service.update_password_hash(
+                user_id, await password_services.hash_password_async(password)
+            )
+        token = token_services.create_access_token(user_id)
+        return AuthResponseModel(status_code=200, message="Logged in", token=token)
 
 
 def get_basic_auth_service() -> BasicAuthServices:
@@ -1,6 +1,7 @@
 import logging
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError, DataError
 
+from app.core.enums.enums import CountMode
 from app.core.exceptions.repository_exceptions import (
     RepositoryDatabaseError,
     RepositoryIntegrityError,
@@ -72,23 +73,32 @@ class CompanyServices:
         limit: int | None = None,
         offset: int | None = None,
         current_user_id: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             if current_user_id is not None:
                 try:
                     (
                         items,
                         total_count,
+                        next_cursor,
                     ) = await uow.companies.get_all_companies_for_owner(
-                        limit, offset, current_user_id
+                        limit, offset, current_user_id, cursor, use_cursor, count_mode
                     )
                 except RepositoryDatabaseError as e:
                     logger.error(f"SQLAlchemyError: {e}")
                     raise AppException(detail="Database exception occurred.")
             else:
                 try:
-                    items, total_count = await uow.companies.get_all(
-                        filters={"private": False}, limit=limit, offset=offset
+                    items, total_count, next_cursor = await uow.companies.get_all(
+                        filters={"private": False},
+                        limit=limit,
+                        offset=offset,
+                        cursor=cursor,
+                        use_cursor=use_cursor,
+                        count_mode=count_mode,
                     )
                 except RepositoryDatabaseError as e:
                     logger.error(f"SQLAlchemyError: {e}")
@@ -105,6 +115,7 @@ class CompanyServices:
                     for company in items
                 ],
                 count=total_count,
+                next_cursor=next_cursor,
             )
             logger.info("Fetched companies")
             logger.info(companies)
@@ -132,7 +143,7 @@ class CompanyServices:
     async def get_company_by_id(
         self, company_id: int, current_user_id: int, current_user_email: str
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             return await self.get_company_by_id_with_uow(
                 company_id, uow, current_user_id, current_user_email
             )
@@ -13,7 +13,7 @@ from app.core.exceptions.exceptions import (
     UnauthorizedException,
     BadRequestException,
 )
-from app.core.enums.enums import RoleEnum
+from app.core.enums.enums import RoleEnum, CountMode
 from app.schemas.company import CompanyDetailResponse
 from app.schemas.membership import (
     MembershipRequestSchema,
@@ -138,25 +138,28 @@ class MembershipServices:
         user_id: int,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                membership_requests = (
-                    await uow.membership_requests.get_membership_requests_for_user(
-                        request_type, user_id, limit, offset
-                    )
+                (
+                    membership_requests,
+                    total_count,
+                    next_cursor,
+                ) = await uow.membership_requests.get_membership_requests_for_user(
+                    request_type, user_id, limit, offset, cursor, use_cursor, count_mode
                 )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
             company_ids = [request.company_id for request in membership_requests]
             if not company_ids:
-                items, total_count = [], 0
+                items = []
             else:
                 try:
-                    items, total_count = await uow.companies.get_companies_by_ids(
-                        company_ids
-                    )
+                    items = await uow.companies.get_companies_by_ids(company_ids)
                 except RepositoryDatabaseError as e:
                     logger.error(f"SQLAlchemyError: {e}")
                     raise AppException(detail="Database exception occurred.")
@@ -172,6 +175,7 @@ class MembershipServices:
                     for company in items
                 ],
                 count=total_count,
+                next_cursor=next_cursor,
             )
 
     @staticmethod
@@ -180,14 +184,24 @@ class MembershipServices:
         company_id: int,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
                 (
                     items,
                     total_count,
+                    next_cursor,
                 ) = await uow.membership_requests.get_membership_requests_to_company(
-                    request_type, company_id, limit, offset
+                    request_type,
+                    company_id,
+                    limit,
+                    offset,
+                    cursor,
+                    use_cursor,
+                    count_mode,
                 )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
@@ -229,6 +243,7 @@ class MembershipServices:
                     for user in items
                 ],
                 count=total_count,
+                next_cursor=next_cursor,
             )
 
     @staticmethod
@@ -236,11 +251,18 @@ class MembershipServices:
         user_id: int,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                items, total_count = await uow.companies.get_companies_for_user(
-                    user_id, limit, offset
+                (
+                    items,
+                    total_count,
+                    next_cursor,
+                ) = await uow.companies.get_companies_for_user(
+                    user_id, limit, offset, cursor, use_cursor, count_mode
                 )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
@@ -256,18 +278,23 @@ class MembershipServices:
                 )
                 for company in items
             ]
-            return ListResponse[CompanyDetailResponse](items=items, count=total_count)
+            return ListResponse[CompanyDetailResponse](
+                items=items, count=total_count, next_cursor=next_cursor
+            )
 
     @staticmethod
     async def get_users_in_company(
         company_id: int,
         limit: int | None = None,
         offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                items, total_count = await uow.users.get_users_in_company(
-                    company_id, limit, offset
+                items, total_count, next_cursor = await uow.users.get_users_in_company(
+                    company_id, limit, offset, cursor, use_cursor, count_mode
                 )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
@@ -287,7 +314,9 @@ class MembershipServices:
                 )
                 for user in items
             ]
-            return ListResponse[MemberDetailResponse](items=items, count=total_count)
+            return ListResponse[MemberDetailResponse](
+                items=items, count=total_count, next_cursor=next_cursor
+            )
 
 
 def get_membership_service() -> MembershipServices:
@@ -1,6 +1,6 @@
 import logging
 
-from app.core.enums.enums import NotificationStatus
+from app.core.enums.enums import NotificationStatus, CountMode
 from app.core.exceptions.exceptions import (
     AppException,
     NotFoundException,
@@ -21,12 +21,26 @@ logger = logging.getLogger(__name__)
 class NotificationService:
     @staticmethod
     async def get_all_notifications(
-        user_id: int, limit: int | None, offset: int | None
+        user_id: int,
+        limit: int | None,
+        offset: int | None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                items, total_count = await uow.notifications.get_all_notifications(
-                    user_id=user_id, limit=limit, offset=offset
+                (
+                    items,
+                    total_count,
+                    next_cursor,
+                ) = await uow.notifications.get_all_notifications(
+                    user_id=user_id,
+                    limit=limit,
+                    offset=offset,
+                    cursor=cursor,
+                    use_cursor=use_cursor,
+                    count_mode=count_mode,
                 )
                 notifications = [
                     NotificationDetailResponse(
@@ -38,7 +52,7 @@ class NotificationService:
                     for notification in items
                 ]
                 return ListResponse[NotificationDetailResponse](
-                    items=notifications, count=total_count
+                    items=notifications, count=total_count, next_cursor=next_cursor
                 )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemy error: {e}")
@@ -1,11 +1,13 @@
 import datetime
 import logging
+import uuid
 from sqlite3 import IntegrityError, DataError
 
 from redis.exceptions import RedisError
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.enums.enums import RoleEnum, QuizActions, NotificationStatus
+from app.core.enums.enums import RoleEnum, QuizActions, NotificationStatus, CountMode
 from app.core.exceptions.exceptions import (
     AppException,
     NotFoundException,
@@ -16,14 +18,16 @@ from app.core.exceptions.repository_exceptions import (
     RepositoryIntegrityError,
     RepositoryDataError,
     RepositoryDatabaseError,
-    RedisRepositoryScanError,
-    RedisRepositoryMultipleFetchError,
     RedisRepositoryError,
 )
 from app.db.redis_init import get_redis_client
+from app.db.repositories.redis.codecs import RECORD_FIELDS
 from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
-from app.db.unit_of_work import UnitOfWork
-from app.models.quiz_model import SelectedAnswers
+from app.db.repositories.redis.submission_stream_repository import (
+    SubmissionStreamRepository,
+)
+from app.db.unit_of_work import UnitOfWork, after_commit
+from app.models.quiz_model import QuizParticipant
 from app.schemas.notification import NotificationSchema
 from app.schemas.quiz import (
     QuizWithQuestionsSchema,
@@ -33,13 +37,12 @@ from app.schemas.quiz import (
     QuizUpdateSchema,
     QuizParticipantCreateSchema,
     RecordCreateSchema,
-    QuizParticipantUpdateSchema,
     QuizSubmitRequest,
+    QuizSubmissionSchema,
     QuizWithQuestionsDetailResponse,
     QuestionWithAnswersDetailResponse,
     AnswerDetailResponse,
     QuizDetailResponse,
-    QuizParticipantDetailResponse,
     QuizAverageResponse,
     QuizScoreItem,
     UpdatedQuestionSchema,
@@ -51,6 +54,13 @@ from app.websocket.manager import get_manager
 logger = logging.getLogger(__name__)
 
 
+async def cache_submitted_answers(answers_data: list[dict]):
+    try:
+        await QuizRedisRepository(get_redis_client()).save_answers(answers_data)
+    except RedisRepositoryError as e:
+        logger.warning(f"Failed to cache submitted answers: {e}")
+
+
 class QuizServices:
     @staticmethod
     async def create_quiz(company_id: int, quiz: QuizWithQuestionsSchema):
@@ -71,7 +81,7 @@ class QuizServices:
                     ).model_dump()
                     for question in quiz.questions
                 ]
-                question_ids = await uow.questions.create_many(questions_data)
+                question_ids = await uow.questions.bulk_create(questions_data)
                 answers_data = []
                 for question, question_id in zip(quiz.questions, question_ids):
                     for answer in question.answers:
@@ -82,7 +92,7 @@ class QuizServices:
                                 question_id=question_id,
                             ).model_dump()
                         )
-                await uow.answers.create_many(answers_data)
+                await uow.answers.bulk_create(answers_data, returning=False)
 
                 company = await uow.companies.get_one(id=company_id)
                 message = f"New test with name {quiz.title} has been added to company {company.name}"
@@ -109,7 +119,7 @@ class QuizServices:
 
     @staticmethod
     async def get_quiz_by_id(quiz_id: int, company_id: int):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
                 quiz = await uow.quizzes.get_quiz_by_id(
                     quiz_id=quiz_id, company_id=company_id
@@ -145,11 +155,20 @@ class QuizServices:
         limit: int | None = None,
         offset: int | None = None,
         current_user_id: int = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                items, total_count = await uow.quizzes.get_all_quizzes(
-                    current_user_id, company_id, limit, offset
+                items, total_count, next_cursor = await uow.quizzes.get_all_quizzes(
+                    current_user_id,
+                    company_id,
+                    limit,
+                    offset,
+                    cursor,
+                    use_cursor,
+                    count_mode,
                 )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
@@ -166,7 +185,9 @@ class QuizServices:
                 for quiz in items
             ]
 
-            return ListResponse[QuizDetailResponse](items=items, count=total_count)
+            return ListResponse[QuizDetailResponse](
+                items=items, count=total_count, next_cursor=next_cursor
+            )
 
     @staticmethod
     async def update_quiz(
@@ -273,67 +294,70 @@ class QuizServices:
             logger.info(f"Deleted quiz id: {quiz_id}")
 
     @staticmethod
-    async def quiz_submit(data: QuizSubmitRequest, current_user_id: int):
+    async def validate_submission(
+        data: QuizSubmitRequest, current_user_id: int, uow: UnitOfWork
+    ):
+        if current_user_id != data.user_id:
+            raise ForbiddenException(detail="You cannot submit a quiz for another user")
+        submitted = {
+            (question.id, answer.id)
+            for question in data.questions
+            for answer in question.answers
+        }
+        try:
+            quiz = await uow.quizzes.get_one(
+                id=data.quiz_id, company_id=data.company_id
+            )
+            membership = await uow.memberships.get_one(
+                user_id=data.user_id, company_id=data.company_id
+            )
+            answers = await uow.answers.get_quiz_answers(
+                data.quiz_id, [answer_id for _, answer_id in submitted]
+            )
+        except RepositoryDatabaseError as e:
+            logger.error(f"SQLAlchemyError: {e}")
+            raise AppException(detail="Database exception occurred.")
+        if not quiz:
+            raise NotFoundException(detail=f"Quiz with ID {data.quiz_id} not found")
+        if not membership:
+            raise ForbiddenException(detail="You are not a member of this company")
+        if not submitted <= answers:
+            raise BadRequestException(detail="Answers do not belong to this quiz")
+
+    @staticmethod
+    async def quiz_submit(
+        data: QuizSubmitRequest,
+        current_user_id: int,
+        submission_id: str | None = None,
+    ):
         async with UnitOfWork() as uow:
-            if current_user_id != data.user_id:
-                raise ForbiddenException(
-                    detail="You cannot submit a quiz for another user"
-                )
+            await QuizServices.validate_submission(data, current_user_id, uow)
             try:
-                result = await uow.participants.get_one(
-                    quiz_id=data.quiz_id, user_id=data.user_id
+                participant_id = await uow.participants.upsert(
+                    QuizParticipantCreateSchema(
+                        quiz_id=data.quiz_id, user_id=data.user_id
+                    ).model_dump(),
+                    conflict_columns=["quiz_id", "user_id"],
+                    update_values={"completed_at": func.now()},
+                )
+            except RepositoryIntegrityError as e:
+                logger.error(f"IntegrityError: {e}")
+                raise BadRequestException(
+                    detail="Failed to create participant. Wrong data"
                 )
+            except RepositoryDataError as e:
+                logger.error(f"Data error: {e}")
+                raise BadRequestException(detail="Invalid format or length of fields")
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
-            if not result:
-                try:
-                    participant_id = await uow.participants.create(
-                        QuizParticipantCreateSchema(
-                            quiz_id=data.quiz_id, user_id=data.user_id
-                        ).model_dump()
-                    )
-                except RepositoryIntegrityError as e:
-                    logger.error(f"IntegrityError: {e}")
-                    raise BadRequestException(
-                        detail="Failed to create participant. Wrong data"
-                    )
-                except RepositoryDataError as e:
-                    logger.error(f"Data error: {e}")
-                    raise BadRequestException(
-                        detail="Invalid format or length of fields"
-                    )
-                except RepositoryDatabaseError as e:
-                    logger.error(f"SQLAlchemyError: {e}")
-                    raise AppException(detail="Database exception occurred.")
-                logger.info(f"Created quiz participant")
-            else:
-                participant = QuizParticipantDetailResponse.model_validate(result)
-                participant_id = participant.id
-                try:
-                    await uow.participants.update(
-                        id=participant_id,
-                        data=QuizParticipantUpdateSchema(
-                            completed_at=datetime.datetime.now()
-                        ).model_dump(),
-                    )
-                except RepositoryIntegrityError as e:
-                    logger.error(f"IntegrityError: {e}")
-                    raise BadRequestException(
-                        detail="Failed to update participant. Wrong data"
-                    )
-                except RepositoryDataError as e:
-                    logger.error(f"Data error: {e}")
-                    raise BadRequestException(
-                        detail="Invalid format or length of fields"
-                    )
-                except RepositoryDatabaseError as e:
-                    logger.error(f"SQLAlchemyError: {e}")
-                    raise AppException(detail="Database exception occurred.")
+            logger.info(f"Saved quiz participant")
             try:
                 record_id = await uow.records.create(
                     RecordCreateSchema(
-                        participant_id=participant_id, score=data.score
+                        participant_id=participant_id,
+                        score=data.score,
+                        submission_id=submission_id,
                     ).model_dump()
                 )
             except RepositoryIntegrityError as e:
@@ -345,13 +369,16 @@ class QuizServices:
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
-            selected_answers = [
-                SelectedAnswers(record_id=record_id, answer_id=answer.id)
-                for question in data.questions
-                for answer in question.answers
+            answer_ids = [
+                answer.id for question in data.questions for answer in question.answers
             ]
             try:
-                answer_ids = await uow.answers.create_selected_answers(selected_answers)
+                await uow.answers.create_selected_answers(
+                    [
+                        {"record_id": record_id, "answer_id": answer_id}
+                        for answer_id in answer_ids
+                    ]
+                )
             except RepositoryIntegrityError as e:
                 logger.error(f"IntegrityError: {e}")
                 raise BadRequestException(
@@ -364,7 +391,6 @@ class QuizServices:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
 
-            quiz_redis_repo = QuizRedisRepository(get_redis_client())
             answers_data = [
                 {
                     "quiz_id": data.quiz_id,
@@ -376,13 +402,121 @@ class QuizServices:
                 }
                 for answer_id in answer_ids
             ]
-            try:
-                await quiz_redis_repo.save_answers(answers_data)
-            except RedisRepositoryError as e:
-                logger.error(f"Redis error: {e}")
-                raise AppException(detail="Cache exception occurred.")
+            await after_commit(cache_submitted_answers, answers_data)
             return participant_id, record_id, answer_ids
 
+    @staticmethod
+    async def enqueue_submission(data: QuizSubmitRequest, current_user_id: int):
+        async with UnitOfWork() as uow:
+            await QuizServices.validate_submission(data, current_user_id, uow)
+        submission = QuizSubmissionSchema(
+            submission_id=uuid.uuid4().hex,
+            quiz_id=data.quiz_id,
+            company_id=data.company_id,
+            user_id=data.user_id,
+            score=data.score,
+            answer_ids=[
+                answer.id for question in data.questions for answer in question.answers
+            ],
+        )
+        try:
+            await SubmissionStreamRepository(get_redis_client()).add(
+                submission.model_dump()
+            )
+        except RedisRepositoryError as e:
+            logger.warning(f"Failed to queue submission, saving it directly: {e}")
+            await QuizServices.quiz_submit(
+                data, current_user_id, submission.submission_id
+            )
+            return submission.submission_id
+        logger.info(f"Queued submission {submission.submission_id}")
+        return submission.submission_id
+
+    @staticmethod
+    async def save_submissions(submissions: list[QuizSubmissionSchema]):
+        async with UnitOfWork() as uow:
+            try:
+                existing = await uow.records.get_existing_submission_ids(
+                    [submission.submission_id for submission in submissions]
+                )
+                pending = list(
+                    {
+                        submission.submission_id: submission
+                        for submission in submissions
+                        if submission.submission_id not in existing
+                    }.values()
+                )
+                if not pending:
+                    return []
+                participants = await uow.participants.upsert_many(
+                    [
+                        QuizParticipantCreateSchema(
+                            quiz_id=quiz_id, user_id=user_id
+                        ).model_dump()
+                        for quiz_id, user_id in {
+                            (submission.quiz_id, submission.user_id)
+                            for submission in pending
+                        }
+                    ],
+                    conflict_columns=["quiz_id", "user_id"],
+                    update_values={"completed_at": func.now()},
+                    returning=[
+                        QuizParticipant.id,
+                        QuizParticipant.quiz_id,
+                        QuizParticipant.user_id,
+                    ],
+                )
+                participant_ids = {
+                    (quiz_id, user_id): participant_id
+                    for participant_id, quiz_id, user_id in participants
+                }
+                record_ids = await uow.records.create_records(
+                    [
+                        RecordCreateSchema(
+                            participant_id=participant_ids[
+                                (submission.quiz_id, submission.user_id)
+                            ],
+                            score=submission.score,
+                            submission_id=submission.submission_id,
+                        ).model_dump()
+                        for submission in pending
+                    ]
+                )
+                await uow.answers.create_selected_answers(
+                    [
+                        {
+                            "record_id": record_ids[submission.submission_id],
+                            "answer_id": answer_id,
+                        }
+                        for submission in pending
+                        for answer_id in submission.answer_ids
+                    ]
+                )
+            except RepositoryIntegrityError as e:
+                logger.error(f"IntegrityError: {e}")
+                raise BadRequestException(detail="Failed to save submissions.")
+            except RepositoryDataError as e:
+                logger.error(f"Data error: {e}")
+                raise BadRequestException(detail="Invalid format or length of fields")
+            except RepositoryDatabaseError as e:
+                logger.error(f"SQLAlchemyError: {e}")
+                raise AppException(detail="Database exception occurred.")
+            logger.info(f"Saved {len(pending)} queued submissions")
+            return [
+                {
+                    "quiz_id": submission.quiz_id,
+                    "company_id": submission.company_id,
+                    "answer_id": answer_id,
+                    "participant_id": participant_ids[
+                        (submission.quiz_id, submission.user_id)
+                    ],
+                    "user_id": submission.user_id,
+                    "record_id": record_ids[submission.submission_id],
+                }
+                for submission in pending
+                for answer_id in submission.answer_ids
+            ]
+
     @staticmethod
     async def get_average_score_in_company(
         user_id: int,
@@ -398,10 +532,11 @@ class QuizServices:
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
-            if membership.role != RoleEnum.ADMIN and membership.role != RoleEnum.OWNER:
-                raise ForbiddenException(detail="You dont have permissions for this")
-            if from_date and to_date and from_date > to_date:
-                raise BadRequestException(detail="Start date must be before end date")
+        if membership.role != RoleEnum.ADMIN and membership.role != RoleEnum.OWNER:
+            raise ForbiddenException(detail="You dont have permissions for this")
+        if from_date and to_date and from_date > to_date:
+            raise BadRequestException(detail="Start date must be before end date")
+        async with UnitOfWork(readonly=True) as uow:
             try:
                 scores = await uow.records.get_average_score_in_company(
                     user_id, company_id, from_date, to_date
@@ -429,7 +564,7 @@ class QuizServices:
         from_date: datetime.date = None,
         to_date: datetime.date = None,
     ):
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
                 scores = await uow.records.get_average_score_in_system(
                     user_id, from_date, to_date
@@ -458,54 +593,63 @@ class QuizServices:
         company_id: int = None,
         current_user_id: int = None,
     ):
-        async with UnitOfWork() as uow:
-            user_id = user_id if user_id is not None else current_user_id
-            quiz_redis_repo = QuizRedisRepository(get_redis_client())
+        user_id = user_id if user_id is not None else current_user_id
+        cache = QuizRedisRepository(get_redis_client())
+        try:
+            answers = await cache.get_answers_for_user(user_id, quiz_id, company_id)
+        except RedisRepositoryError as e:
+            logger.warning(f"Failed to read cached answers: {e}")
+            answers = None
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                answers = await quiz_redis_repo.get_answers_for_user(
-                    user_id, quiz_id, company_id
-                )
-            except RedisRepositoryScanError as e:
-                logger.error(f"Redis scan failed: {e}")
-                raise AppException("Cache scan operation failed")
-            except RedisRepositoryMultipleFetchError as e:
-                logger.error(f"Redis mget failed: {e}")
-                raise AppException("Cache get operation failed")
-            answer_ids = [answer["answer_id"] for answer in answers]
-            answers = list(answers)
-            try:
-                missing_answers = await uow.answers.get_missing_answers(
-                    answer_ids, user_id, quiz_id, company_id
-                )
+                if answers is not None:
+                    details = {
+                        row.answer_id: row
+                        for row in await uow.quizzes.get_answer_details(
+                            [answer["answer_id"] for answer in answers]
+                        )
+                    }
+                    result = [
+                        details[answer["answer_id"]]
+                        for answer in answers
+                        if answer["answer_id"] in details
+                    ]
+                else:
+                    result = await uow.quizzes.get_quiz_history_for_user(user_id)
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
-            answers.extend(
-                [
-                    {
-                        "answer_id": answer.id,
-                    }
-                    for answer in missing_answers
-                ]
-            )
+        if answers is None:
             try:
-                result = await uow.quizzes.get_full_quiz_data_for_user(
-                    [answer["answer_id"] for answer in answers]
+                await cache.load_answers(
+                    user_id,
+                    [
+                        {
+                            field: getattr(row, field)
+                            for field in (*RECORD_FIELDS, "answer_id")
+                        }
+                        for row in result
+                    ],
                 )
-            except RepositoryDatabaseError as e:
-                logger.error(f"SQLAlchemyError: {e}")
-                raise AppException(detail="Database exception occurred.")
-            quiz_data = [
-                {
-                    "quiz_title": answer.quiz_title,
-                    "quiz_description": answer.quiz_description,
-                    "question_text": answer.question_text,
-                    "answer_text": answer.answer_text,
-                    "is_correct": answer.is_correct,
-                }
-                for answer in result
+            except RedisRepositoryError as e:
+                logger.warning(f"Failed to cache answers: {e}")
+            result = [
+                row
+                for row in result
+                if (not quiz_id or row.quiz_id == quiz_id)
+                and (not company_id or row.company_id == company_id)
             ]
-            return quiz_data
+        quiz_data = [
+            {
+                "quiz_title": answer.quiz_title,
+                "quiz_description": answer.quiz_description,
+                "question_text": answer.question_text,
+                "answer_text": answer.answer_text,
+                "is_correct": answer.is_correct,
+            }
+            for answer in result
+        ]
+        return quiz_data
 
 
 def get_quiz_service() -> QuizServices:
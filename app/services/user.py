@@ -6,14 +6,16 @@ import aiofiles
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError, DataError
 from fastapi import UploadFile
 
+from app.core.enums.enums import CountMode
 from app.core.exceptions.repository_exceptions import (
     RepositoryDatabaseError,
     RepositoryIntegrityError,
     RepositoryDataError,
 )
-from app.db.unit_of_work import UnitOfWork
+from app.db.unit_of_work import UnitOfWork, after_commit
 from app.schemas.response_models import ListResponse
 from app.utils.password import password_services
+from app.utils.principal_cache import principal_cache
 from app.core.exceptions.exceptions import (
     AppException,
     NotFoundException,
@@ -36,9 +38,9 @@ class UserServices:
         password: str | None,
         avatar_ext: str | None = None,
     ):
+        if password:
+            password = await password_services.hash_password_async(password)
         async with UnitOfWork() as uow:
-            if password:
-                password = password_services.hash_password(password)
             user = UserSchema(
                 username=username,
                 email=email,
@@ -57,13 +59,22 @@ class UserServices:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
             logger.info(f"User created: {username}")
-            return user_id
+        await after_commit(principal_cache.invalidate, email)
+        return user_id
 
     @staticmethod
-    async def get_all_users(limit: int | None = None, offset: int | None = None):
-        async with UnitOfWork() as uow:
+    async def get_all_users(
+        limit: int | None = None,
+        offset: int | None = None,
+        cursor: str | None = None,
+        use_cursor: bool = False,
+        count_mode: CountMode = CountMode.EXACT,
+    ):
+        async with UnitOfWork(readonly=True) as uow:
             try:
-                items, total_count = await uow.users.get_all_users(limit, offset)
+                items, total_count, next_cursor = await uow.users.get_all_users(
+                    limit, offset, cursor, use_cursor, count_mode
+                )
             except RepositoryDatabaseError as e:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
@@ -83,8 +94,19 @@ class UserServices:
                     for user in items
                 ],
                 count=total_count,
+                next_cursor=next_cursor,
             )
 
+    @staticmethod
+    def to_user_detail(user):
+        user_dict = user.__dict__.copy()
+        if user_dict["avatar_ext"]:
+            user_dict["avatar"] = (
+                f"{settings.BASE_URL}/static/avatars/{user.id}.{user.avatar_ext}"
+            )
+        user_dict.pop("avatar_ext")
+        return UserDetailResponse.model_validate(user_dict)
+
     @staticmethod
     async def get_user_by_id_with_uow(user_id: int, uow: UnitOfWork):
         try:
@@ -95,16 +117,10 @@ class UserServices:
         if not user:
             logger.warning(f"No user found with id={user_id}")
             raise NotFoundException(detail=f"No user found with id={user_id}")
-        user_dict = user.__dict__.copy()
-        if user_dict["avatar_ext"]:
-            user_dict["avatar"] = (
-                f"{settings.BASE_URL}/static/avatars/{user.id}.{user.avatar_ext}"
-            )
-        user_dict.pop("avatar_ext")
         logger.info(f"Fetched user with id={user_id}")
-        return UserDetailResponse.model_validate(user_dict)
+        return UserServices.to_user_detail(user)
 
-    async def get_user_by_id(self, user_id: int, email: str):
+    async def get_user_by_id(self, user_id: int, email: str | None = None):
         async with UnitOfWork() as uow:
             user_data = await self.get_user_by_id_with_uow(user_id, uow)
             if email == user_data.email:
@@ -123,7 +139,30 @@ class UserServices:
                 logger.warning(f"No user found with email={email}")
                 raise NotFoundException(detail=f"No user found with email={email}")
             logger.info(f"Fetched user with email={email}")
-            return UserDetailResponse.model_validate(user)
+            return UserServices.to_user_detail(user)
+
+    @staticmethod
+    async def get_credentials_by_email(email: str):
+        async with UnitOfWork() as uow:
+            try:
+                user = await uow.users.get_one(email=email)
+            except RepositoryDatabaseError as e:
+                logger.error(f"SQLAlchemyError: {e}")
+                raise AppException(detail="Database exception occurred.")
+            if not user:
+                logger.warning(f"No user found with email={email}")
+                raise NotFoundException(detail=f"No user found with email={email}")
+            return user.id, user.password
+
+    @staticmethod
+    async def update_password_hash(user_id: int, hashed_password: str):
+        async with UnitOfWork() as uow:
+            try:
+                await uow.users.update(id=user_id, data={"password": hashed_password})
+            except RepositoryDatabaseError as e:
+                logger.error(f"SQLAlchemyError: {e}")
+                raise AppException(detail="Database exception occurred.")
+            logger.info(f"Rehashed password for user id={user_id}")
 
     async def update_user(
         self,
@@ -134,6 +173,8 @@ class UserServices:
         avatar: UploadFile | None = None,
         current_user_id: int = None,
     ):
+        if password:
+            password = await password_services.hash_password_async(password)
         async with UnitOfWork() as uow:
             user = await self.get_user_by_id_with_uow(user_id, uow)
             if user.id != current_user_id:
@@ -152,8 +193,6 @@ class UserServices:
                         await out_file.write(content)
             else:
                 ext = None
-            if password:
-                password = password_services.hash_password(password)
             update_model = UserUpdateRequestModel(
                 username=username,
                 password=password,
@@ -177,6 +216,7 @@ class UserServices:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
             logger.info(f"User updated: id={user_id}")
+        await after_commit(principal_cache.invalidate, user.email, user.id)
 
     async def delete_user(self, user_id: int, current_user_id: int):
         async with UnitOfWork() as uow:
@@ -197,10 +237,11 @@ class UserServices:
                 logger.error(f"SQLAlchemyError: {e}")
                 raise AppException(detail="Database exception occurred.")
             logger.info(f"User deleted: id={user_id}")
+        await after_commit(principal_cache.invalidate, user.email, user.id)
 
     @staticmethod
     async def get_users_with_quizzes_to_complete():
-        async with UnitOfWork() as uow:
+        async with UnitOfWork(readonly=True) as uow:
             try:
                 users = await uow.users.get_users_with_quizzes_to_complete()
                 return [UserDetailResponse.model_validate(user) for user in users]
@@ -5,7 +5,7 @@ import pytest
 import pytest_asyncio
 
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy import insert
+from sqlalchemy import event, insert
 
 from app.core.enums.enums import NotificationStatus
 from app.models.company_model import Company
@@ -29,6 +29,7 @@ from app.models.membership_model import Memberships, MembershipRequests, RoleEnu
 from app.services.admin import get_admin_service
 from app.services.membership import get_membership_service
 from app.utils.db import clear_tables
+from app.utils.revoked_tokens import revoked_tokens
 
 
 @pytest_asyncio.fixture
@@ -43,6 +44,21 @@ async def db_session():
         await session.rollback()
 
 
+@pytest_asyncio.fixture
+async def recorded_statements(db_session):
+    statements = []
+
+    def record(orm_execute_state):
+        if orm_execute_state.is_select:
+            statements.append(
+                orm_execute_state.statement.params(orm_execute_state.parameters or {})
+            )
+
+    event.listen(db_session.sync_session, "do_orm_execute", record)
+    yield statements
+    event.remove(db_session.sync_session, "do_orm_execute", record)
+
+
 @pytest_asyncio.fixture
 async def redis_client():
     client = await fakeredis.aioredis.FakeRedis()
@@ -50,10 +66,19 @@ async def redis_client():
     await client.aclose()
 
 
+@pytest.fixture
+def revocations(redis_client, monkeypatch):
+    monkeypatch.setattr(
+        "app.utils.revoked_tokens.get_redis_client", lambda: redis_client
+    )
+    revoked_tokens.clear()
+    return redis_client
+
+
 @pytest.fixture
 def user_services_fixture(db_session, monkeypatch):
-    def unit_of_work_with_session():
-        return UnitOfWork(session=db_session)
+    def unit_of_work_with_session(**kwargs):
+        return UnitOfWork(session=db_session, **kwargs)
 
     monkeypatch.setattr("app.services.user.UnitOfWork", unit_of_work_with_session)
     return get_user_service()
@@ -61,8 +86,8 @@ def user_services_fixture(db_session, monkeypatch):
 
 @pytest.fixture
 def company_services_fixture(db_session, monkeypatch):
-    def unit_of_work_with_session():
-        return UnitOfWork(session=db_session)
+    def unit_of_work_with_session(**kwargs):
+        return UnitOfWork(session=db_session, **kwargs)
 
     monkeypatch.setattr("app.services.company.UnitOfWork", unit_of_work_with_session)
     return get_company_service()
@@ -70,8 +95,8 @@ def company_services_fixture(db_session, monkeypatch):
 
 @pytest.fixture
 def membership_services_fixture(db_session, monkeypatch):
-    def unit_of_work_with_session():
-        return UnitOfWork(session=db_session)
+    def unit_of_work_with_session(**kwargs):
+        return UnitOfWork(session=db_session, **kwargs)
 
     monkeypatch.setattr("app.services.membership.UnitOfWork", unit_of_work_with_session)
     return get_membership_service()
@@ -79,8 +104,8 @@ def membership_services_fixture(db_session, monkeypatch):
 
 @pytest.fixture
 def admin_services_fixture(db_session, monkeypatch):
-    def unit_of_work_with_session():
-        return UnitOfWork(session=db_session)
+    def unit_of_work_with_session(**kwargs):
+        return UnitOfWork(session=db_session, **kwargs)
 
     monkeypatch.setattr("app.services.admin.UnitOfWork", unit_of_work_with_session)
     return get_admin_service()
@@ -88,8 +113,8 @@ def admin_services_fixture(db_session, monkeypatch):
 
 @pytest.fixture
 def quiz_services_fixture(db_session, redis_client, monkeypatch):
-    def unit_of_work_with_session():
-        return UnitOfWork(session=db_session)
+    def unit_of_work_with_session(**kwargs):
+        return UnitOfWork(session=db_session, **kwargs)
 
     monkeypatch.setattr("app.services.quiz.UnitOfWork", unit_of_work_with_session)
     monkeypatch.setattr("app.services.quiz.get_redis_client", lambda: redis_client)
@@ -98,8 +123,8 @@ def quiz_services_fixture(db_session, redis_client, monkeypatch):
 
 @pytest.fixture
 def notification_services_fixture(db_session, monkeypatch):
-    def unit_of_work_with_session():
-        return UnitOfWork(session=db_session)
+    def unit_of_work_with_session(**kwargs):
+        return UnitOfWork(session=db_session, **kwargs)
 
     monkeypatch.setattr(
         "app.services.notification.UnitOfWork", unit_of_work_with_session
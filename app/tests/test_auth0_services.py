@@ -1,8 +1,11 @@
+import httpx
 import pytest
+import pytest_asyncio
 import respx
 from httpx import Response
 
 from app.services.auth_services.auth0 import get_auth0_service
+from app.utils.http_client import HTTPClient
 from app.utils.settings_model import settings
 
 
@@ -25,3 +28,57 @@ async def test_login_user(test_user):
     auth0_service = get_auth0_service()
     response = await auth0_service.login_user("test@example.com", "1234")
     assert response["access_token"] == "fake-token"
+
+
+@pytest_asyncio.fixture
+async def http_client():
+    client = HTTPClient(
+        timeout=1,
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=5,
+        retries=2,
+        retry_backoff=0,
+    )
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_http_client_retries_idempotent_requests(http_client):
+    route = respx.get("https://example.com/jwks").mock(
+        side_effect=[
+            httpx.ConnectError("boom"),
+            Response(503),
+            Response(200, json={"keys": []}),
+        ]
+    )
+    response = await http_client.get("https://example.com/jwks")
+
+    assert response.status_code == 200
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_http_client_does_not_retry_sent_post(http_client):
+    route = respx.post("https://example.com/signup").mock(return_value=Response(503))
+    response = await http_client.post("https://example.com/signup", json={})
+
+    assert response.status_code == 503
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_http_client_reuses_connection_pool(http_client):
+    respx.get("https://example.com/jwks").mock(return_value=Response(200))
+
+    await http_client.get("https://example.com/jwks")
+    pool = http_client.client
+    await http_client.get("https://example.com/jwks")
+
+    assert http_client.client is pool
+    await http_client.close()
+    assert http_client._client is None
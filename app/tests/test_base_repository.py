@@ -0,0 +1,247 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions.repository_exceptions import RepositoryDataError
+from app.db.repositories.base_repository import BaseRepository
+from app.db.repositories.quizzes.participant_repository import (
+    QuizParticipantRepository,
+)
+from app.db.repositories.user_repository import UserRepository
+from app.db.unit_of_work import UnitOfWork
+from app.models.company_model import Company
+from app.models.membership_model import Memberships
+from app.models.quiz_model import Answer, SelectedAnswers
+from app.models.user_model import User
+from app.utils.settings_model import settings
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    result = MagicMock()
+    result.scalar_one.return_value = 7
+    result.one.return_value = (7, "test@example.com")
+    session.execute = AsyncMock(return_value=result)
+    session.flush = AsyncMock()
+    session.refresh = AsyncMock()
+    return session
+
+
+def compile_last_query(session):
+    return str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_create_inserts_with_returning_in_one_round_trip(session):
+    user_id = await UserRepository(session).create(
+        {"username": "test", "email": "test@example.com", "password": None}
+    )
+
+    assert user_id == 7
+    assert session.execute.await_count == 1
+    session.flush.assert_not_awaited()
+    session.refresh.assert_not_awaited()
+    sql = compile_last_query(session)
+    assert "RETURNING users.id" in sql
+    assert "password" not in sql
+
+
+@pytest.mark.asyncio
+async def test_create_returns_requested_columns(session):
+    row = await UserRepository(session).create(
+        {"email": "test@example.com"}, returning=[User.id, User.email]
+    )
+
+    assert row == (7, "test@example.com")
+    assert "RETURNING users.id, users.email" in compile_last_query(session)
+
+
+@pytest.mark.asyncio
+async def test_upsert_uses_on_conflict_do_update_returning_id(session):
+    participant_id = await QuizParticipantRepository(session).upsert(
+        {"quiz_id": 1, "user_id": 2},
+        conflict_columns=["quiz_id", "user_id"],
+        update_values={"completed_at": func.now()},
+    )
+
+    assert participant_id == 7
+    assert session.execute.await_count == 1
+    sql = compile_last_query(session)
+    assert "ON CONFLICT (quiz_id, user_id) DO UPDATE SET completed_at = now()" in sql
+    assert sql.endswith("RETURNING quiz_participants.id")
+
+
+@pytest.fixture
+def driver_connection(session):
+    driver_connection = MagicMock()
+    driver_connection.copy_records_to_table = AsyncMock()
+    raw_connection = MagicMock()
+    raw_connection.driver_connection = driver_connection
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    session.connection = AsyncMock(return_value=connection)
+    return driver_connection
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_returns_ids_in_chunks(session, monkeypatch):
+    monkeypatch.setattr(settings.db, "BULK_INSERT_BATCH_SIZE", 2)
+    session.execute.return_value.scalars.return_value.all.side_effect = [[1, 2], [3]]
+
+    ids = await BaseRepository(session, SelectedAnswers).bulk_create(
+        [{"record_id": 1, "answer_id": answer_id} for answer_id in range(3)]
+    )
+
+    assert ids == [1, 2, 3]
+    assert session.execute.await_count == 2
+    stmt, chunk = session.execute.call_args[0]
+    assert stmt._sort_by_parameter_order
+    assert "RETURNING selected_answers.id" in compile_last_query(session)
+    assert chunk == [{"record_id": 1, "answer_id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_copies_large_batches_without_returning(
+    session, driver_connection, monkeypatch
+):
+    monkeypatch.setattr(settings.db, "BULK_COPY_THRESHOLD", 2)
+    rows = [{"question_id": 1, "text": str(i), "is_correct": i == 0} for i in range(3)]
+
+    assert (
+        await BaseRepository(session, Answer).bulk_create(rows, returning=False) == []
+    )
+
+    session.execute.assert_awaited_once()
+    driver_connection.copy_records_to_table.assert_awaited_once_with(
+        "answers",
+        records=[(1, "0", True), (1, "1", False), (1, "2", False)],
+        columns=["question_id", "text", "is_correct"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_fills_python_column_defaults(
+    session, driver_connection, monkeypatch
+):
+    monkeypatch.setattr(settings.db, "BULK_COPY_THRESHOLD", 2)
+    rows = [{"name": "a", "owner": 1}, {"name": "b", "owner": 1}]
+
+    await BaseRepository(session, Company).bulk_create(rows, returning=False)
+
+    driver_connection.copy_records_to_table.assert_awaited_once_with(
+        "companies",
+        records=[("a", 1, True), ("b", 1, True)],
+        columns=["name", "owner", "private"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_falls_back_to_insert_for_enum_columns(
+    session, driver_connection, monkeypatch
+):
+    monkeypatch.setattr(settings.db, "BULK_COPY_THRESHOLD", 2)
+    rows = [{"user_id": user_id, "company_id": 1} for user_id in range(2)]
+
+    await BaseRepository(session, Memberships).bulk_create(rows, returning=False)
+
+    driver_connection.copy_records_to_table.assert_not_awaited()
+    assert "INSERT INTO memberships" in compile_last_query(session)
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_rejects_rows_with_different_columns(
+    session, driver_connection, monkeypatch
+):
+    monkeypatch.setattr(settings.db, "BULK_COPY_THRESHOLD", 2)
+    rows = [
+        {"question_id": 1, "text": "a", "is_correct": True},
+        {"question_id": 1, "text": "b"},
+    ]
+
+    with pytest.raises(RepositoryDataError):
+        await BaseRepository(session, Answer).bulk_create(rows, returning=False)
+
+    driver_connection.copy_records_to_table.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_inserts_small_batches_without_copy(
+    session, driver_connection, monkeypatch
+):
+    monkeypatch.setattr(settings.db, "BULK_COPY_THRESHOLD", 10)
+
+    await BaseRepository(session, Answer).bulk_create(
+        [{"question_id": 1, "text": "a", "is_correct": True}], returning=False
+    )
+
+    driver_connection.copy_records_to_table.assert_not_awaited()
+    assert "RETURNING" not in compile_last_query(session)
+
+
+@pytest.mark.asyncio
+async def test_bulk_copy_rolls_back_with_unit_of_work(
+    db_session, test_record, test_answers, monkeypatch
+):
+    monkeypatch.setattr(settings.db, "BULK_COPY_THRESHOLD", 2)
+    await db_session.commit()
+    rows = [
+        {"record_id": test_record["id"], "answer_id": test_answers[answer]}
+        for answer in ("id1", "id2")
+    ]
+
+    with pytest.raises(ValueError):
+        async with UnitOfWork(session=db_session) as uow:
+            await BaseRepository(uow.session, SelectedAnswers).bulk_create(
+                rows, returning=False
+            )
+            raise ValueError("boom")
+
+    selected = await db_session.scalars(
+        select(SelectedAnswers).where(SelectedAnswers.record_id == test_record["id"])
+    )
+    assert selected.all() == []
+
+
+def test_update_many_joins_unnested_arrays():
+    sql = str(
+        BaseRepository(None, Answer)
+        ._update_many_stmt(
+            [
+                {"id": 1, "text": "a", "is_correct": True},
+                {"id": 2, "text": "b", "is_correct": False},
+            ]
+        )
+        .compile(dialect=postgresql.dialect())
+    )
+
+    assert "CASE" not in sql
+    assert "unnest(%(id_values)s::INTEGER[]) AS id" in sql
+    assert "unnest(%(is_correct_values)s::BOOLEAN[]) AS is_correct" in sql
+    assert "WHERE answers.id = v.id" in sql
+
+
+def test_update_many_sql_does_not_grow_with_rows():
+    repository = BaseRepository(None, Answer)
+
+    def compile_rows(count):
+        rows = [{"id": i, "text": str(i)} for i in range(count)]
+        return str(
+            repository._update_many_stmt(rows).compile(dialect=postgresql.dialect())
+        )
+
+    assert compile_rows(2) == compile_rows(500)
+
+
+@pytest.mark.asyncio
+async def test_update_many_executes_in_chunks(session, monkeypatch):
+    monkeypatch.setattr(settings.db, "BULK_UPDATE_BATCH_SIZE", 2)
+    await BaseRepository(session, Answer).update_many(
+        [{"id": i, "text": str(i)} for i in range(5)]
+    )
+
+    assert session.execute.await_count == 3
+    params = session.execute.call_args[0][0].compile().params
+    assert params["id_values"] == [4]
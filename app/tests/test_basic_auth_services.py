@@ -1,6 +1,13 @@
+from unittest.mock import AsyncMock
+
 import pytest
 
-from app.services.auth_services.basic import get_basic_auth_service
+from app.core.exceptions.exceptions import UnauthorizedException
+from app.routers.basic_auth_router import logout
+from app.schemas.user import UserDetailResponse
+from app.services.auth_services.basic import get_basic_auth_service, BasicAuthServices
+from app.utils.password import PasswordServices, password_services
+from app.utils.token import token_services
 
 
 @pytest.mark.asyncio
@@ -17,3 +24,33 @@ async def test_login():
     basic_auth_service = get_basic_auth_service()
     response = await basic_auth_service.login(password="1234", email="test@example.com")
     assert response.token
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password(monkeypatch):
+    old_hash = PasswordServices(rounds=4, max_workers=1).hash_password("1234")
+    monkeypatch.setattr(password_services, "rounds", 5)
+    user_service = AsyncMock()
+    user_service.get_credentials_by_email.return_value = (1, old_hash)
+
+    response = await BasicAuthServices(user_service).login(
+        password="1234", email="test@example.com"
+    )
+
+    assert response.token
+    user_id, new_hash = user_service.update_password_hash.await_args.args
+    assert user_id == 1
+    assert not password_services.needs_rehash(new_hash)
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_token(revocations):
+    token = token_services.create_access_token(id=1)
+
+    response = await logout(
+        f"Bearer {token}", UserDetailResponse(id=1, email="test@example.com")
+    )
+
+    assert response.status_code == 200
+    with pytest.raises(UnauthorizedException):
+        await token_services.get_user_from_local_token(token, AsyncMock())
@@ -0,0 +1,107 @@
+import asyncio
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError, ResponseError, TimeoutError
+
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.db.repositories.redis.user_redis_repository import UserRedisRepository
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker(
+        name="test", failure_threshold=2, reset_timeout=60, timeout=0.05
+    )
+
+
+async def fail():
+    raise ConnectionError("down")
+
+
+async def succeed():
+    return "ok"
+
+
+async def test_breaker_opens_after_threshold_and_rejects_calls(breaker):
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await breaker.call(fail)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(succeed)
+    assert breaker.stats()["rejected"] == 1
+    assert breaker.stats()["opened"] == 1
+
+
+async def test_breaker_counts_exceeded_budget_as_failure(breaker):
+    breaker.failure_threshold = 1
+
+    with pytest.raises(TimeoutError):
+        await breaker.call(lambda: asyncio.sleep(1))
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.timeouts == 1
+
+
+async def test_breaker_ignores_command_errors(breaker):
+    breaker.failure_threshold = 1
+
+    async def wrong_type():
+        raise ResponseError("WRONGTYPE")
+
+    with pytest.raises(ResponseError):
+        await breaker.call(wrong_type)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_half_open_allows_single_probe(breaker):
+    breaker.failure_threshold = 1
+    breaker.reset_timeout = 0
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    release = asyncio.Event()
+
+    async def slow_probe():
+        await release.wait()
+        return "ok"
+
+    probe = asyncio.create_task(breaker.call(slow_probe, timeout=1))
+    await asyncio.sleep(0)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(succeed)
+
+    release.set()
+    assert await probe == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_failed_probe_reopens_breaker(breaker):
+    breaker.failure_threshold = 3
+    breaker.reset_timeout = 0
+    breaker.state = CircuitBreaker.OPEN
+
+    with pytest.raises(ConnectionError):
+        await breaker.call(fail)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+async def test_repository_stops_calling_redis_while_open(breaker):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    client = fakeredis.aioredis.FakeRedis(server=server)
+    repository = UserRedisRepository(client, breaker=breaker)
+
+    for _ in range(3):
+        with pytest.raises(RedisRepositoryError):
+            await repository.get_user_by_id(1)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.rejected == 1
+    await client.aclose()
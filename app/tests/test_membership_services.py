@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy import select, insert
 
+from app.models.company_model import Company
 from app.models.membership_model import MembershipRequests, Memberships
 
 
@@ -118,6 +119,40 @@ async def test_get_membership_requests_for_user(
     assert len(membership_requests.items) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_membership_requests_for_user_counts_all_pages(
+    db_session, membership_services_fixture, test_user
+):
+    companies = await db_session.execute(
+        insert(Company)
+        .values(
+            [
+                {"owner": test_user["id"], "name": f"test{i}", "private": False}
+                for i in range(3)
+            ]
+        )
+        .returning(Company.id)
+    )
+    await db_session.execute(
+        insert(MembershipRequests).values(
+            [
+                {"type": "request", "user_id": test_user["id"], "company_id": id_}
+                for id_ in companies.scalars().all()
+            ]
+        )
+    )
+    await db_session.commit()
+
+    membership_requests = (
+        await membership_services_fixture.get_membership_requests_for_user(
+            "request", test_user["id"], limit=2, offset=0
+        )
+    )
+
+    assert len(membership_requests.items) == 2
+    assert membership_requests.count == 3
+
+
 @pytest.mark.asyncio
 async def test_get_membership_requests_to_company(
     membership_services_fixture, test_membership_request
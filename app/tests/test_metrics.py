@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.db.postgres_init import InstrumentedPool, engine
+from app.routers.metrics_router import metrics_router
+from app.schemas.user import UserDetailResponse
+from app.utils.settings_model import settings
+from app.utils.token import get_operator, token_services
+
+
+def test_engine_uses_configured_pool():
+    assert isinstance(engine.pool, InstrumentedPool)
+    assert engine.echo is settings.db.ECHO
+    assert engine.pool.size() == settings.db.POOL_SIZE
+    assert engine.pool._max_overflow == settings.db.MAX_OVERFLOW
+    assert engine.pool._timeout == settings.db.POOL_TIMEOUT
+    assert engine.pool._recycle == settings.db.POOL_RECYCLE
+    assert engine.pool._pre_ping is settings.db.POOL_PRE_PING
+
+
+def test_connect_args_set_statement_cache_and_timeout():
+    connect_args = settings.db.get_connect_args()
+
+    assert connect_args["statement_cache_size"] == settings.db.STATEMENT_CACHE_SIZE
+    assert connect_args["server_settings"]["statement_timeout"] == str(
+        settings.db.STATEMENT_TIMEOUT
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    app = FastAPI()
+    app.include_router(metrics_router)
+    app.dependency_overrides[get_operator] = lambda: None
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/metrics/")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["db_pool"]["size"] == settings.db.POOL_SIZE
+    assert data["db_pool"]["checked_out"] == 0
+    assert "queued" in data["password_pool"]
+    assert "hits" in data["token_cache"]
+    assert data["redis_breaker"]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_requires_operator(monkeypatch):
+    monkeypatch.setattr(settings.monitoring, "OPERATOR_EMAILS", ["ops@example.com"])
+    app = FastAPI()
+    app.include_router(metrics_router)
+    app.dependency_overrides[token_services.get_data_from_token] = (
+        lambda: UserDetailResponse(id=1, username="user", email="user@example.com")
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/metrics/")
+
+    assert response.status_code == 403
@@ -1,5 +1,7 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.core.enums.enums import NotificationStatus
 from app.models.notifications_model import Notification
@@ -15,6 +17,42 @@ async def test_get_all_notifications(
     assert notifications.count >= 1
 
 
+@pytest.mark.asyncio
+async def test_get_all_notifications_pages_newest_first(
+    db_session, notification_services_fixture, test_membership
+):
+    now = datetime.now(timezone.utc)
+    await db_session.execute(
+        insert(Notification).values(
+            [
+                {
+                    "status": NotificationStatus.UNREAD,
+                    "user_id": test_membership["user_id"],
+                    "company_id": test_membership["company_id"],
+                    "message": f"Notification {i}",
+                    "created_at": now - timedelta(days=i),
+                }
+                for i in range(3)
+            ]
+        )
+    )
+    await db_session.commit()
+
+    first_page = await notification_services_fixture.get_all_notifications(
+        user_id=test_membership["user_id"], limit=2, offset=None, use_cursor=True
+    )
+    second_page = await notification_services_fixture.get_all_notifications(
+        user_id=test_membership["user_id"],
+        limit=2,
+        offset=None,
+        cursor=first_page.next_cursor,
+    )
+
+    messages = [item.message for item in first_page.items + second_page.items]
+    assert messages == ["Notification 0", "Notification 1", "Notification 2"]
+    assert second_page.next_cursor is None
+
+
 @pytest.mark.asyncio
 async def test_mark_read(db_session, notification_services_fixture, test_notification):
     await notification_services_fixture.mark_read(test_notification["id"])
@@ -0,0 +1,200 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from app.core.enums.enums import CountMode
+from app.core.exceptions.exceptions import BadRequestException
+from app.core.exceptions.repository_exceptions import RepositoryDataError
+from app.db.explain import Explain
+from app.db.repositories.base_repository import BaseRepository, count_cache
+from app.db.repositories.company_repository import CompanyRepository
+from app.db.repositories.membership_requests_repository import (
+    MembershipRequestsRepository,
+)
+from app.db.repositories.user_repository import UserRepository
+from app.models.notifications_model import Notification
+from app.models.user_model import User
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor([42])
+
+    assert decode_cursor(cursor, [User.id]) == [42]
+
+
+def test_cursor_round_trip_datetime():
+    created_at = datetime(2024, 5, 1, 12, 30)
+    cursor = encode_cursor([created_at, 7])
+
+    assert decode_cursor(cursor, [Notification.created_at, Notification.id]) == [
+        created_at,
+        7,
+    ]
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not-a-cursor", "", encode_cursor(["x"]), encode_cursor([1, 2])]
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(BadRequestException):
+        decode_cursor(cursor, [User.id])
+
+
+def test_explain_compiles_to_json_plan():
+    statement = Explain(select(User).where(User.id == 1))
+
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    result = MagicMock()
+    result.all.return_value = []
+    result.scalar.return_value = [{"Plan": {"Plan Rows": 1234}}]
+    session.execute = AsyncMock(return_value=result)
+    session.scalar = AsyncMock(return_value=0)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_count_mode_none_skips_window_count(session):
+    repo = UserRepository(session)
+
+    items, total_count, _ = await repo.get_all_users(count_mode=CountMode.NONE)
+
+    assert total_count is None
+    sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+    assert "count(*) OVER ()" not in sql
+
+
+@pytest.mark.asyncio
+async def test_count_mode_estimated_reads_plan_rows(session):
+    repo = UserRepository(session)
+
+    _, total_count, _ = await repo.get_all_users(count_mode=CountMode.ESTIMATED)
+
+    assert total_count == 1234
+
+
+@pytest.mark.asyncio
+async def test_count_mode_cached_reuses_count(session):
+    count_cache.clear()
+    session.scalar.return_value = 42
+    repo = UserRepository(session)
+
+    first = await repo.get_all_users(count_mode=CountMode.CACHED)
+    second = await repo.get_all_users(limit=5, count_mode=CountMode.CACHED)
+
+    assert first[1] == second[1] == 42
+    assert session.scalar.await_count == 1
+
+
+def compile_last_query(session):
+    return str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_single_table_list_is_not_deduplicated(session):
+    await UserRepository(session).get_all_users(count_mode=CountMode.NONE)
+
+    sql = compile_last_query(session)
+    assert "DISTINCT" not in sql
+    assert "ORDER BY users.id" in sql
+
+
+@pytest.mark.asyncio
+async def test_membership_join_is_deduplicated(session):
+    await UserRepository(session).get_all_admins(1, count_mode=CountMode.NONE)
+
+    sql = compile_last_query(session)
+    assert "DISTINCT ON (users.id)" in sql
+    assert "ORDER BY users.id" in sql
+
+
+@pytest.mark.asyncio
+async def test_order_by_adds_id_tie_breaker(session):
+    await UserRepository(session).get_all(
+        order_by=[User.created_at], count_mode=CountMode.NONE
+    )
+
+    assert "ORDER BY users.created_at, users.id" in compile_last_query(session)
+
+
+@pytest.mark.asyncio
+async def test_next_cursor_reads_selected_sort_values(session):
+    session.execute.return_value.all.return_value = [
+        (MagicMock(), "alice", 1),
+        (MagicMock(), "bob", 2),
+    ]
+
+    _, _, next_cursor = await UserRepository(session).get_all(
+        limit=1,
+        use_cursor=True,
+        order_by=[func.lower(User.username).label("name")],
+        count_mode=CountMode.NONE,
+    )
+
+    assert decode_cursor(next_cursor, [User.username, User.id]) == ["alice", 1]
+    assert "lower(users.username) AS cursor_0" in compile_last_query(session)
+
+
+@pytest.mark.asyncio
+async def test_descending_order_pages_backwards(session):
+    cursor = encode_cursor([datetime(2024, 1, 1), 7])
+
+    await UserRepository(session).get_all(
+        cursor=cursor,
+        order_by=[User.created_at.desc()],
+        count_mode=CountMode.NONE,
+    )
+
+    sql = compile_last_query(session)
+    assert "ORDER BY users.created_at DESC, users.id DESC" in sql
+    assert "(users.created_at, users.id) < (" in sql
+
+
+@pytest.mark.asyncio
+async def test_mixed_sort_directions_are_rejected(session):
+    with pytest.raises(RepositoryDataError):
+        await UserRepository(session).get_all(
+            use_cursor=True, order_by=[User.created_at.desc(), User.username]
+        )
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda session, **kwargs: CompanyRepository(session).get_companies_for_user(
+            1, **kwargs
+        ),
+        lambda session, **kwargs: UserRepository(session).get_users_in_company(
+            1, **kwargs
+        ),
+        lambda session, **kwargs: MembershipRequestsRepository(
+            session
+        ).get_membership_requests_for_user("request", 1, **kwargs),
+        lambda session, **kwargs: MembershipRequestsRepository(
+            session
+        ).get_membership_requests_to_company("request", 1, **kwargs),
+    ],
+)
+async def test_membership_lists_forward_cursor(call, monkeypatch):
+    get_all = AsyncMock(return_value=([], None, "next"))
+    monkeypatch.setattr(BaseRepository, "get_all", get_all)
+
+    result = await call(
+        MagicMock(), cursor="abc", use_cursor=True, count_mode=CountMode.NONE
+    )
+
+    assert result[-1] == "next"
+    kwargs = get_all.await_args.kwargs
+    assert kwargs["cursor"] == "abc"
+    assert kwargs["use_cursor"] is True
+    assert kwargs["count_mode"] == CountMode.NONE
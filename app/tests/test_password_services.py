@@ -1,4 +1,9 @@
-from app.utils.password import password_services
+import asyncio
+import threading
+
+import pytest
+
+from app.utils.password import PasswordServices, password_services
 
 
 def test_hash_and_verify_password():
@@ -7,3 +12,42 @@ def test_hash_and_verify_password():
 
     assert test_password != hashed_password
     assert password_services.check_password(test_password, hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password_async():
+    services = PasswordServices(rounds=4, max_workers=1)
+    hashed_password = await services.hash_password_async("1234")
+
+    assert await services.check_password_async("1234", hashed_password)
+    assert not await services.check_password_async("4321", hashed_password)
+    assert services.stats() == {"workers": 1, "queued": 0, "running": 0}
+    services.shutdown()
+
+
+def test_needs_rehash():
+    old_services = PasswordServices(rounds=4, max_workers=1)
+    new_services = PasswordServices(rounds=5, max_workers=1)
+    hashed_password = old_services.hash_password("1234")
+
+    assert not old_services.needs_rehash(hashed_password)
+    assert new_services.needs_rehash(hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_jobs_leave_queue():
+    services = PasswordServices(rounds=4, max_workers=1)
+    release = threading.Event()
+    blocking = asyncio.create_task(services._run_in_pool(release.wait))
+    queued = asyncio.create_task(services.hash_password_async("1234"))
+    await asyncio.sleep(0.05)
+    assert services.stats()["queued"] == 1
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+    await blocking
+
+    assert services.stats() == {"workers": 1, "queued": 0, "running": 0}
+    services.shutdown()
@@ -0,0 +1,105 @@
+import json
+import re
+
+import pytest
+
+from sqlalchemy import text
+
+from app.db.explain import Explain
+from app.db.repositories.company_repository import CompanyRepository
+from app.db.repositories.membership_requests_repository import (
+    MembershipRequestsRepository,
+)
+from app.db.repositories.notification_repository import NotificationsRepository
+from app.db.repositories.quizzes.quiz_repository import QuizRepository
+from app.db.repositories.quizzes.record_repository import RecordsRepository
+
+
+async def used_indexes(db_session, statements):
+    await db_session.execute(text("SET enable_seqscan = off"))
+    indexes = set()
+    for statement in statements:
+        plan = await db_session.scalar(Explain(statement))
+        plan = plan if isinstance(plan, str) else json.dumps(plan)
+        indexes.update(re.findall(r'"Index Name": "([^"]+)"', plan))
+    await db_session.execute(text("RESET enable_seqscan"))
+    return indexes
+
+
+@pytest.mark.asyncio
+async def test_companies_for_user_use_membership_index(db_session, recorded_statements):
+    await CompanyRepository(db_session).get_companies_for_user(1, limit=10, offset=0)
+
+    indexes = await used_indexes(db_session, recorded_statements)
+
+    assert "ix_memberships_user_id_company_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_notifications_use_company_created_at_index(
+    db_session, recorded_statements
+):
+    await NotificationsRepository(db_session).get_all_notifications(
+        user_id=1, limit=10, offset=0
+    )
+
+    indexes = await used_indexes(db_session, recorded_statements)
+
+    assert "ix_notifications_company_id_created_at" in indexes
+    assert "ix_memberships_user_id_company_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_membership_requests_use_type_company_index(
+    db_session, recorded_statements
+):
+    await MembershipRequestsRepository(db_session).get_membership_requests_to_company(
+        "request", company_id=1, limit=10, offset=0
+    )
+
+    indexes = await used_indexes(db_session, recorded_statements)
+
+    assert "ix_membership_requests_type_company_id_user_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_quiz_history_uses_participant_record_indexes(
+    db_session, recorded_statements
+):
+    await QuizRepository(db_session).get_quiz_history_for_user(user_id=1, quiz_id=1)
+
+    indexes = await used_indexes(db_session, recorded_statements)
+
+    assert "ix_quiz_participants_user_id_quiz_id_completed_at" in indexes
+    assert "ix_records_participant_id" in indexes
+    assert "ix_selected_answers_record_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_average_score_uses_question_and_participant_indexes(
+    db_session, recorded_statements
+):
+    await RecordsRepository(db_session).get_average_score_in_company(
+        user_id=1, company_id=1
+    )
+
+    indexes = await used_indexes(db_session, recorded_statements)
+
+    assert "ix_questions_quiz_id" in indexes
+    assert "ix_quiz_participants_user_id_quiz_id_completed_at" in indexes
+    assert "ix_records_participant_id" in indexes
+
+
+@pytest.mark.asyncio
+async def test_quiz_answers_use_question_index(
+    db_session, recorded_statements, test_quiz, test_answers
+):
+    quiz = await QuizRepository(db_session).get_quiz_by_id(
+        test_quiz["id"], test_quiz["company_id"]
+    )
+
+    indexes = await used_indexes(db_session, recorded_statements)
+
+    assert len(quiz.questions) == 2
+    assert "ix_questions_quiz_id" in indexes
+    assert "ix_answers_question_id" in indexes
@@ -0,0 +1,114 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.core.exceptions.repository_exceptions import RepeatedQueryError
+from app.db.instrumentation import (
+    QueryStats,
+    QueryStatsMiddleware,
+    instrument_engine,
+    query_stats,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_engine_events_record_statements_time_and_rows(engine):
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER)"))
+            connection.execute(text("INSERT INTO items VALUES (1), (2), (3)"))
+            connection.execute(text("UPDATE items SET id = id + 1"))
+    finally:
+        query_stats.reset(token)
+
+    assert stats.statements == 3
+    assert stats.rows == 6
+    assert stats.duration > 0
+
+
+def test_engine_events_ignore_statements_outside_request(engine):
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert query_stats.get() is None
+
+
+def test_failed_statement_does_not_leak_start_time(engine):
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 1"))
+            assert "query_start" not in connection.connection.info
+    finally:
+        query_stats.reset(token)
+
+    assert stats.statements == 1
+    assert 0 < stats.duration < 1
+
+
+def test_repeated_statement_shape_raises_at_threshold(engine):
+    token = query_stats.set(QueryStats(repeat_threshold=3))
+    try:
+        with engine.connect() as connection:
+            for value in range(2):
+                connection.execute(text("SELECT :value"), {"value": value})
+            with pytest.raises(RepeatedQueryError):
+                connection.execute(text("SELECT :value"), {"value": 2})
+    finally:
+        query_stats.reset(token)
+
+
+def test_repeated_statements_group_by_normalized_shape():
+    stats = QueryStats(repeat_threshold=3)
+    stats.record("SELECT * FROM users WHERE id IN (1, 2)", 0.001, 2)
+    stats.record("SELECT * FROM users WHERE id IN (3, 4, 5)", 0.001, 3)
+
+    with pytest.raises(RepeatedQueryError):
+        stats.record("SELECT * FROM users WHERE id IN ('a', 'b', 'c', 'd')", 0.001, 4)
+    assert stats.most_repeated() == ("SELECT * FROM users WHERE id IN (?, ...)", 3)
+
+
+@pytest.mark.asyncio
+async def test_middleware_adds_server_timing_header(monkeypatch):
+    warning = MagicMock()
+    monkeypatch.setattr("app.db.instrumentation.logger.warning", warning)
+    monkeypatch.setattr(
+        "app.db.instrumentation.settings.monitoring.SLOW_REQUEST_QUERIES", 1
+    )
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items")
+    async def items():
+        stats = query_stats.get()
+        stats.record("SELECT 1", 0.002, 1)
+        stats.record("SELECT 1", 0.003, 1)
+        return {}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/items")
+
+    assert response.headers["Server-Timing"] == (
+        'db;dur=5.0;desc="2 queries", db-rows;desc="2 rows"'
+    )
+    message = warning.call_args[0][0]
+    assert message.startswith("GET /items: 2 queries")
+    assert message.endswith("most repeated (2x): SELECT ?")
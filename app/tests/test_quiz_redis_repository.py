@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+from app.db.repositories.redis.codecs import (
+    JSONCodec,
+    StructCodec,
+    decode_record,
+    encode_record,
+)
+from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
+from jobs.migrate_answer_cache import migrate_answer_cache
+
+
+def make_answer(answer_id, user_id=1, quiz_id=10, company_id=100, record_id=7):
+    return {
+        "quiz_id": quiz_id,
+        "company_id": company_id,
+        "answer_id": answer_id,
+        "participant_id": 5,
+        "user_id": user_id,
+        "record_id": record_id,
+    }
+
+
+@pytest.mark.parametrize("codec", [JSONCodec(), StructCodec()])
+def test_codecs_round_trip_records(codec):
+    record = {
+        "user_id": 1,
+        "quiz_id": 10,
+        "company_id": 100,
+        "participant_id": 5,
+        "record_id": 7,
+        "answer_ids": [3, 4, 2147483647],
+    }
+
+    value = encode_record(record, codec)
+
+    assert value[:1] == codec.tag
+    assert decode_record(value) == record
+
+
+def test_struct_codec_is_smaller_than_json_per_answer():
+    answers = [make_answer(answer_id) for answer_id in range(1000, 1010)]
+    [record] = QuizRedisRepository.group_records(answers)
+
+    packed = encode_record(record, StructCodec())
+
+    assert len(packed) == 1 + 4 * (5 + 10)
+    assert len(packed) < len(encode_record(record, JSONCodec()))
+
+
+@pytest.mark.asyncio
+async def test_save_answers_stores_one_value_per_record(redis_client):
+    repository = QuizRedisRepository(redis_client)
+
+    await repository.save_answers(
+        [
+            make_answer(1),
+            make_answer(2),
+            make_answer(3, quiz_id=11, record_id=8),
+            make_answer(4, user_id=2, record_id=9),
+        ]
+    )
+
+    assert await redis_client.hlen("quiz:answers:v2:user:1") == 2
+    assert await redis_client.hlen("quiz:answers:v2:user:2") == 1
+    ttl = await redis_client.ttl("quiz:answers:v2:user:1")
+    assert 0 < ttl <= QuizRedisRepository.expire
+    assert (await repository.get_record(1, 7))["answer_ids"] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_get_answers_for_user_reads_only_loaded_history(redis_client):
+    repository = QuizRedisRepository(redis_client)
+    await repository.load_answers(
+        1,
+        [
+            make_answer(2, quiz_id=11, company_id=101, record_id=8),
+            make_answer(1),
+        ],
+    )
+    await repository.save_answers([make_answer(3, user_id=2, record_id=9)])
+
+    all_answers = await repository.get_answers_for_user(1)
+    quiz_answers = await repository.get_answers_for_user(1, quiz_id=10)
+    company_answers = await repository.get_answers_for_user(1, company_id=101)
+
+    assert [answer["answer_id"] for answer in all_answers] == [1, 2]
+    assert quiz_answers == [make_answer(1)]
+    assert [answer["answer_id"] for answer in company_answers] == [2]
+    assert await repository.get_answers_for_user(2) is None
+    assert await repository.get_answers_for_user(3) is None
+
+
+@pytest.mark.asyncio
+async def test_save_answers_adds_to_loaded_history_without_extending_it(
+    redis_client,
+):
+    repository = QuizRedisRepository(redis_client)
+    await repository.load_answers(1, [])
+    await redis_client.expire("quiz:answers:v2:user:1", 60)
+
+    await repository.save_answers([make_answer(1)])
+
+    assert await repository.get_answers_for_user(1) == [make_answer(1)]
+    assert 0 < await redis_client.ttl("quiz:answers:v2:user:1") <= 60
+
+
+@pytest.mark.asyncio
+async def test_migration_moves_legacy_keys_to_versioned_records(redis_client):
+    await redis_client.set("1:10:100:1", json.dumps(make_answer(1)))
+    await redis_client.hset("answers:user:1", "2", json.dumps(make_answer(2)))
+    await redis_client.hset("answers:user:1:quiz:10", "2", json.dumps(make_answer(2)))
+    await redis_client.set("principal:email:a@b.c", "{}")
+
+    migrated = await migrate_answer_cache(redis_client)
+
+    assert migrated == 3
+    assert sorted(await redis_client.keys()) == [
+        b"principal:email:a@b.c",
+        b"quiz:answers:v2:user:1",
+    ]
+    record = await QuizRedisRepository(redis_client).get_record(1, 7)
+    assert sorted(record["answer_ids"]) == [1, 2]
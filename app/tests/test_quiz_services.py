@@ -1,14 +1,19 @@
 import datetime
-import json
 
+import fakeredis
 import pytest
+import pytest_asyncio
 from sqlalchemy import select
 
+from app.core.exceptions.exceptions import BadRequestException
+from app.db.repositories.base_repository import BaseRepository
+from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
 from app.schemas.quiz import (
     AnswerSchema,
     QuestionWithAnswersSchema,
     QuizWithQuestionsSchema,
     QuizSubmitRequest,
+    QuizSubmissionSchema,
     QuestionID,
     AnswerID,
     AnswerDetailResponse,
@@ -22,6 +27,22 @@ from app.models.quiz_model import (
     Records,
     SelectedAnswers,
 )
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.settings_model import settings
+
+
+@pytest_asyncio.fixture
+async def redis_down(monkeypatch):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    client = fakeredis.aioredis.FakeRedis(server=server)
+    monkeypatch.setattr("app.services.quiz.get_redis_client", lambda: client)
+    monkeypatch.setattr(
+        "app.db.repositories.redis.base_redis_repository.redis_breaker",
+        CircuitBreaker(name="test", failure_threshold=1, reset_timeout=60, timeout=1),
+    )
+    yield client
+    await client.aclose()
 
 
 @pytest.mark.asyncio
@@ -156,6 +177,7 @@ async def test_get_average_score_in_system(
 @pytest.mark.asyncio
 async def test_quiz_submit(
     db_session,
+    test_membership,
     redis_client,
     test_user,
     test_company,
@@ -197,18 +219,144 @@ async def test_quiz_submit(
     record = result.scalars().first()
     assert record is not None
     assert record.score == 1
+    assert answer_ids == [test_answers["id2"], test_answers["id3"]]
 
-    cached_raw = await redis_client.get(
-        f"{test_user['id']}:{test_quiz['id']}:{test_company['id']}:{answer_ids[0]}"
+    cached_record = await QuizRedisRepository(redis_client).get_record(
+        test_user["id"], record_id
     )
-    cached_answer = json.loads(cached_raw.decode("utf-8"))
-    assert cached_answer["company_id"] == data.company_id
+    assert cached_record["company_id"] == data.company_id
+    assert cached_record["answer_ids"] == answer_ids
 
 
 @pytest.mark.asyncio
-async def test_get_all_quizzes_data_for_user_in_company(
+async def test_quiz_submit_copies_selected_answers(
+    db_session,
+    test_membership,
+    test_user,
+    test_company,
+    test_quiz,
+    test_questions,
+    test_answers,
     quiz_services_fixture,
+    monkeypatch,
+):
+    copied = []
+    copy_records = BaseRepository._copy_records
+
+    async def record_copy(repository, data):
+        copied.append((repository.model, len(data)))
+        return await copy_records(repository, data)
+
+    monkeypatch.setattr(BaseRepository, "_copy_records", record_copy)
+    monkeypatch.setattr(settings.db, "BULK_COPY_THRESHOLD", 2)
+    data = QuizSubmitRequest(
+        score=1,
+        quiz_id=test_quiz["id"],
+        user_id=test_user["id"],
+        company_id=test_company["id"],
+        questions=[
+            QuestionID(
+                id=test_questions["id1"],
+                answers=[AnswerID(id=test_answers["id2"])],
+            ),
+            QuestionID(
+                id=test_questions["id2"],
+                answers=[AnswerID(id=test_answers["id3"])],
+            ),
+        ],
+    )
+
+    _, record_id, answer_ids = await quiz_services_fixture.quiz_submit(
+        data, test_user["id"]
+    )
+
+    assert copied == [(SelectedAnswers, 2)]
+    selected = await db_session.scalars(
+        select(SelectedAnswers.answer_id).where(SelectedAnswers.record_id == record_id)
+    )
+    assert sorted(selected.all()) == sorted(answer_ids)
+
+
+@pytest.mark.asyncio
+async def test_quiz_resubmit_reuses_participant(
+    db_session,
+    test_membership,
     redis_client,
+    test_user,
+    test_company,
+    test_quiz,
+    test_questions,
+    test_answers,
+    quiz_services_fixture,
+):
+    data = QuizSubmitRequest(
+        score=1,
+        quiz_id=test_quiz["id"],
+        user_id=test_user["id"],
+        company_id=test_company["id"],
+        questions=[
+            QuestionID(
+                id=test_questions["id1"],
+                answers=[AnswerID(id=test_answers["id2"])],
+            ),
+        ],
+    )
+    first_participant_id, first_record_id, _ = await quiz_services_fixture.quiz_submit(
+        data, test_user["id"]
+    )
+    (
+        second_participant_id,
+        second_record_id,
+        _,
+    ) = await quiz_services_fixture.quiz_submit(data, test_user["id"])
+
+    assert first_participant_id == second_participant_id
+    assert first_record_id != second_record_id
+    participants = await db_session.scalars(
+        select(QuizParticipant).where(
+            QuizParticipant.quiz_id == test_quiz["id"],
+            QuizParticipant.user_id == test_user["id"],
+        )
+    )
+    assert len(participants.all()) == 1
+
+
+@pytest.mark.asyncio
+async def test_save_submissions_is_idempotent(
+    db_session,
+    test_user,
+    test_company,
+    test_quiz,
+    test_answers,
+    quiz_services_fixture,
+):
+    submission = QuizSubmissionSchema(
+        submission_id="a" * 32,
+        quiz_id=test_quiz["id"],
+        company_id=test_company["id"],
+        user_id=test_user["id"],
+        score=1,
+        answer_ids=[test_answers["id1"], test_answers["id2"]],
+    )
+
+    answers = await quiz_services_fixture.save_submissions([submission, submission])
+    replayed = await quiz_services_fixture.save_submissions([submission])
+
+    assert len(answers) == 2
+    assert replayed == []
+    records = await db_session.scalars(
+        select(Records).where(Records.submission_id == submission.submission_id)
+    )
+    [record] = records.all()
+    selected = await db_session.scalars(
+        select(SelectedAnswers).where(SelectedAnswers.record_id == record.id)
+    )
+    assert len(selected.all()) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_quizzes_data_for_user_in_company(
+    quiz_services_fixture,
     db_session,
     test_quiz,
     test_selected_answer,
@@ -218,20 +366,6 @@ async def test_get_all_quizzes_data_for_user_in_company(
     test_user,
     test_record,
 ):
-    await redis_client.set(
-        f"{test_user['id']}:{test_quiz['id']}:{test_company['id']}:{test_selected_answer['id']}",
-        json.dumps(
-            {
-                "quiz_id": test_quiz["id"],
-                "company_id": test_company["id"],
-                "answer_id": test_selected_answer["id"],
-                "participant_id": test_participant["id"],
-                "user_id": test_user["id"],
-                "record_id": test_selected_answer["record_id"],
-            }
-        ),
-        ex=172800,
-    )
     selected_answer = SelectedAnswers(
         answer_id=test_answers["id1"], record_id=test_record["id"]
     )
@@ -250,7 +384,6 @@ async def test_get_all_quizzes_data_for_user_in_company(
 @pytest.mark.asyncio
 async def test_get_quiz_data_for_user_in_company(
     quiz_services_fixture,
-    redis_client,
     db_session,
     test_quiz,
     test_selected_answer,
@@ -260,20 +393,6 @@ async def test_get_quiz_data_for_user_in_company(
     test_user,
     test_record,
 ):
-    await redis_client.set(
-        f"{test_user['id']}:{test_quiz['id']}:{test_company['id']}:{test_selected_answer['id']}",
-        json.dumps(
-            {
-                "quiz_id": test_quiz["id"],
-                "company_id": test_company["id"],
-                "answer_id": test_selected_answer["id"],
-                "participant_id": test_participant["id"],
-                "user_id": test_user["id"],
-                "record_id": test_selected_answer["record_id"],
-            }
-        ),
-        ex=172800,
-    )
     selected_answer = SelectedAnswers(
         answer_id=test_answers["id1"], record_id=test_record["id"]
     )
@@ -293,7 +412,6 @@ async def test_get_quiz_data_for_user_in_company(
 @pytest.mark.asyncio
 async def test_all_quizzes_data_for_user(
     quiz_services_fixture,
-    redis_client,
     db_session,
     test_quiz,
     test_selected_answer,
@@ -303,20 +421,6 @@ async def test_all_quizzes_data_for_user(
     test_user,
     test_record,
 ):
-    await redis_client.set(
-        f"{test_user['id']}:{test_quiz['id']}:{test_company['id']}:{test_selected_answer['id']}",
-        json.dumps(
-            {
-                "quiz_id": test_quiz["id"],
-                "company_id": test_company["id"],
-                "answer_id": test_selected_answer["id"],
-                "participant_id": test_participant["id"],
-                "user_id": test_user["id"],
-                "record_id": test_selected_answer["record_id"],
-            }
-        ),
-        ex=172800,
-    )
     selected_answer = SelectedAnswers(
         answer_id=test_answers["id1"], record_id=test_record["id"]
     )
@@ -328,3 +432,157 @@ async def test_all_quizzes_data_for_user(
     )
 
     assert len(data) == 2
+
+
+@pytest.mark.asyncio
+async def test_quiz_submit_succeeds_when_cache_is_down(
+    db_session,
+    test_membership,
+    test_user,
+    test_company,
+    test_quiz,
+    test_questions,
+    test_answers,
+    quiz_services_fixture,
+    redis_down,
+):
+    data = QuizSubmitRequest(
+        score=1,
+        quiz_id=test_quiz["id"],
+        user_id=test_user["id"],
+        company_id=test_company["id"],
+        questions=[
+            QuestionID(
+                id=test_questions["id1"],
+                answers=[AnswerID(id=test_answers["id2"])],
+            ),
+        ],
+    )
+
+    _, record_id, answer_ids = await quiz_services_fixture.quiz_submit(
+        data, test_user["id"]
+    )
+
+    result = await db_session.execute(select(Records).where(Records.id == record_id))
+    assert result.scalars().first() is not None
+    assert len(answer_ids) == 1
+
+
+@pytest.mark.asyncio
+async def test_quiz_data_for_user_does_not_depend_on_cache(
+    quiz_services_fixture,
+    db_session,
+    test_quiz,
+    test_selected_answer,
+    test_company,
+    test_answers,
+    test_record,
+    test_user,
+    redis_down,
+):
+    selected_answer = SelectedAnswers(
+        answer_id=test_answers["id1"], record_id=test_record["id"]
+    )
+    db_session.add(selected_answer)
+    await db_session.commit()
+
+    data = await quiz_services_fixture.get_quiz_data_for_user(
+        user_id=test_user["id"],
+        quiz_id=test_quiz["id"],
+        current_user_id=test_user["id"],
+    )
+
+    assert len(data) == 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_submission_rejects_foreign_answers(
+    db_session,
+    redis_client,
+    test_membership,
+    test_user,
+    test_company,
+    test_quiz,
+    test_questions,
+    test_answers,
+    quiz_services_fixture,
+):
+    data = QuizSubmitRequest(
+        score=1,
+        quiz_id=test_quiz["id"],
+        user_id=test_user["id"],
+        company_id=test_company["id"],
+        questions=[
+            QuestionID(
+                id=test_questions["id2"],
+                answers=[AnswerID(id=test_answers["id1"])],
+            ),
+        ],
+    )
+
+    with pytest.raises(BadRequestException):
+        await quiz_services_fixture.enqueue_submission(data, test_user["id"])
+
+    assert await redis_client.xlen(settings.submission.SUBMISSION_STREAM) == 0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_submission_saves_directly_when_redis_is_down(
+    db_session,
+    test_membership,
+    test_user,
+    test_company,
+    test_quiz,
+    test_questions,
+    test_answers,
+    quiz_services_fixture,
+    redis_down,
+):
+    data = QuizSubmitRequest(
+        score=1,
+        quiz_id=test_quiz["id"],
+        user_id=test_user["id"],
+        company_id=test_company["id"],
+        questions=[
+            QuestionID(
+                id=test_questions["id1"],
+                answers=[AnswerID(id=test_answers["id2"])],
+            ),
+        ],
+    )
+
+    submission_id = await quiz_services_fixture.enqueue_submission(
+        data, test_user["id"]
+    )
+
+    records = await db_session.scalars(
+        select(Records).where(Records.submission_id == submission_id)
+    )
+    [record] = records.all()
+    assert record.score == 1
+
+
+@pytest.mark.asyncio
+async def test_quiz_data_for_user_is_served_from_loaded_cache(
+    quiz_services_fixture,
+    db_session,
+    redis_client,
+    test_quiz,
+    test_selected_answer,
+    test_answers,
+    test_record,
+    test_user,
+):
+    data = await quiz_services_fixture.get_quiz_data_for_user(
+        user_id=test_user["id"], current_user_id=test_user["id"]
+    )
+
+    cached = await QuizRedisRepository(redis_client).get_answers_for_user(
+        test_user["id"]
+    )
+    assert [answer["answer_id"] for answer in cached] == [test_answers["id1"]]
+    assert data == await quiz_services_fixture.get_quiz_data_for_user(
+        user_id=test_user["id"],
+        quiz_id=test_quiz["id"],
+        current_user_id=test_user["id"],
+    )
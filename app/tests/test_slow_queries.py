@@ -0,0 +1,190 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.db.slow_queries import SlowQueryRecorder, normalize_statement, redact_plan
+from app.routers.admin_router import admin_router
+from app.schemas.user import UserDetailResponse
+from app.utils.settings_model import settings
+from app.utils.token import get_operator, token_services
+
+PRIMARY = object()
+SELECT = "SELECT users.id FROM users WHERE users.id IN ($1::INTEGER, $2::INTEGER)"
+
+
+@pytest.fixture
+def recorder():
+    return SlowQueryRecorder(
+        threshold_ms=100,
+        maxsize=2,
+        explain=False,
+        analyze=True,
+        explain_interval=300,
+    )
+
+
+@pytest.fixture
+def explain_connection(recorder):
+    connection = MagicMock()
+    connection.exec_driver_sql = AsyncMock(return_value=MagicMock())
+    connection.rollback = AsyncMock()
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=connection)
+    context.__aexit__ = AsyncMock(return_value=False)
+    engine = MagicMock()
+    engine.sync_engine = PRIMARY
+    engine.connect.return_value = context
+    recorder.explain = True
+    recorder.bind(engine)
+    return connection
+
+
+def test_normalize_statement_collapses_literals_and_lists():
+    shorter = normalize_statement(SELECT + " AND users.email = 'a@b.c' LIMIT 10")
+    longer = normalize_statement(
+        "SELECT users.id FROM users WHERE users.id IN "
+        "($1::INTEGER, $2::INTEGER, $3::INTEGER) AND users.email = 'x@y.z' LIMIT 20"
+    )
+
+    assert shorter == longer
+    assert "a@b.c" not in shorter
+
+
+@pytest.mark.asyncio
+async def test_recorder_aggregates_slow_statements_with_redacted_parameters(recorder):
+    recorder.observe(SELECT, (1, "secret"), 0.05, False)
+    recorder.observe(SELECT, (1, "secret"), 0.2, False)
+    recorder.observe(SELECT, (2, "secret"), 0.4, False)
+
+    [entry] = recorder.snapshot()
+    assert entry["calls"] == 2
+    assert entry["max_ms"] == pytest.approx(400)
+    assert entry["avg_ms"] == pytest.approx(300)
+    assert entry["parameters"] == ["int", "str"]
+    assert "secret" not in json.dumps(entry)
+
+
+@pytest.mark.asyncio
+async def test_recorder_keeps_most_recent_shapes(recorder):
+    for table in ("a", "b", "c"):
+        recorder.observe(f"SELECT * FROM {table}", (), 0.2, False)
+
+    assert [entry["statement"] for entry in recorder.snapshot()] == [
+        "SELECT * FROM c",
+        "SELECT * FROM b",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recorder_explains_reads_with_analyze_once_per_interval(
+    recorder, explain_connection
+):
+    explain_connection.exec_driver_sql.return_value.scalar.return_value = (
+        '[{"Plan": {"Node Type": "Seq Scan"}}]'
+    )
+
+    recorder.observe(SELECT, (1, 2), 0.2, False, PRIMARY)
+    recorder.observe(SELECT, (1, 2), 0.2, False, PRIMARY)
+    await asyncio.gather(*recorder._tasks)
+
+    explain_connection.exec_driver_sql.assert_awaited_once_with(
+        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {SELECT}", (1, 2)
+    )
+    explain_connection.rollback.assert_awaited_once()
+    assert recorder.snapshot()[0]["plan"] == [{"Plan": {"Node Type": "Seq Scan"}}]
+
+
+@pytest.mark.asyncio
+async def test_recorder_never_analyzes_writes(recorder, explain_connection):
+    explain_connection.exec_driver_sql.return_value.scalar.return_value = "[]"
+    statement = "UPDATE users SET username=$1::VARCHAR WHERE users.id = $2::INTEGER"
+
+    recorder.observe(statement, ("name", 1), 0.2, False, PRIMARY)
+    await asyncio.gather(*recorder._tasks)
+
+    explain_connection.exec_driver_sql.assert_awaited_once_with(
+        f"EXPLAIN (FORMAT JSON) {statement}", ("name", 1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_recorder_explains_on_the_engine_that_ran_the_statement(
+    recorder, explain_connection
+):
+    replica_connection = MagicMock()
+    replica_connection.exec_driver_sql = AsyncMock(return_value=MagicMock())
+    replica_connection.exec_driver_sql.return_value.scalar.return_value = "[]"
+    replica_connection.rollback = AsyncMock()
+    replica = MagicMock()
+    replica.connect.return_value.__aenter__ = AsyncMock(return_value=replica_connection)
+    replica.connect.return_value.__aexit__ = AsyncMock(return_value=False)
+    recorder.bind(replica)
+
+    recorder.observe(SELECT, (1, 2), 0.2, False, replica.sync_engine)
+    recorder.observe("SELECT 1", (), 0.2, False, object())
+    await asyncio.gather(*recorder._tasks)
+
+    replica_connection.exec_driver_sql.assert_awaited_once()
+    explain_connection.exec_driver_sql.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_endpoint(recorder, monkeypatch):
+    recorder.observe(SELECT, (1, 2), 0.2, False)
+    monkeypatch.setattr("app.routers.admin_router.slow_query_recorder", recorder)
+    app = FastAPI()
+    app.include_router(admin_router)
+    app.dependency_overrides[get_operator] = lambda: None
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/admins/slow-queries")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 1
+    assert data["items"][0]["statement"] == normalize_statement(SELECT)
+    assert data["items"][0]["parameters"] == ["int", "int"]
+
+
+def test_redact_plan_scrubs_literals_from_conditions():
+    plan = [
+        {
+            "Plan": {
+                "Node Type": "Index Scan",
+                "Index Name": "ix_users_2",
+                "Index Cond": "(email = 'alice@example.com'::text)",
+                "Filter": "((id > 42) AND (score = 1.5))",
+                "Plan Rows": 1,
+            }
+        }
+    ]
+
+    redacted = redact_plan(plan)[0]["Plan"]
+
+    assert redacted["Index Cond"] == "(email = ?::text)"
+    assert redacted["Filter"] == "((id > ?) AND (score = ?))"
+    assert redacted["Index Name"] == "ix_users_2"
+    assert redacted["Plan Rows"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_endpoint_requires_operator(monkeypatch):
+    monkeypatch.setattr(settings.monitoring, "OPERATOR_EMAILS", ["ops@example.com"])
+    app = FastAPI()
+    app.include_router(admin_router)
+    app.dependency_overrides[token_services.get_data_from_token] = (
+        lambda: UserDetailResponse(id=1, username="user", email="user@example.com")
+    )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/admins/slow-queries")
+
+    assert response.status_code == 403
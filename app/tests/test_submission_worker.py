@@ -0,0 +1,158 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
+from app.db.repositories.redis.submission_stream_repository import (
+    SubmissionStreamRepository,
+)
+from app.core.exceptions.exceptions import AppException, BadRequestException
+from jobs.submission_worker import SubmissionWorker
+
+
+def submission_payload(submission_id, user_id=1):
+    return {
+        "submission_id": submission_id,
+        "quiz_id": 10,
+        "company_id": 100,
+        "user_id": user_id,
+        "score": 1,
+        "answer_ids": [3, 4],
+    }
+
+
+async def save_submissions(submissions):
+    return [
+        {
+            "quiz_id": submission.quiz_id,
+            "company_id": submission.company_id,
+            "answer_id": answer_id,
+            "participant_id": 5,
+            "user_id": submission.user_id,
+            "record_id": submission.user_id,
+        }
+        for submission in submissions
+        for answer_id in submission.answer_ids
+    ]
+
+
+@pytest.fixture
+async def stream(redis_client):
+    stream = SubmissionStreamRepository(
+        redis_client,
+        stream="test:submissions",
+        group="test-workers",
+        dead_letter_stream="test:submissions:dead",
+        maxlen=1000,
+    )
+    await stream.ensure_group()
+    await stream.ensure_group()
+    return stream
+
+
+@pytest.fixture
+def quiz_service():
+    quiz_service = AsyncMock()
+    quiz_service.save_submissions.side_effect = save_submissions
+    return quiz_service
+
+
+@pytest.fixture
+def worker(stream, redis_client, quiz_service):
+    return SubmissionWorker(
+        stream=stream,
+        cache=QuizRedisRepository(redis_client),
+        quiz_service=quiz_service,
+        consumer="test-consumer",
+        batch_size=10,
+        block_ms=10,
+        claim_idle_ms=60000,
+        max_attempts=3,
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_saves_batch_caches_answers_and_acks(
+    stream, redis_client, worker, quiz_service
+):
+    await stream.add(submission_payload("a"))
+    await stream.add(submission_payload("b", user_id=2))
+
+    processed = await worker.run_once()
+
+    assert processed == 2
+    quiz_service.save_submissions.assert_awaited_once()
+    [submissions] = quiz_service.save_submissions.await_args.args
+    assert [submission.submission_id for submission in submissions] == ["a", "b"]
+    assert await stream.stats() == {
+        "length": 2,
+        "pending": 0,
+        "lag": 0,
+        "dead_letters": 0,
+    }
+    cached = await QuizRedisRepository(redis_client).get_record(2, 2)
+    assert cached["answer_ids"] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_failed_submission_then_dead_letters(
+    stream, redis_client, worker, quiz_service
+):
+    async def fail_on_bad(submissions):
+        if any(submission.submission_id == "bad" for submission in submissions):
+            raise BadRequestException(detail="Failed to save submissions.")
+        return await save_submissions(submissions)
+
+    quiz_service.save_submissions.side_effect = fail_on_bad
+    worker.max_attempts = 2
+    await stream.add(submission_payload("good"))
+    await stream.add(submission_payload("bad"))
+
+    await worker.run_once()
+
+    stats = await stream.stats()
+    assert stats["pending"] == 1
+    assert stats["dead_letters"] == 0
+
+    worker.claim_idle_ms = 0
+    await worker.run_once()
+
+    stats = await stream.stats()
+    assert stats["pending"] == 0
+    assert stats["dead_letters"] == 1
+    [(_, fields)] = await redis_client.xrange("test:submissions:dead")
+    assert b"bad" in fields[b"submission"]
+    assert b"BadRequestException" in fields[b"error"]
+
+
+@pytest.mark.asyncio
+async def test_worker_leaves_submissions_pending_on_database_errors(
+    stream, worker, quiz_service, monkeypatch
+):
+    sleep = AsyncMock()
+    monkeypatch.setattr("jobs.submission_worker.asyncio.sleep", sleep)
+    quiz_service.save_submissions.side_effect = AppException(
+        detail="Database exception occurred."
+    )
+    worker.max_attempts = 1
+    await stream.add(submission_payload("a"))
+    await stream.add(submission_payload("b"))
+
+    await worker.run_once()
+
+    assert quiz_service.save_submissions.await_count == 2
+    sleep.assert_awaited_once()
+    stats = await stream.stats()
+    assert stats["pending"] == 2
+    assert stats["dead_letters"] == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_dead_letters_invalid_payloads(stream, worker):
+    await stream.add({"submission_id": "broken"})
+
+    await worker.run_once()
+
+    stats = await stream.stats()
+    assert stats["pending"] == 0
+    assert stats["dead_letters"] == 1
@@ -1,9 +1,24 @@
+import json
+import time
+
+import httpx
 import pytest
+import respx
 
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwk as jose_jwk
 from unittest.mock import patch, AsyncMock
 
-from app.utils.token import token_services
+from app.core.exceptions.exceptions import UnauthorizedException
+from app.utils.cache import ExpiringSet, LRUCache
+from app.utils.http_client import http_client
+from app.schemas.user import UserDetailResponse
+from app.utils.jwks import MIN_REFRESH_INTERVAL, JWKSKeyStore, jwks_store
+from app.utils.principal_cache import PrincipalCache, principal_cache
+from app.utils.revoked_tokens import RevokedTokens
+from app.utils.token import token_digest, token_services, verified_tokens
 from app.utils.settings_model import settings
 
 SECRET_KEY = settings.SECRET_KEY
@@ -21,24 +36,31 @@ def test_create_and_decode_token():
 
 @pytest.mark.asyncio
 @patch("app.utils.token.TokenServices.decode_auth0_token")
-async def test_get_data_from_token(mock_decode, user_services_fixture, test_user):
+async def test_get_data_from_token(
+    mock_decode, user_services_fixture, test_user, revocations
+):
     mock_decode.return_value = {"id": test_user["id"], "email": test_user["email"]}
+    principal_cache.clear()
 
-    token = token_services.create_access_token(1)
+    token = token_services.create_access_token(test_user["id"])
     authorization_header = f"Bearer {token}"
 
     data = await token_services.get_data_from_token(
         authorization_header, user_services_fixture
     )
     assert data.email == "test@example.com"
+    mock_decode.assert_not_called()
 
 
 @pytest.mark.asyncio
 @patch("httpx.AsyncClient.get", new_callable=AsyncMock)
 @patch("app.utils.token.jwt.get_unverified_header")
 @patch("app.utils.token.jwt.decode")
-async def test_decode_auth0_token(mock_jwt_decode, mock_get_header, mock_http_get):
+async def test_decode_auth0_token(
+    mock_jwt_decode, mock_get_header, mock_http_get, revocations
+):
     mock_response = AsyncMock()
+    mock_response.status_code = 200
     mock_response.json = lambda: {
         "keys": [
             {
@@ -61,7 +83,209 @@ async def test_decode_auth0_token(mock_jwt_decode, mock_get_header, mock_http_ge
         "aud": settings.auth.API_AUDIENCE,
     }
 
+    jwks_store.clear()
     token = "fake-token"
     payload = await token_services.decode_auth0_token(token)
 
     assert payload["sub"] == "user123"
+
+
+@pytest.fixture
+def jwks_stub(tmp_path):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    key = jose_jwk.construct(public_pem, "RS256").to_dict()
+    key["kid"] = "test-kid"
+    stub_file = tmp_path / "jwks.json"
+    stub_file.write_text(json.dumps({"keys": [key]}))
+    return str(stub_file)
+
+
+@pytest.mark.asyncio
+async def test_jwks_store_caches_keys(jwks_stub):
+    store = JWKSKeyStore("", ttl=3600, min_refetch_interval=30, stub_file=jwks_stub)
+    with patch.object(store, "_fetch", wraps=store._fetch) as mock_fetch:
+        assert await store.get_key("test-kid")
+        assert await store.get_key("test-kid")
+        assert mock_fetch.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_jwks_store_rate_limits_unknown_kid(jwks_stub):
+    store = JWKSKeyStore("", ttl=3600, min_refetch_interval=30, stub_file=jwks_stub)
+    with patch.object(store, "_fetch", wraps=store._fetch) as mock_fetch:
+        assert await store.get_key("other-kid") is None
+        assert await store.get_key("other-kid") is None
+        assert mock_fetch.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_jwks_store_serves_stale_keys_on_error(jwks_stub):
+    store = JWKSKeyStore("", ttl=0, min_refetch_interval=0, stub_file=jwks_stub)
+    key = await store.get_key("test-kid")
+    with patch.object(store, "_fetch", side_effect=httpx.ConnectError("down")):
+        assert await store.get_key("test-kid") == key
+
+
+def test_jwks_refresh_interval_is_clamped():
+    store = JWKSKeyStore("", ttl=0, min_refetch_interval=0)
+    assert store.refresh_interval == MIN_REFRESH_INTERVAL
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_jwks_store_rejects_error_responses(monkeypatch):
+    monkeypatch.setattr(http_client, "retries", 0)
+    respx.get("https://example.com/jwks").mock(
+        return_value=httpx.Response(503, json={"keys": []})
+    )
+    store = JWKSKeyStore("https://example.com/jwks", ttl=3600, min_refetch_interval=0)
+    with pytest.raises(UnauthorizedException):
+        await store.refresh()
+
+
+@pytest.mark.asyncio
+async def test_decode_auth0_token_uses_verified_token_cache(
+    jwks_stub, monkeypatch, revocations
+):
+    monkeypatch.setattr(jwks_store, "stub_file", jwks_stub)
+    jwks_store.clear()
+    verified_tokens.clear()
+    with open(jwks_stub) as f:
+        key = json.load(f)["keys"][0]
+    token = "header.payload.signature"
+    claims = {"email": "test@example.com", "exp": int(time.time()) + 60}
+
+    with (
+        patch("app.utils.token.jwt.get_unverified_header") as mock_header,
+        patch("app.utils.token.jwt.decode") as mock_decode,
+    ):
+        mock_header.return_value = {"kid": key["kid"]}
+        mock_decode.return_value = dict(claims)
+        payload = await token_services.decode_auth0_token(token)
+        payload["email"] = "changed@example.com"
+        assert await token_services.decode_auth0_token(token) == claims
+        assert mock_decode.call_count == 1
+
+        await token_services.revoke_token(token)
+        with pytest.raises(UnauthorizedException):
+            await token_services.decode_auth0_token(token)
+        assert mock_decode.call_count == 1
+
+    assert verified_tokens.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_revoked_local_token_is_rejected(revocations):
+    token = token_services.create_access_token(id=123)
+    await token_services.revoke_token(token)
+
+    with pytest.raises(UnauthorizedException):
+        await token_services.get_user_from_local_token(token, AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_revocations_are_not_evicted(revocations):
+    token = token_services.create_access_token(id=123)
+    await token_services.revoke_token(token)
+
+    for user_id in range(settings.auth.TOKEN_CACHE_SIZE + 1):
+        await token_services.revoke_token(f"other-token-{user_id}")
+
+    with pytest.raises(UnauthorizedException):
+        await token_services.ensure_not_revoked(token_digest(token))
+
+
+@pytest.mark.asyncio
+async def test_revocations_are_shared_through_redis(revocations):
+    token = token_services.create_access_token(id=123)
+    digest = token_digest(token)
+    await token_services.revoke_token(token)
+
+    other_worker = RevokedTokens(use_redis=True)
+
+    assert await other_worker.contains(digest)
+    assert digest in other_worker.local
+    ttl = await revocations.ttl(f"token:revoked:{digest}")
+    assert 0 < ttl <= settings.EXP_TIME * 60
+    assert not await other_worker.contains(token_digest("other-token"))
+
+
+def test_expiring_set_prunes_only_expired_entries():
+    revoked = ExpiringSet(prune_size=2)
+    revoked.add("expired", expires_at=time.time() - 1)
+    revoked.add("live", expires_at=time.time() + 60)
+    revoked.add("other", expires_at=time.time() + 60)
+
+    assert len(revoked) == 2
+    assert "live" in revoked
+    assert "expired" not in revoked
+
+
+def test_lru_cache_evicts_and_expires():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1, expires_at=time.time() + 60)
+    cache.set("b", 2, expires_at=time.time() + 60)
+    cache.get("a")
+    cache.set("c", 3, expires_at=time.time() + 60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("d", 4, expires_at=time.time() - 1)
+    assert cache.get("d") is None
+
+
+@pytest.mark.asyncio
+@patch("app.utils.token.TokenServices.is_local_token", return_value=False)
+@patch("app.utils.token.TokenServices.decode_auth0_token")
+async def test_get_data_from_token_caches_principal(mock_decode, _):
+    mock_decode.return_value = {"email": "cached@example.com"}
+    principal_cache.clear()
+    user_service = AsyncMock()
+    user_service.get_user_by_email.return_value = UserDetailResponse(
+        id=1, email="cached@example.com"
+    )
+
+    await token_services.get_data_from_token("Bearer token", user_service)
+    user = await token_services.get_data_from_token("Bearer token", user_service)
+    assert user.id == 1
+    assert user_service.get_user_by_email.await_count == 1
+
+    await principal_cache.invalidate("cached@example.com", 1)
+    await token_services.get_data_from_token("Bearer token", user_service)
+    assert user_service.get_user_by_email.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch("app.utils.token.TokenServices.decode_auth0_token")
+async def test_get_data_from_local_token(mock_decode, revocations):
+    principal_cache.clear()
+    user_service = AsyncMock()
+    user_service.get_user_by_id.return_value = UserDetailResponse(
+        id=7, email="local@example.com"
+    )
+    token = token_services.create_access_token(7)
+
+    await token_services.get_data_from_token(f"Bearer {token}", user_service)
+    user = await token_services.get_data_from_token(f"Bearer {token}", user_service)
+    assert user.email == "local@example.com"
+    assert user_service.get_user_by_id.await_count == 1
+    mock_decode.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_redis_layer(redis_client, monkeypatch):
+    monkeypatch.setattr(
+        "app.utils.principal_cache.get_redis_client", lambda: redis_client
+    )
+    cache = PrincipalCache(maxsize=10, ttl=30, use_redis=True, redis_ttl=60)
+    await cache.set(UserDetailResponse(id=1, email="cached@example.com"))
+
+    cache.clear()
+    user = await cache.get_by_id(1)
+    assert user.id == 1
+
+    await cache.invalidate("cached@example.com", 1)
+    assert await cache.get_by_email("cached@example.com") is None
@@ -0,0 +1,276 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db import unit_of_work as uow_module
+from app.db.postgres_init import ReplicaPool
+from app.db.repositories.user_repository import UserRepository
+from app.db.unit_of_work import (
+    UnitOfWork,
+    after_commit,
+    get_unit_of_work,
+    wrote_to_primary,
+)
+
+
+def mock_session_maker(fail: bool = False):
+    session = MagicMock()
+    session.connection = AsyncMock(
+        side_effect=ConnectionRefusedError() if fail else None
+    )
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.flush = AsyncMock()
+    session.info = {}
+    session.begin_nested = AsyncMock(
+        return_value=MagicMock(commit=AsyncMock(), rollback=AsyncMock())
+    )
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=context), session
+
+
+def add_replica(pool: ReplicaPool, fail: bool = False):
+    session_maker, session = mock_session_maker(fail)
+    pool.session_makers.append(session_maker)
+    pool._down_until.append(0.0)
+    return session
+
+
+@pytest.fixture
+def routing(monkeypatch):
+    primary_maker, primary_session = mock_session_maker()
+    pool = ReplicaPool([], retry_interval=30)
+    monkeypatch.setattr(uow_module, "async_session_maker", primary_maker)
+    monkeypatch.setattr(uow_module, "replica_pool", pool)
+    wrote_to_primary.set(False)
+    return pool, primary_session
+
+
+@pytest.mark.asyncio
+async def test_readonly_uses_replica(routing):
+    pool, primary_session = routing
+    replica_session = add_replica(pool)
+
+    async with UnitOfWork(readonly=True) as uow:
+        assert uow.session is replica_session
+
+    async with UnitOfWork() as uow:
+        assert uow.session is primary_session
+
+
+@pytest.mark.asyncio
+async def test_readonly_round_robins_replicas(routing):
+    pool, _ = routing
+    first = add_replica(pool)
+    second = add_replica(pool)
+
+    sessions = []
+    for _ in range(4):
+        async with UnitOfWork(readonly=True) as uow:
+            sessions.append(uow.session)
+
+    assert sessions == [first, second, first, second]
+
+
+@pytest.mark.asyncio
+async def test_unavailable_replica_falls_back_to_primary(routing):
+    pool, primary_session = routing
+    add_replica(pool, fail=True)
+
+    async with UnitOfWork(readonly=True) as uow:
+        assert uow.session is primary_session
+
+    assert pool._down_until[0] > 0
+    assert list(pool.candidates()) == []
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_after_commit(routing):
+    pool, primary_session = routing
+    add_replica(pool)
+
+    async with UnitOfWork() as uow:
+        uow.session.info["wrote"] = True
+
+    async with UnitOfWork(readonly=True) as uow:
+        assert uow.session is primary_session
+
+
+@pytest.mark.asyncio
+async def test_primary_read_does_not_pin_replica_routing(routing):
+    pool, _ = routing
+    replica_session = add_replica(pool)
+
+    async with UnitOfWork():
+        pass
+
+    async with UnitOfWork(readonly=True) as uow:
+        assert uow.session is replica_session
+
+
+@pytest.mark.asyncio
+async def test_request_scope_shares_one_session(routing):
+    _, primary_session = routing
+    callback = AsyncMock()
+
+    scope = get_unit_of_work()
+    await anext(scope)
+    async with UnitOfWork() as first:
+        first.session.info["wrote"] = True
+        await after_commit(callback, "user@example.com")
+    async with UnitOfWork() as second:
+        pass
+    assert first.session is second.session is primary_session
+    assert primary_session.commit.await_count == 0
+    assert primary_session.flush.await_count == 2
+    callback.assert_not_awaited()
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(scope)
+    assert primary_session.commit.await_count == 1
+    callback.assert_awaited_once_with("user@example.com")
+
+
+@pytest.mark.asyncio
+async def test_request_scope_rolls_back_on_error(routing):
+    _, primary_session = routing
+    callback = AsyncMock()
+
+    scope = get_unit_of_work()
+    await anext(scope)
+    async with UnitOfWork() as uow:
+        uow.session.info["wrote"] = True
+        await after_commit(callback)
+    with pytest.raises(ValueError):
+        await scope.athrow(ValueError("boom"))
+
+    primary_session.commit.assert_not_awaited()
+    primary_session.rollback.assert_awaited()
+    callback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_request_scope_reads_replica_until_write(routing):
+    pool, primary_session = routing
+    replica_session = add_replica(pool)
+
+    scope = get_unit_of_work()
+    await anext(scope)
+    async with UnitOfWork(readonly=True) as uow:
+        assert uow.session is replica_session
+    async with UnitOfWork() as uow:
+        assert uow.session is primary_session
+        uow.session.info["wrote"] = True
+    async with UnitOfWork(readonly=True) as uow:
+        assert uow.session is primary_session
+    with pytest.raises(StopAsyncIteration):
+        await anext(scope)
+
+
+@pytest.mark.asyncio
+async def test_request_scope_primary_read_keeps_replica_routing(routing):
+    pool, primary_session = routing
+    replica_session = add_replica(pool)
+
+    scope = get_unit_of_work()
+    await anext(scope)
+    async with UnitOfWork() as uow:
+        assert uow.session is primary_session
+    async with UnitOfWork(readonly=True) as uow:
+        assert uow.session is replica_session
+    async with UnitOfWork() as outer:
+        outer.session.info["wrote"] = True
+        async with UnitOfWork(readonly=True) as inner:
+            assert inner.session is primary_session
+    with pytest.raises(StopAsyncIteration):
+        await anext(scope)
+
+    assert wrote_to_primary.get() is False
+
+
+@pytest.mark.asyncio
+async def test_repositories_are_created_lazily(routing):
+    async with UnitOfWork() as uow:
+        assert "users" not in vars(uow)
+        users = uow.users
+        assert isinstance(users, UserRepository)
+        assert uow.users is users
+        assert "quizzes" not in vars(uow)
+        with pytest.raises(AttributeError):
+            uow.unknown
+
+
+@pytest.mark.asyncio
+async def test_readonly_skips_commit(routing):
+    _, primary_session = routing
+
+    async with UnitOfWork(readonly=True):
+        pass
+    primary_session.commit.assert_not_awaited()
+
+    async with UnitOfWork():
+        pass
+    primary_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_request_scope_without_writes_skips_commit(routing):
+    _, primary_session = routing
+
+    scope = get_unit_of_work()
+    await anext(scope)
+    async with UnitOfWork():
+        pass
+    with pytest.raises(StopAsyncIteration):
+        await anext(scope)
+
+    primary_session.commit.assert_not_awaited()
+    assert wrote_to_primary.get() is False
+
+
+@pytest.mark.asyncio
+async def test_failed_inner_unit_of_work_keeps_earlier_writes(routing):
+    _, primary_session = routing
+
+    scope = get_unit_of_work()
+    await anext(scope)
+    async with UnitOfWork() as uow:
+        uow.session.info["wrote"] = True
+    with pytest.raises(ValueError):
+        async with UnitOfWork(readonly=True):
+            raise ValueError("boom")
+    savepoint = primary_session.begin_nested.return_value
+    savepoint.rollback.assert_awaited_once()
+    primary_session.rollback.assert_not_awaited()
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(scope)
+    primary_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_after_commit_without_scope_waits_for_commit(routing):
+    _, primary_session = routing
+    callback = AsyncMock(
+        side_effect=lambda: primary_session.commit.assert_awaited_once()
+    )
+
+    async with UnitOfWork():
+        await after_commit(callback)
+        callback.assert_not_awaited()
+
+    callback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_after_commit_without_scope_skipped_on_rollback(routing):
+    callback = AsyncMock()
+
+    with pytest.raises(ValueError):
+        async with UnitOfWork():
+            await after_commit(callback)
+            raise ValueError("boom")
+
+    callback.assert_not_awaited()
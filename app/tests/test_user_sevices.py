@@ -1,8 +1,13 @@
+import json
+import re
+
 import pytest
 
-from sqlalchemy import insert, select
+from sqlalchemy import insert, select, text, update
 
 from app.schemas.user import UserSchema, UserUpdateRequestModel, GetAllUsersRequestModel
+from app.db.explain import Explain
+from app.db.repositories.user_repository import UserRepository
 from app.models.user_model import User
 
 
@@ -20,6 +25,20 @@ async def test_create_user(db_session, user_services_fixture):
     assert db_user.email == user_data.email
 
 
+@pytest.mark.asyncio
+async def test_create_user_returning_orm_object(db_session):
+    repo = UserRepository(db_session)
+
+    user = await repo.create(
+        {"username": "test", "email": "test@example.com", "about": None}, orm=True
+    )
+
+    assert isinstance(user, User)
+    assert user.id is not None
+    assert user.has_profile is True
+    assert user.created_at is not None
+
+
 @pytest.mark.asyncio
 async def test_get_all_users(db_session, user_services_fixture):
     await db_session.execute(
@@ -39,6 +58,60 @@ async def test_get_all_users(db_session, user_services_fixture):
     assert len(users_list.items) == 2
 
 
+@pytest.mark.asyncio
+async def test_get_all_users_with_cursor(db_session, user_services_fixture):
+    await db_session.execute(
+        insert(User).values(
+            [
+                {"username": f"test{i}", "email": f"test{i}@example.com"}
+                for i in range(5)
+            ]
+        )
+    )
+    await db_session.commit()
+
+    first_page = await user_services_fixture.get_all_users(limit=2, use_cursor=True)
+    assert first_page.count == 5
+    assert first_page.next_cursor is not None
+
+    seen = [user.id for user in first_page.items]
+    cursor = first_page.next_cursor
+    while cursor:
+        page = await user_services_fixture.get_all_users(limit=2, cursor=cursor)
+        assert page.count is None
+        seen.extend(user.id for user in page.items)
+        cursor = page.next_cursor
+
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_plan_has_no_sort(db_session, recorded_statements):
+    await db_session.execute(
+        insert(User).values(
+            [
+                {"username": f"test{i}", "email": f"test{i}@example.com"}
+                for i in range(3)
+            ]
+        )
+    )
+    await db_session.commit()
+    repo = UserRepository(db_session)
+    _, _, cursor = await repo.get_all_users(1, None, use_cursor=True)
+    await repo.get_all_users(1, None, cursor=cursor)
+
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    assert len(recorded_statements) == 2
+    for statement in recorded_statements:
+        plan = await db_session.scalar(Explain(statement))
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        node_types = re.findall(r'"Node Type": "([^"]+)"', json.dumps(plan))
+
+        assert "Sort" not in node_types
+        assert "Unique" not in node_types
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_id(user_services_fixture, test_user):
     user = await user_services_fixture.get_user_by_id(
@@ -57,6 +130,22 @@ async def test_get_user_by_email(user_services_fixture, test_user):
     assert user.email == "test@example.com"
 
 
+@pytest.mark.asyncio
+async def test_user_lookups_return_the_same_shape(
+    db_session, user_services_fixture, test_user
+):
+    await db_session.execute(
+        update(User).where(User.id == test_user["id"]).values(avatar_ext="png")
+    )
+    await db_session.commit()
+
+    by_id = await user_services_fixture.get_user_by_id(test_user["id"])
+    by_email = await user_services_fixture.get_user_by_email(test_user["email"])
+
+    assert by_email == by_id
+    assert by_email.avatar.endswith(f"/static/avatars/{test_user['id']}.png")
+
+
 @pytest.mark.asyncio
 async def test_update_user(db_session, user_services_fixture, test_user):
     data = UserUpdateRequestModel(username="updated")
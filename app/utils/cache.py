@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable):
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, expires_at: float):
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class ExpiringSet:
+    def __init__(self, prune_size: int = 1024):
+        self._expires_at: dict[Hashable, float] = {}
+        self.prune_size = prune_size
+        self._prune_at = prune_size
+
+    def __contains__(self, key: Hashable):
+        expires_at = self._expires_at.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._expires_at[key]
+            return False
+        return True
+
+    def __len__(self):
+        return len(self._expires_at)
+
+    def add(self, key: Hashable, expires_at: float):
+        self._expires_at[key] = expires_at
+        if len(self._expires_at) >= self._prune_at:
+            self.prune()
+
+    def prune(self):
+        now = time.time()
+        self._expires_at = {
+            key: expires_at
+            for key, expires_at in self._expires_at.items()
+            if expires_at > now
+        }
+        self._prune_at = max(self.prune_size, 2 * len(self._expires_at))
+
+    def clear(self):
+        self._expires_at.clear()
+        self._prune_at = self.prune_size
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    RedisError,
+    TimeoutError as RedisTimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RedisConnectionError):
+    pass
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, name: str, failure_threshold: int, reset_timeout: float, timeout: float
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.timeout = timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def allow(self):
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+        return True
+
+    def record_success(self):
+        self._probing = False
+        self.failures = 0
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit {self.name} closed")
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        self._probing = False
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opened += 1
+                logger.warning(
+                    f"Circuit {self.name} opened after {self.failures} failures"
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    async def call(self, operation, timeout: float | None = None):
+        if not self.allow():
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit {self.name} is open")
+        timeout = timeout if timeout is not None else self.timeout
+        try:
+            result = await asyncio.wait_for(operation(), timeout)
+        except asyncio.TimeoutError as e:
+            self.timeouts += 1
+            self.record_failure()
+            raise RedisTimeoutError(
+                f"{self.name} call exceeded {timeout * 1000:.0f}ms budget"
+            ) from e
+        except (RedisConnectionError, RedisTimeoutError, OSError):
+            self.record_failure()
+            raise
+        except RedisError:
+            self.record_success()
+            raise
+        except BaseException:
+            self._probing = False
+            raise
+        self.record_success()
+        return result
+
+    def reset(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self.opened = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def stats(self):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
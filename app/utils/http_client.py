@@ -0,0 +1,103 @@
+import asyncio
+import importlib.util
+import logging
+import random
+
+import httpx
+
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HTTPClient:
+    def __init__(
+        self,
+        timeout: float,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        retries: int,
+        retry_backoff: float,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                limits=self.limits,
+                transport=self.transport,
+            )
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self.start()
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: bool = True,
+        retries: int | None = None,
+        **kwargs,
+    ):
+        retries = self.retries if retries is None else retries
+        retry_on = (
+            httpx.TransportError
+            if idempotent
+            else (httpx.ConnectError, httpx.ConnectTimeout)
+        )
+        send = getattr(self.client, method.lower())
+        for attempt in range(retries + 1):
+            try:
+                response = await send(url, **kwargs)
+            except retry_on as e:
+                if attempt == retries:
+                    raise
+                logger.warning(f"{method} {url} failed ({e!r}), retrying")
+            else:
+                if not idempotent or response.status_code < 500 or attempt == retries:
+                    return response
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}, retrying"
+                )
+            await asyncio.sleep(
+                self.retry_backoff * 2**attempt * random.uniform(0.5, 1.5)
+            )
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, idempotent: bool = False, **kwargs):
+        return await self.request("POST", url, idempotent=idempotent, **kwargs)
+
+
+http_client = HTTPClient(
+    timeout=settings.http.TIMEOUT,
+    max_connections=settings.http.MAX_CONNECTIONS,
+    max_keepalive_connections=settings.http.MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.http.KEEPALIVE_EXPIRY,
+    retries=settings.http.RETRIES,
+    retry_backoff=settings.http.RETRY_BACKOFF,
+)
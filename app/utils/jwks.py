@@ -0,0 +1,129 @@
+import asyncio
+import json
+import logging
+import time
+
+from jose import jwk as jose_jwk
+
+from app.core.exceptions.exceptions import UnauthorizedException
+from app.utils.http_client import http_client
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+MIN_REFRESH_INTERVAL = 1.0
+
+
+class JWKSKeyStore:
+    def __init__(
+        self,
+        url: str,
+        ttl: int,
+        min_refetch_interval: int,
+        stub_file: str | None = None,
+    ):
+        self.url = url
+        self.ttl = ttl
+        self.min_refetch_interval = min_refetch_interval
+        self.stub_file = stub_file
+        self._keys: dict[str, str] = {}
+        self._fetched_at = 0.0
+        self._last_attempt = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    def _is_expired(self):
+        return time.monotonic() - self._fetched_at >= self.ttl
+
+    def _can_refetch(self):
+        return time.monotonic() - self._last_attempt >= self.min_refetch_interval
+
+    async def _fetch(self):
+        if self.stub_file:
+            with open(self.stub_file) as f:
+                return json.load(f)
+        resp = await http_client.get(self.url)
+        resp.raise_for_status()
+        return resp.json()
+
+    @staticmethod
+    def _parse(jwks: dict):
+        keys = {}
+        for key in jwks.get("keys", []):
+            try:
+                keys[key["kid"]] = jose_jwk.construct(key).to_pem().decode("utf-8")
+            except Exception:
+                logger.warning(f"Skipping unusable JWKS key: {key.get('kid')}")
+        return keys
+
+    async def refresh(self, force: bool = False):
+        async with self._lock:
+            if self._keys and not force and not self._is_expired():
+                return
+            if self._keys and not self._can_refetch():
+                return
+            self._last_attempt = time.monotonic()
+            try:
+                keys = self._parse(await self._fetch())
+            except Exception:
+                if self._keys:
+                    logger.warning("Failed to refresh JWKS, serving cached keys")
+                    return
+                logger.exception("Failed to fetch JWKS")
+                raise UnauthorizedException(detail="Failed to fetch JWKS")
+            if not keys:
+                if self._keys:
+                    logger.warning("Fetched JWKS has no usable keys, keeping cached")
+                    return
+                raise UnauthorizedException(detail="Failed to fetch JWKS")
+            self._keys = keys
+            self._fetched_at = time.monotonic()
+            logger.info(f"Loaded {len(keys)} JWKS keys")
+
+    async def get_key(self, kid: str):
+        if not self._keys or self._is_expired():
+            await self.refresh()
+        key = self._keys.get(kid)
+        if key is None and self._can_refetch():
+            logger.info(f"Unknown kid {kid}, refetching JWKS")
+            await self.refresh(force=True)
+            key = self._keys.get(kid)
+        return key
+
+    @property
+    def refresh_interval(self):
+        return max(self.ttl / 2, self.min_refetch_interval, MIN_REFRESH_INTERVAL)
+
+    async def _refresh_periodically(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh(force=True)
+            except Exception:
+                logger.exception("Background JWKS refresh failed")
+
+    def start(self):
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def clear(self):
+        self._keys = {}
+        self._fetched_at = 0.0
+        self._last_attempt = 0.0
+
+
+jwks_store = JWKSKeyStore(
+    url=f"https://{settings.auth.AUTH0_DOMAIN}/.well-known/jwks.json",
+    ttl=settings.auth.JWKS_TTL,
+    min_refetch_interval=settings.auth.JWKS_MIN_REFETCH_INTERVAL,
+    stub_file=settings.auth.JWKS_STUB_FILE,
+)
@@ -0,0 +1,33 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from app.core.exceptions.exceptions import BadRequestException
+
+
+def encode_cursor(values: list) -> str:
+    values = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("utf-8").rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: list) -> list:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("Cursor does not match sort columns")
+        decoded = []
+        for value, column in zip(values, columns):
+            python_type = column.type.python_type
+            if value is not None and python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif value is not None and python_type is int:
+                value = int(value)
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError, binascii.Error, NotImplementedError):
+        raise BadRequestException(detail="Invalid cursor")
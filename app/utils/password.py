@@ -1,15 +1,80 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from app.utils.settings_model import settings
+
 
 class PasswordServices:
-    @staticmethod
-    def hash_password(password):
-        hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    def __init__(self, rounds: int, max_workers: int):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bcrypt"
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+
+    def hash_password(self, password):
+        hashed = bcrypt.hashpw(
+            password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)
+        )
         return hashed.decode("utf-8")
 
     @staticmethod
     def check_password(password, hashed_password):
         return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
 
+    def needs_rehash(self, hashed_password):
+        return int(hashed_password.split("$")[2]) != self.rounds
+
+    async def _run_in_pool(self, fn, *args):
+        with self._lock:
+            self.queued += 1
+        started = False
+
+        def job():
+            nonlocal started
+            with self._lock:
+                started = True
+                self.queued -= 1
+                self.running += 1
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        def release(_):
+            with self._lock:
+                if not started:
+                    self.queued -= 1
+
+        future = self._executor.submit(job)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def hash_password_async(self, password):
+        return await self._run_in_pool(self.hash_password, password)
+
+    async def check_password_async(self, password, hashed_password):
+        return await self._run_in_pool(self.check_password, password, hashed_password)
+
+    def stats(self):
+        return {
+            "workers": self.max_workers,
+            "queued": self.queued,
+            "running": self.running,
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
 
-password_services = PasswordServices()
+password_services = PasswordServices(
+    rounds=settings.password.BCRYPT_ROUNDS,
+    max_workers=settings.password.BCRYPT_MAX_WORKERS,
+)
@@ -0,0 +1,77 @@
+import logging
+import time
+
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.db.redis_init import get_redis_client
+from app.db.repositories.redis.user_redis_repository import UserRedisRepository
+from app.schemas.user import UserDetailResponse
+from app.utils.cache import LRUCache
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PrincipalCache:
+    def __init__(self, maxsize: int, ttl: int, use_redis: bool, redis_ttl: int):
+        self.local = LRUCache(maxsize=maxsize)
+        self.ttl = ttl
+        self.use_redis = use_redis
+        self.redis_ttl = redis_ttl
+
+    async def _get(self, key: tuple, fetch):
+        user = self.local.get(key)
+        if user is None and self.use_redis:
+            try:
+                data = await fetch(UserRedisRepository(get_redis_client()))
+            except RedisRepositoryError as e:
+                logger.warning(f"Principal cache read failed: {e}")
+                data = None
+            if data:
+                user = UserDetailResponse.model_validate(data)
+                self.local.set(key, user, expires_at=time.time() + self.ttl)
+        return user.model_copy() if user is not None else None
+
+    async def get_by_email(self, email: str):
+        return await self._get(
+            ("email", email), lambda repo: repo.get_user_by_email(email)
+        )
+
+    async def get_by_id(self, user_id: int):
+        return await self._get(
+            ("id", user_id), lambda repo: repo.get_user_by_id(user_id)
+        )
+
+    async def set(self, user: UserDetailResponse):
+        expires_at = time.time() + self.ttl
+        self.local.set(("email", user.email), user.model_copy(), expires_at)
+        self.local.set(("id", user.id), user.model_copy(), expires_at)
+        if self.use_redis:
+            try:
+                await UserRedisRepository(get_redis_client()).save_user(
+                    user.model_dump(mode="json"), expire=self.redis_ttl
+                )
+            except RedisRepositoryError as e:
+                logger.warning(f"Principal cache write failed: {e}")
+
+    async def invalidate(self, email: str, user_id: int | None = None):
+        self.local.delete(("email", email))
+        if user_id is not None:
+            self.local.delete(("id", user_id))
+        if self.use_redis:
+            try:
+                await UserRedisRepository(get_redis_client()).delete_user(
+                    email, user_id
+                )
+            except RedisRepositoryError as e:
+                logger.warning(f"Principal cache invalidation failed: {e}")
+
+    def clear(self):
+        self.local.clear()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.cache.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.cache.PRINCIPAL_CACHE_TTL,
+    use_redis=settings.cache.PRINCIPAL_CACHE_REDIS,
+    redis_ttl=settings.cache.PRINCIPAL_CACHE_REDIS_TTL,
+)
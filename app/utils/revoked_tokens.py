@@ -0,0 +1,47 @@
+import logging
+import math
+import time
+
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.db.redis_init import get_redis_client
+from app.db.repositories.redis.token_redis_repository import TokenRedisRepository
+from app.utils.cache import ExpiringSet
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RevokedTokens:
+    def __init__(self, use_redis: bool):
+        self.local = ExpiringSet()
+        self.use_redis = use_redis
+
+    async def contains(self, digest: str):
+        if digest in self.local:
+            return True
+        if not self.use_redis:
+            return False
+        try:
+            revocation = await TokenRedisRepository(get_redis_client()).get_revocation(
+                digest
+            )
+        except RedisRepositoryError as e:
+            logger.warning(f"Token revocation check failed: {e}")
+            return False
+        if revocation is None:
+            return False
+        self.local.add(digest, expires_at=revocation["expires_at"])
+        return True
+
+    async def add(self, digest: str, expires_at: float):
+        self.local.add(digest, expires_at=expires_at)
+        if self.use_redis:
+            await TokenRedisRepository(get_redis_client()).revoke(
+                digest, expires_at, expire=max(1, math.ceil(expires_at - time.time()))
+            )
+
+    def clear(self):
+        self.local.clear()
+
+
+revoked_tokens = RevokedTokens(use_redis=settings.auth.REVOKED_TOKENS_REDIS)
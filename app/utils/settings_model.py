@@ -14,14 +14,38 @@ class PostgresConfig(BaseConfig):
     TEST_DB: str = Field(..., alias="TEST_POSTGRES_DB")
     URL: str = Field(..., alias="POSTGRES_URL")
     TEST_URL: str = Field(..., alias="TEST_POSTGRES_URL")
+    POOL_SIZE: int = Field(5, alias="POSTGRES_POOL_SIZE")
+    MAX_OVERFLOW: int = Field(10, alias="POSTGRES_MAX_OVERFLOW")
+    POOL_TIMEOUT: float = Field(30.0, alias="POSTGRES_POOL_TIMEOUT")
+    POOL_RECYCLE: int = Field(1800, alias="POSTGRES_POOL_RECYCLE")
+    POOL_PRE_PING: bool = Field(True, alias="POSTGRES_POOL_PRE_PING")
+    STATEMENT_CACHE_SIZE: int = Field(100, alias="POSTGRES_STATEMENT_CACHE_SIZE")
+    STATEMENT_TIMEOUT: int = Field(30000, alias="POSTGRES_STATEMENT_TIMEOUT")
+    ECHO: bool = Field(False, alias="POSTGRES_ECHO")
+    REPLICA_URLS: list[str] = Field([], alias="POSTGRES_REPLICA_URLS")
+    REPLICA_RETRY_INTERVAL: int = Field(30, alias="POSTGRES_REPLICA_RETRY_INTERVAL")
+    READ_YOUR_WRITES: bool = Field(True, alias="POSTGRES_READ_YOUR_WRITES")
+    BULK_INSERT_BATCH_SIZE: int = Field(1000, alias="POSTGRES_BULK_INSERT_BATCH_SIZE")
+    BULK_COPY_THRESHOLD: int = Field(500, alias="POSTGRES_BULK_COPY_THRESHOLD")
+    BULK_UPDATE_BATCH_SIZE: int = Field(1000, alias="POSTGRES_BULK_UPDATE_BATCH_SIZE")
 
     def get_url(self, env: str) -> str:
         return self.TEST_URL if env == "test" else self.URL
 
+    def get_connect_args(self) -> dict:
+        return {
+            "statement_cache_size": self.STATEMENT_CACHE_SIZE,
+            "server_settings": {"statement_timeout": str(self.STATEMENT_TIMEOUT)},
+        }
+
 
 class RedisConfig(BaseConfig):
     PORT: str = Field(..., alias="REDIS_PORT")
     HOST: str = Field(..., alias="REDIS_HOST")
+    ANSWER_CODEC: str = Field("struct", alias="REDIS_ANSWER_CODEC")
+    OPERATION_TIMEOUT_MS: int = Field(100, alias="REDIS_OPERATION_TIMEOUT_MS")
+    BREAKER_FAILURE_THRESHOLD: int = Field(5, alias="REDIS_BREAKER_FAILURE_THRESHOLD")
+    BREAKER_RESET_TIMEOUT: float = Field(10, alias="REDIS_BREAKER_RESET_TIMEOUT")
 
 
 class AuthConfig(BaseConfig):
@@ -30,6 +54,59 @@ class AuthConfig(BaseConfig):
     API_AUDIENCE: str
     CLIENT_ID: str
     CLIENT_SECRET: str
+    JWKS_TTL: int = 3600
+    JWKS_MIN_REFETCH_INTERVAL: int = 30
+    JWKS_STUB_FILE: str | None = None
+    TOKEN_CACHE_SIZE: int = 10000
+    REVOKED_TOKENS_REDIS: bool = True
+
+
+class HTTPConfig(BaseConfig):
+    TIMEOUT: float = Field(5.0, alias="HTTP_TIMEOUT")
+    MAX_CONNECTIONS: int = Field(100, alias="HTTP_MAX_CONNECTIONS")
+    MAX_KEEPALIVE_CONNECTIONS: int = Field(20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    KEEPALIVE_EXPIRY: float = Field(30.0, alias="HTTP_KEEPALIVE_EXPIRY")
+    RETRIES: int = Field(2, alias="HTTP_RETRIES")
+    RETRY_BACKOFF: float = Field(0.2, alias="HTTP_RETRY_BACKOFF")
+
+
+class PasswordConfig(BaseConfig):
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_MAX_WORKERS: int = 4
+
+
+class CacheConfig(BaseConfig):
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL: int = 30
+    PRINCIPAL_CACHE_REDIS: bool = False
+    PRINCIPAL_CACHE_REDIS_TTL: int = 300
+    COUNT_CACHE_SIZE: int = 1000
+    COUNT_CACHE_TTL: int = 60
+
+
+class SubmissionConfig(BaseConfig):
+    QUIZ_SUBMIT_ASYNC: bool = False
+    SUBMISSION_STREAM: str = "quiz:submissions"
+    SUBMISSION_GROUP: str = "submission-workers"
+    SUBMISSION_DEAD_LETTER_STREAM: str = "quiz:submissions:dead"
+    SUBMISSION_STREAM_MAXLEN: int = 1000000
+    SUBMISSION_BATCH_SIZE: int = 100
+    SUBMISSION_BLOCK_MS: int = 1000
+    SUBMISSION_CLAIM_IDLE_MS: int = 60000
+    SUBMISSION_MAX_ATTEMPTS: int = 5
+
+
+class MonitoringConfig(BaseConfig):
+    QUERY_STATS_ENABLED: bool = True
+    SLOW_REQUEST_QUERIES: int = 20
+    SLOW_REQUEST_DB_MS: float = 200
+    REPEATED_QUERY_THRESHOLD: int = 0
+    SLOW_QUERY_MS: float = 500
+    SLOW_QUERY_BUFFER_SIZE: int = 100
+    SLOW_QUERY_EXPLAIN: bool = True
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
+    SLOW_QUERY_EXPLAIN_INTERVAL: int = 300
+    OPERATOR_EMAILS: list[str] = []
 
 
 class Settings(BaseConfig):
@@ -46,6 +123,11 @@ class Settings(BaseConfig):
     db: PostgresConfig = PostgresConfig()
     redis: RedisConfig = RedisConfig()
     auth: AuthConfig = AuthConfig()
+    cache: CacheConfig = CacheConfig()
+    password: PasswordConfig = PasswordConfig()
+    http: HTTPConfig = HTTPConfig()
+    monitoring: MonitoringConfig = MonitoringConfig()
+    submission: SubmissionConfig = SubmissionConfig()
 
 
 settings = Settings()
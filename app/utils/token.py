@@ -1,18 +1,25 @@
-import httpx
+import hashlib
 import logging
+import time
 
 from datetime import datetime, timedelta
 from fastapi import Header, Depends
 from jose import JWTError, jwt
-from jose import jwk as jose_jwk
 from fastapi.security import HTTPBearer
 
 from app.core.exceptions.exceptions import (
+    AppException,
     UnauthorizedException,
     ForbiddenException,
     ConflictException,
 )
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.schemas.user import UserDetailResponse
 from app.services.user import UserServices, get_user_service
+from app.utils.cache import LRUCache
+from app.utils.jwks import jwks_store
+from app.utils.principal_cache import principal_cache
+from app.utils.revoked_tokens import revoked_tokens
 from app.utils.settings_model import settings
 
 AUTH0_DOMAIN = settings.auth.AUTH0_DOMAIN
@@ -24,49 +31,84 @@ auth_scheme = HTTPBearer()
 
 logger = logging.getLogger(__name__)
 
+verified_tokens = LRUCache(maxsize=settings.auth.TOKEN_CACHE_SIZE)
+
+
+def token_digest(token: str):
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
 
 class TokenServices:
     @staticmethod
-    async def decode_auth0_token(token: str):
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(f"https://{AUTH0_DOMAIN}/.well-known/jwks.json")
-                jwks = resp.json()
-            except Exception:
-                logger.exception("Failed to fetch JWKS")
-                raise UnauthorizedException(detail="Failed to fetch JWKS")
+    async def ensure_not_revoked(digest: str):
+        if await revoked_tokens.contains(digest):
+            logger.error("Token revoked")
+            raise UnauthorizedException(detail="Token revoked.")
+
+    async def decode_auth0_token(self, token: str):
+        digest = token_digest(token)
+        await self.ensure_not_revoked(digest)
+        cached = verified_tokens.get(digest)
+        if cached is not None:
+            return dict(cached)
+
         try:
             header = jwt.get_unverified_header(token)
         except Exception:
             logger.exception("Invalid header")
             raise UnauthorizedException(detail="Invalid header")
 
-        rsa_key = None
-        for key in jwks["keys"]:
-            if key["kid"] == header["kid"]:
-                rsa_key = jose_jwk.construct(key)
-                break
-
+        rsa_key = await jwks_store.get_key(header.get("kid"))
         if not rsa_key:
-            logger.exception("Public key not found")
+            logger.error("Public key not found")
             raise UnauthorizedException(detail="Public key not found.")
 
         try:
             payload = jwt.decode(
                 token,
-                key=rsa_key.to_pem().decode("utf-8"),
+                key=rsa_key,
                 algorithms=[AUTH0_ALGORITHM],
                 audience=API_AUDIENCE,
                 issuer=f"https://{AUTH0_DOMAIN}/",
             )
-            return payload
-
         except jwt.ExpiredSignatureError:
             logger.error("Token expired")
             raise UnauthorizedException(detail="Token expired.")
         except jwt.JWTClaimsError:
             logger.error("Incorrect claims")
             raise UnauthorizedException(detail="Incorrect claims.")
+        except JWTError:
+            logger.error("Invalid token signature")
+            raise UnauthorizedException(detail="Invalid token.")
+
+        if payload.get("exp"):
+            verified_tokens.set(digest, dict(payload), expires_at=payload["exp"])
+        return payload
+
+    @staticmethod
+    async def revoke_token(token: str):
+        digest = token_digest(token)
+        try:
+            expires_at = jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            expires_at = None
+        if not expires_at:
+            expires_at = time.time() + settings.EXP_TIME * 60
+        verified_tokens.delete(digest)
+        try:
+            await revoked_tokens.add(digest, expires_at=expires_at)
+        except RedisRepositoryError as e:
+            logger.error(f"Redis error: {e}")
+            raise AppException(detail="Failed to revoke token.")
+
+    @staticmethod
+    def is_local_token(token: str):
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            logger.error("Invalid header")
+            raise UnauthorizedException(detail="Invalid header")
+        return header.get("alg") == ALGORITHM and "kid" not in header
 
     async def get_data_from_token(
         self,
@@ -76,14 +118,34 @@ class TokenServices:
         token = authorization.removeprefix("Bearer ")
         if not token:
             raise UnauthorizedException(detail="Missing Bearer token")
+        if self.is_local_token(token):
+            return await self.get_user_from_local_token(token, user_service)
+        return await self.get_user_from_auth0_token(token, user_service)
+
+    async def get_user_from_local_token(self, token: str, user_service: UserServices):
+        await self.ensure_not_revoked(token_digest(token))
+        data = self.decode_token(token)
+        user_id = data.get("id")
+        if not user_id:
+            raise UnauthorizedException(detail="Invalid token: no id claim")
+        current_user = await principal_cache.get_by_id(user_id)
+        if current_user is None:
+            current_user = await user_service.get_user_by_id(user_id)
+            await principal_cache.set(current_user)
+        return current_user
+
+    async def get_user_from_auth0_token(self, token: str, user_service: UserServices):
         data = await self.decode_auth0_token(token)
         logger.info(data)
         email = data.get("email")
         if not email:
             raise UnauthorizedException(detail="Invalid token: no email claim")
-        current_user = await user_service.get_user_by_email(data["email"])
-        if not current_user:
-            raise ConflictException("Authenticated user does not exist")
+        current_user = await principal_cache.get_by_email(email)
+        if current_user is None:
+            current_user = await user_service.get_user_by_email(email)
+            if not current_user:
+                raise ConflictException("Authenticated user does not exist")
+            await principal_cache.set(current_user)
         return current_user
 
     @staticmethod
@@ -108,3 +170,11 @@ class TokenServices:
 
 
 token_services = TokenServices()
+
+
+async def get_operator(
+    current_user: UserDetailResponse = Depends(token_services.get_data_from_token),
+):
+    if current_user.email not in settings.monitoring.OPERATOR_EMAILS:
+        raise ForbiddenException(detail="Operator access required")
+    return current_user
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import tempfile
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk as jose_jwk, jwt
+
+from app.schemas.user import UserDetailResponse
+from app.utils.jwks import jwks_store
+from app.utils.settings_model import settings
+from app.utils.token import token_services, verified_tokens
+
+ITERATIONS = 1000
+
+
+def make_stub_keys():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    key = jose_jwk.construct(public_pem, "RS256").to_dict()
+    key["kid"] = "bench-kid"
+    stub = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+    json.dump({"keys": [key]}, stub)
+    stub.close()
+    return private_pem.decode("utf-8"), stub.name
+
+
+def make_auth0_token(private_pem: str):
+    return jwt.encode(
+        {
+            "email": "bench@example.com",
+            "aud": settings.auth.API_AUDIENCE,
+            "iss": f"https://{settings.auth.AUTH0_DOMAIN}/",
+            "exp": int(time.time()) + 3600,
+        },
+        private_pem,
+        algorithm="RS256",
+        headers={"kid": "bench-kid"},
+    )
+
+
+class StubUserService:
+    user = UserDetailResponse(id=1, email="bench@example.com")
+
+    async def get_user_by_email(self, email: str):
+        return self.user
+
+    async def get_user_by_id(self, user_id: int, email: str | None = None):
+        return self.user
+
+
+async def measure(name: str, token: str, reset=None):
+    user_service = StubUserService()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        if reset:
+            reset()
+        await token_services.get_data_from_token(f"Bearer {token}", user_service)
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed / ITERATIONS * 1000:.3f} ms/request")
+
+
+def reset_auth0_caches():
+    jwks_store.clear()
+    verified_tokens.clear()
+
+
+async def main():
+    private_pem, stub_file = make_stub_keys()
+    jwks_store.stub_file = stub_file
+    auth0_token = make_auth0_token(private_pem)
+    local_token = token_services.create_access_token(1)
+    await measure("auth0 (jwks reloaded per call)", auth0_token, reset_auth0_caches)
+    await measure("auth0 (cached jwks)", auth0_token, verified_tokens.clear)
+    await measure("auth0 (cached claims)", auth0_token)
+    await measure("local hs256", local_token)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
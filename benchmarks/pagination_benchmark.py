@@ -0,0 +1,77 @@
+import asyncio
+import os
+import time
+
+from sqlalchemy import delete, func, select, text
+
+from app.core.enums.enums import CountMode
+from app.db.postgres_init import async_session_maker
+from app.db.repositories.user_repository import UserRepository
+from app.models.user_model import User
+from app.utils.pagination import encode_cursor
+
+ROWS = int(os.getenv("BENCH_ROWS", 1_000_000))
+PAGE_SIZE = 20
+ITERATIONS = 20
+BENCH_DOMAIN = "@pagination.bench"
+
+
+async def seed(session):
+    existing = await session.scalar(
+        select(func.count()).where(User.email.like(f"%{BENCH_DOMAIN}"))
+    )
+    if existing >= ROWS:
+        return
+    await session.execute(
+        text(
+            "INSERT INTO users (username, email, has_profile, created_at, updated_at) "
+            "SELECT 'bench' || i, 'bench' || i || :domain, true, now(), now() "
+            "FROM generate_series(:start, :stop) AS i"
+        ),
+        {"domain": BENCH_DOMAIN, "start": existing + 1, "stop": ROWS},
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE users"))
+
+
+async def cursor_at(session, depth: int):
+    if depth == 0:
+        return None
+    last_id = await session.scalar(
+        select(User.id)
+        .where(User.has_profile.is_(True))
+        .order_by(User.id)
+        .offset(depth - 1)
+        .limit(1)
+    )
+    return encode_cursor([last_id])
+
+
+async def measure(session, name: str, **kwargs):
+    repo = UserRepository(session)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await repo.get_all_users(limit=PAGE_SIZE, count_mode=CountMode.NONE, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed / ITERATIONS * 1000:.2f} ms/page")
+
+
+async def main():
+    async with async_session_maker() as session:
+        await seed(session)
+        depths = [0, ROWS // 100, ROWS // 10, ROWS // 2, ROWS - PAGE_SIZE]
+        for depth in depths:
+            await measure(session, f"offset  depth={depth}", offset=depth)
+            cursor = await cursor_at(session, depth)
+            await measure(
+                session, f"cursor  depth={depth}", cursor=cursor, use_cursor=True
+            )
+        if os.getenv("BENCH_CLEANUP"):
+            await session.execute(
+                delete(User).where(User.email.like(f"%{BENCH_DOMAIN}"))
+            )
+            await session.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import os
+import time
+
+import fakeredis
+
+from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
+
+KEYS = int(os.getenv("BENCH_KEYS", 10_000_000))
+ANSWERS_PER_USER = 20
+BATCH = 10_000
+LOOKUPS = 20
+
+
+def make_answer(i: int):
+    return {
+        "quiz_id": i % 50,
+        "company_id": i % 7,
+        "answer_id": i,
+        "participant_id": i // ANSWERS_PER_USER,
+        "user_id": i // ANSWERS_PER_USER,
+        "record_id": i // ANSWERS_PER_USER,
+    }
+
+
+async def seed_scan_keys(redis):
+    for start in range(0, KEYS, BATCH):
+        pipe = redis.pipeline()
+        for i in range(start, min(start + BATCH, KEYS)):
+            answer = make_answer(i)
+            key = f"{answer['user_id']}:{answer['quiz_id']}:{answer['company_id']}:{i}"
+            pipe.set(key, json.dumps(answer), ex=QuizRedisRepository.expire)
+        await pipe.execute()
+
+
+async def seed_indexes(redis):
+    repository = QuizRedisRepository(redis)
+    for start in range(0, KEYS, BATCH):
+        await repository.save_answers(
+            [make_answer(i) for i in range(start, min(start + BATCH, KEYS))]
+        )
+
+
+async def scan_lookup(redis, user_id: int):
+    keys = [key async for key in redis.scan_iter(match=f"{user_id}:*:*:*", count=1000)]
+    return [json.loads(value) for value in await redis.mget(*keys)] if keys else []
+
+
+async def index_lookup(redis, user_id: int):
+    return await QuizRedisRepository(redis).get_answers_for_user(user_id)
+
+
+async def measure(name: str, seed, lookup):
+    redis = fakeredis.aioredis.FakeRedis()
+    start = time.perf_counter()
+    await seed(redis)
+    print(f"{name}: seeded {KEYS} answers in {time.perf_counter() - start:.1f} s")
+    users = KEYS // ANSWERS_PER_USER
+    start = time.perf_counter()
+    for step in range(LOOKUPS):
+        answers = await lookup(redis, step * users // LOOKUPS)
+        assert len(answers) == ANSWERS_PER_USER
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed / LOOKUPS * 1000:.3f} ms/lookup")
+    await redis.flushall()
+    await redis.aclose()
+
+
+async def main():
+    await measure("scan + mget", seed_scan_keys, scan_lookup)
+    await measure("hash index", seed_indexes, index_lookup)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import os
+
+from app.db.redis_init import get_redis_client
+from app.db.repositories.redis.codecs import codecs
+from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
+
+USERS = int(os.getenv("BENCH_USERS", 1000))
+RECORDS_PER_USER = 5
+ANSWERS_PER_RECORD = 10
+
+
+class BenchQuizRedisRepository(QuizRedisRepository):
+    namespace = "bench:quiz:answers"
+
+
+def make_answers():
+    answers = []
+    for user_id in range(USERS):
+        for record in range(RECORDS_PER_USER):
+            record_id = user_id * RECORDS_PER_USER + record
+            for answer in range(ANSWERS_PER_RECORD):
+                answers.append(
+                    {
+                        "quiz_id": record_id % 50,
+                        "company_id": user_id % 7,
+                        "answer_id": record_id * ANSWERS_PER_RECORD + answer,
+                        "participant_id": record_id,
+                        "user_id": user_id,
+                        "record_id": record_id,
+                    }
+                )
+    return answers
+
+
+async def memory_usage(redis, pattern: str):
+    total = 0
+    keys = 0
+    async for key in redis.scan_iter(match=pattern, count=1000):
+        total += await redis.memory_usage(key, samples=0) or 0
+        keys += 1
+    await redis.delete(*[key async for key in redis.scan_iter(match=pattern)])
+    return keys, total
+
+
+async def main():
+    redis = get_redis_client()
+    answers = make_answers()
+
+    pipe = redis.pipeline()
+    for answer in answers:
+        key = "bench:{user_id}:{quiz_id}:{company_id}:{answer_id}".format(**answer)
+        pipe.set(key, json.dumps(answer), ex=QuizRedisRepository.expire)
+    await pipe.execute()
+    keys, total = await memory_usage(redis, "bench:[0-9]*")
+    print(f"legacy json keys: {keys} keys, {total / len(answers):.1f} B/answer")
+
+    for name, codec in codecs.items():
+        await BenchQuizRedisRepository(redis, codec=codec).save_answers(answers)
+        keys, total = await memory_usage(redis, "bench:quiz:answers:*")
+        print(f"v2 {name}: {keys} keys, {total / len(answers):.1f} B/answer")
+
+    await redis.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
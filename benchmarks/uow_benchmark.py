@@ -0,0 +1,128 @@
+import asyncio
+import os
+import time
+
+from app.db import unit_of_work as uow_module
+from app.db.repositories.company_repository import CompanyRepository
+from app.db.repositories.membership_repository import MembershipRepository
+from app.db.repositories.membership_requests_repository import (
+    MembershipRequestsRepository,
+)
+from app.db.repositories.notification_repository import NotificationsRepository
+from app.db.repositories.quizzes.answer_repository import AnswerRepository
+from app.db.repositories.quizzes.participant_repository import QuizParticipantRepository
+from app.db.repositories.quizzes.question_repository import QuestionRepository
+from app.db.repositories.quizzes.quiz_repository import QuizRepository
+from app.db.repositories.quizzes.record_repository import RecordsRepository
+from app.db.repositories.user_repository import UserRepository
+from app.db.unit_of_work import UnitOfWork
+
+ITERATIONS = 20000
+ROUND_TRIP = float(os.getenv("BENCH_ROUND_TRIP_MS", 0)) / 1000
+
+
+async def round_trip():
+    if ROUND_TRIP:
+        await asyncio.sleep(ROUND_TRIP)
+
+
+class StubSession:
+    def __init__(self):
+        self.info = {}
+
+    async def commit(self):
+        await round_trip()
+
+    async def rollback(self):
+        await round_trip()
+
+    async def flush(self):
+        pass
+
+
+class StubSessionContext:
+    async def __aenter__(self):
+        return StubSession()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class BaselineUnitOfWork:
+    """The eager unit of work as it was before repositories became lazy."""
+
+    def __init__(self, session=None):
+        self._external_session = session
+        self.session = None
+        self.users = None
+        self.companies = None
+        self.memberships = None
+        self.membership_requests = None
+        self.quizzes = None
+        self.questions = None
+        self.answers = None
+        self.participants = None
+        self.records = None
+        self.notifications = None
+
+    async def __aenter__(self):
+        if self._external_session:
+            self.session = self._external_session
+        else:
+            self._session_context = StubSessionContext()
+            self.session = await self._session_context.__aenter__()
+
+        self.users = UserRepository(self.session)
+        self.companies = CompanyRepository(self.session)
+        self.memberships = MembershipRepository(self.session)
+        self.membership_requests = MembershipRequestsRepository(self.session)
+        self.quizzes = QuizRepository(self.session)
+        self.questions = QuestionRepository(self.session)
+        self.answers = AnswerRepository(self.session)
+        self.participants = QuizParticipantRepository(self.session)
+        self.records = RecordsRepository(self.session)
+        self.notifications = NotificationsRepository(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type:
+            await self.session.rollback()
+        else:
+            await self.session.commit()
+
+        if not self._external_session:
+            await self._session_context.__aexit__(exc_type, exc_val, exc_tb)
+
+
+async def baseline_unit_of_work():
+    async with BaselineUnitOfWork() as uow:
+        uow.users
+
+
+async def lazy_unit_of_work():
+    async with UnitOfWork() as uow:
+        uow.users
+
+
+async def lazy_readonly_unit_of_work():
+    async with UnitOfWork(readonly=True) as uow:
+        uow.users
+
+
+async def measure(name: str, work):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await work()
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {elapsed / ITERATIONS * 1_000_000:.1f} us/unit of work")
+
+
+async def main():
+    uow_module.async_session_maker = StubSessionContext
+    await measure("eager, one repository + commit (before)", baseline_unit_of_work)
+    await measure("lazy, one repository + commit", lazy_unit_of_work)
+    await measure("lazy, one repository, readonly (after)", lazy_readonly_unit_of_work)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
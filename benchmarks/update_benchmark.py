@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from sqlalchemy import case, insert, update
+
+from app.db.postgres_init import async_session_maker
+from app.db.repositories.user_repository import UserRepository
+from app.models.user_model import User
+
+ROW_COUNTS = [10, 100, 10_000]
+ITERATIONS = 5
+
+
+async def update_with_case(session, data: list[dict]):
+    stmt = (
+        update(User)
+        .where(User.id.in_([row["id"] for row in data]))
+        .values(
+            username=case({row["id"]: row["username"] for row in data}, value=User.id)
+        )
+    )
+    await session.execute(stmt)
+
+
+async def measure(name: str, rows: int, apply):
+    async with async_session_maker() as session:
+        result = await session.execute(
+            insert(User)
+            .values(
+                [
+                    {"username": f"bench{i}", "email": f"bench{i}@update.bench"}
+                    for i in range(rows)
+                ]
+            )
+            .returning(User.id)
+        )
+        ids = [row[0] for row in result.fetchall()]
+        start = time.perf_counter()
+        for iteration in range(ITERATIONS):
+            await apply(
+                session,
+                [{"id": i, "username": f"bench{i}-{iteration}"} for i in ids],
+            )
+        elapsed = time.perf_counter() - start
+        await session.rollback()
+    print(f"{name} x{rows}: {elapsed / ITERATIONS * 1000:.3f} ms/update")
+
+
+async def main():
+    for rows in ROW_COUNTS:
+        await measure("case", rows, update_with_case)
+        await measure(
+            "unnest",
+            rows,
+            lambda session, data: UserRepository(session).update_many(data),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
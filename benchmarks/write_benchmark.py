@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from app.core.enums.enums import NotificationStatus
+from app.db.postgres_init import async_session_maker
+from app.db.repositories.notification_repository import NotificationsRepository
+from app.db.repositories.user_repository import UserRepository
+from app.models.notifications_model import Notification
+from app.models.user_model import User
+
+ITERATIONS = 500
+
+
+async def orm_flush_refresh(session, model, data: dict):
+    new = model(**data)
+    session.add(new)
+    await session.flush()
+    await session.refresh(new)
+    return new.id
+
+
+async def measure(name: str, create):
+    async with async_session_maker() as session:
+        start = time.perf_counter()
+        for i in range(ITERATIONS):
+            await create(session, i)
+        elapsed = time.perf_counter() - start
+        await session.rollback()
+    print(f"{name}: {elapsed / ITERATIONS * 1000:.3f} ms/insert")
+
+
+def user_data(i: int):
+    return {"username": f"bench{i}", "email": f"bench{i}@write.bench"}
+
+
+def notification_data(i: int):
+    return {"status": NotificationStatus.UNREAD, "message": f"bench {i}"}
+
+
+async def main():
+    await measure(
+        "user: add + flush + refresh",
+        lambda session, i: orm_flush_refresh(session, User, user_data(i)),
+    )
+    await measure(
+        "user: insert returning",
+        lambda session, i: UserRepository(session).create(user_data(i)),
+    )
+    await measure(
+        "notification: add + flush + refresh",
+        lambda session, i: orm_flush_refresh(
+            session, Notification, notification_data(i)
+        ),
+    )
+    await measure(
+        "notification: insert returning",
+        lambda session, i: NotificationsRepository(session).create(
+            notification_data(i)
+        ),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
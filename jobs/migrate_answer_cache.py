@@ -0,0 +1,70 @@
+import asyncio
+import json
+import logging
+import re
+
+from redis.asyncio import Redis
+
+from app.db.redis_init import get_redis_client
+from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
+
+logger = logging.getLogger(__name__)
+
+LEGACY_KEY = re.compile(rb"^\d+:\d+:\d+:\d+$")
+LEGACY_USER_INDEX = re.compile(rb"^answers:user:\d+$")
+LEGACY_QUIZ_INDEX = re.compile(rb"^answers:user:\d+:quiz:\d+$")
+
+
+def is_legacy_key(key: bytes):
+    return any(
+        pattern.match(key)
+        for pattern in (LEGACY_KEY, LEGACY_USER_INDEX, LEGACY_QUIZ_INDEX)
+    )
+
+
+async def read_legacy_answers(redis: Redis, key: bytes):
+    if LEGACY_KEY.match(key):
+        value = await redis.get(key)
+        return [json.loads(value)] if value is not None else []
+    if LEGACY_USER_INDEX.match(key):
+        return [json.loads(value) for value in await redis.hvals(key)]
+    return []
+
+
+async def merge_answers(repository: QuizRedisRepository, answers: list[dict]):
+    records = repository.group_records(answers)
+    for record in records:
+        existing = await repository.get_record(record["user_id"], record["record_id"])
+        if existing:
+            record["answer_ids"] = sorted(
+                set(existing["answer_ids"]) | set(record["answer_ids"])
+            )
+    await repository.save_records(records)
+
+
+async def migrate_answer_cache(redis: Redis, batch_size: int = 1000):
+    repository = QuizRedisRepository(redis)
+    migrated = 0
+    async for key in redis.scan_iter(count=batch_size):
+        if not is_legacy_key(key):
+            continue
+        answers = await read_legacy_answers(redis, key)
+        if answers:
+            await merge_answers(repository, answers)
+        await redis.delete(key)
+        migrated += 1
+    logger.info(f"Migrated {migrated} legacy answer cache keys")
+    return migrated
+
+
+async def main():
+    redis = get_redis_client()
+    try:
+        await migrate_answer_cache(redis)
+    finally:
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+
+from app.core.exceptions.exceptions import BadRequestException
+from app.core.exceptions.repository_exceptions import RedisRepositoryError
+from app.db.redis_init import get_redis_client
+from app.db.repositories.redis.quiz_redis_repository import QuizRedisRepository
+from app.db.repositories.redis.submission_stream_repository import (
+    SubmissionStreamRepository,
+)
+from app.schemas.quiz import QuizSubmissionSchema
+from app.services.quiz import QuizServices, get_quiz_service
+from app.utils.settings_model import settings
+
+logger = logging.getLogger(__name__)
+
+STATS_INTERVAL = 60
+RETRY_DELAY = 1
+
+
+class SubmissionWorker:
+    def __init__(
+        self,
+        stream: SubmissionStreamRepository,
+        cache: QuizRedisRepository,
+        quiz_service: QuizServices,
+        consumer: str,
+        batch_size: int,
+        block_ms: int,
+        claim_idle_ms: int,
+        max_attempts: int,
+    ):
+        self.stream = stream
+        self.cache = cache
+        self.quiz_service = quiz_service
+        self.consumer = consumer
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.max_attempts = max_attempts
+
+    async def run_once(self):
+        entries = await self.stream.claim_stale(
+            self.consumer, self.claim_idle_ms, self.batch_size
+        )
+        if not entries:
+            entries = await self.stream.read(
+                self.consumer, self.batch_size, self.block_ms
+            )
+        if entries:
+            await self.process(entries)
+        return len(entries)
+
+    async def process(self, entries: list[tuple[str, dict]]):
+        submissions = []
+        for entry_id, data in entries:
+            try:
+                submissions.append((entry_id, QuizSubmissionSchema(**data)))
+            except ValueError as e:
+                await self.stream.dead_letter(entry_id, data, str(e))
+        retry = False
+        try:
+            answers = await self.quiz_service.save_submissions(
+                [submission for _, submission in submissions]
+            )
+            saved = [entry_id for entry_id, _ in submissions]
+        except Exception:
+            logger.exception("Batch write failed, retrying submissions one by one")
+            answers, saved = [], []
+            for entry_id, submission in submissions:
+                try:
+                    answers.extend(
+                        await self.quiz_service.save_submissions([submission])
+                    )
+                    saved.append(entry_id)
+                except (BadRequestException, ValueError) as e:
+                    await self.handle_failure(entry_id, submission, e)
+                except Exception as e:
+                    logger.warning(f"Submission {entry_id} left pending: {e}")
+                    retry = True
+                    break
+        await self.cache_answers(answers)
+        await self.stream.ack(*saved)
+        if retry:
+            await asyncio.sleep(RETRY_DELAY)
+
+    async def handle_failure(
+        self, entry_id: str, submission: QuizSubmissionSchema, error: Exception
+    ):
+        attempts = await self.stream.record_failure(entry_id)
+        if attempts >= self.max_attempts:
+            logger.error(
+                f"Dead-lettering submission {entry_id} after {attempts} attempts"
+            )
+            await self.stream.dead_letter(
+                entry_id, submission.model_dump(), repr(error)
+            )
+        else:
+            logger.warning(
+                f"Submission {entry_id} failed ({attempts} attempts): {error}"
+            )
+
+    async def cache_answers(self, answers: list[dict]):
+        if not answers:
+            return
+        try:
+            await self.cache.save_answers(answers)
+        except RedisRepositoryError as e:
+            logger.warning(f"Failed to cache submitted answers: {e}")
+
+    async def run(self):
+        await self.stream.ensure_group()
+        logger.info(f"Submission worker {self.consumer} started")
+        last_stats = 0.0
+        while True:
+            try:
+                await self.run_once()
+                if time.monotonic() - last_stats >= STATS_INTERVAL:
+                    last_stats = time.monotonic()
+                    logger.info(f"Submission stream: {await self.stream.stats()}")
+            except RedisRepositoryError:
+                logger.exception("Submission stream unavailable")
+                await asyncio.sleep(1)
+
+
+async def main():
+    redis = get_redis_client()
+    worker = SubmissionWorker(
+        stream=SubmissionStreamRepository(redis),
+        cache=QuizRedisRepository(redis),
+        quiz_service=get_quiz_service(),
+        consumer=f"{socket.gethostname()}-{os.getpid()}",
+        batch_size=settings.submission.SUBMISSION_BATCH_SIZE,
+        block_ms=settings.submission.SUBMISSION_BLOCK_MS,
+        claim_idle_ms=settings.submission.SUBMISSION_CLAIM_IDLE_MS,
+        max_attempts=settings.submission.SUBMISSION_MAX_ATTEMPTS,
+    )
+    try:
+        await worker.run()
+    finally:
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())